@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+FT.AGGREGATE builder with columnar results.
+Pushes grouping and reduction to the server and decodes the reply column by
+column into NumPy arrays instead of one dict per row.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from scripts.redis_query import QueryExpr
+from scripts.redis_replies import aggregate_rows
+
+
+def _field(name: str) -> str:
+    return name if name.startswith("@") else f"@{name}"
+
+
+@dataclass(frozen=True)
+class Reducer:
+    """A GROUPBY reducer, e.g. ``Reducer.sum("views", alias="total_views")``."""
+
+    name: str
+    args: tuple[Any, ...]
+    alias: str
+
+    def redis_args(self) -> list[Any]:
+        return ["REDUCE", self.name, len(self.args), *self.args, "AS", self.alias]
+
+    @classmethod
+    def _on_field(cls, name: str, field_name: str, alias: str | None) -> "Reducer":
+        bare = field_name.lstrip("@")
+        return cls(name, (_field(field_name),), alias or f"{name.lower()}_{bare}")
+
+    @classmethod
+    def count(cls, alias: str = "count") -> "Reducer":
+        return cls("COUNT", (), alias)
+
+    @classmethod
+    def count_distinct(cls, field_name: str, alias: str | None = None) -> "Reducer":
+        return cls._on_field("COUNT_DISTINCT", field_name, alias)
+
+    @classmethod
+    def sum(cls, field_name: str, alias: str | None = None) -> "Reducer":
+        return cls._on_field("SUM", field_name, alias)
+
+    @classmethod
+    def avg(cls, field_name: str, alias: str | None = None) -> "Reducer":
+        return cls._on_field("AVG", field_name, alias)
+
+    @classmethod
+    def min(cls, field_name: str, alias: str | None = None) -> "Reducer":
+        return cls._on_field("MIN", field_name, alias)
+
+    @classmethod
+    def max(cls, field_name: str, alias: str | None = None) -> "Reducer":
+        return cls._on_field("MAX", field_name, alias)
+
+    @classmethod
+    def tolist(cls, field_name: str, alias: str | None = None) -> "Reducer":
+        return cls._on_field("TOLIST", field_name, alias)
+
+    @classmethod
+    def quantile(cls, field_name: str, quantile: float, alias: str | None = None) -> "Reducer":
+        if not 0 <= quantile <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {quantile}")
+        bare = field_name.lstrip("@")
+        default_alias = f"quantile_{bare}_{round(quantile * 100)}"
+        return cls("QUANTILE", (_field(field_name), quantile), alias or default_alias)
+
+
+class Aggregation:
+    """
+    Fluent FT.AGGREGATE pipeline; steps run in the order they are added.
+    ``query`` is a raw query string or a ``QueryExpr`` sent with PARAMS.
+    """
+
+    def __init__(self, query: str | QueryExpr = "*"):
+        self.query = query
+        self.steps: list[Any] = []
+
+    def load(self, *fields: str) -> "Aggregation":
+        """Load document fields that are not SORTABLE into the pipeline."""
+        self.steps += ["LOAD", len(fields), *map(_field, fields)]
+        return self
+
+    def group_by(self, fields: str | Sequence[str], *reducers: Reducer) -> "Aggregation":
+        """Group rows by ``fields`` (none for one global group) and reduce each group."""
+        fields = [fields] if isinstance(fields, str) else list(fields)
+        self.steps += ["GROUPBY", len(fields), *map(_field, fields)]
+        for reducer in reducers:
+            self.steps += reducer.redis_args()
+        return self
+
+    def apply(self, expression: str, as_name: str) -> "Aggregation":
+        """Add a computed column, e.g. ``apply("@views / @count", "avg_views")``."""
+        self.steps += ["APPLY", expression, "AS", as_name]
+        return self
+
+    def filter(self, expression: str) -> "Aggregation":
+        """Keep rows matching an expression, e.g. ``filter("@count > 10")``."""
+        self.steps += ["FILTER", expression]
+        return self
+
+    def sort_by(
+        self, *fields: str | tuple[str, bool], max_results: int | None = None
+    ) -> "Aggregation":
+        """
+        Sort by fields, each a name (ascending) or a ``(name, ascending)`` pair.
+        ``max_results`` keeps only the top rows, sorting with a bounded heap.
+        """
+        args: list[Any] = []
+        for sort_field in fields:
+            name, ascending = (sort_field, True) if isinstance(sort_field, str) else sort_field
+            args += [_field(name), "ASC" if ascending else "DESC"]
+        self.steps += ["SORTBY", len(args), *args]
+        if max_results is not None:
+            self.steps += ["MAX", max_results]
+        return self
+
+    def limit(self, offset: int, num: int) -> "Aggregation":
+        """Return ``num`` rows starting at ``offset``."""
+        self.steps += ["LIMIT", offset, num]
+        return self
+
+    def build_args(self) -> list[Any]:
+        """Arguments following ``FT.AGGREGATE <index>``."""
+        if isinstance(self.query, QueryExpr):
+            shape, params = self.query.compile()
+        else:
+            shape, params = self.query, {}
+        args = [shape, *self.steps]
+        if params:
+            args += ["PARAMS", len(params) * 2, *(item for pair in params.items() for item in pair)]
+        return [*args, "DIALECT", 2]
+
+
+def _column_array(values: list[Any], dtype: Any = None) -> np.ndarray:
+    """
+    Convert one column: numeric columns become float64 (missing values nan),
+    TOLIST columns object arrays, and anything else unicode strings.
+    """
+    if dtype is not None:
+        return np.asarray(values, dtype=dtype)
+    if any(isinstance(value, list) for value in values):
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+    try:
+        return np.array(["nan" if value is None else value for value in values], dtype=np.float64)
+    except ValueError:
+        return np.array(["" if value is None else value for value in values], dtype=str)
+
+
+@dataclass
+class AggregateTable:
+    """FT.AGGREGATE rows decoded into one NumPy array per column."""
+
+    total: int
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def to_structured(self) -> np.ndarray:
+        """Return the rows as a NumPy structured array."""
+        dtype = [(name, column.dtype) for name, column in self.columns.items()]
+        table = np.empty(len(self), dtype=dtype)
+        for name, column in self.columns.items():
+            table[name] = column
+        return table
+
+    @classmethod
+    def from_reply(
+        cls, reply: list[Any] | dict[Any, Any], dtypes: Mapping[str, Any] | None = None
+    ) -> "AggregateTable":
+        """
+        Decode a RESP2 ``[total, [key, value, ...], ...]`` reply, or the RESP3
+        ``results`` map, column-wise.
+        """
+        dtypes = dtypes or {}
+        reply = aggregate_rows(reply)
+        rows = reply[1:]
+        names = list(rows[0][::2]) if rows else []
+        if all(row[::2] == names for row in rows):
+            values = list(zip(*(row[1::2] for row in rows), strict=True)) if rows else []
+            raw_columns = {name: list(column) for name, column in zip(names, values, strict=True)}
+        else:
+            # Rows lacking a value (e.g. a field missing from some documents) differ in shape
+            dicts = [dict(zip(row[::2], row[1::2], strict=True)) for row in rows]
+            names = list(dict.fromkeys(name for row in dicts for name in row))
+            raw_columns = {name: [row.get(name) for row in dicts] for name in names}
+        return cls(
+            total=int(reply[0]),
+            columns={
+                name: _column_array(column, dtypes.get(name))
+                for name, column in raw_columns.items()
+            },
+        )
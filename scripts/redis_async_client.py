@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Asyncio Redis client wrapper for Redis Stack operations.
+Mirrors RedisStackClient on top of redis.asyncio so asyncio services can
+await Redis, RediSearch, and RedisJSON calls without a thread executor.
+"""
+
+import asyncio
+import time
+import weakref
+from collections.abc import Iterable, Mapping, Sequence
+from contextlib import suppress
+from typing import Any, cast
+
+import redis
+import redis.asyncio
+from redis.commands.search.index_definition import IndexType
+
+from scripts.redis_aggregate import AggregateTable, Aggregation
+from scripts.redis_client import (
+    FederatedResult,
+    RedisConfig,
+    _create_index_args,
+    _index_definition_from_info,
+    _index_ready,
+    _parse_json_documents,
+    merge_search_results,
+    prepare_search_query,
+)
+from scripts.redis_query import QueryExpr
+from scripts.redis_schema import IndexOptions, SchemaBuilder
+from scripts.redis_stats import IndexStats
+
+# asyncio connections are bound to the event loop that opened them, so pools
+# are shared per configuration *and* per loop.
+_async_pools: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple, redis.asyncio.BlockingConnectionPool]
+] = weakref.WeakKeyDictionary()
+
+
+def get_async_connection_pool(config: RedisConfig) -> redis.asyncio.BlockingConnectionPool:
+    """Get the connection pool shared by async clients on the running event loop."""
+    loop_pools = _async_pools.setdefault(asyncio.get_running_loop(), {})
+    key = config.pool_key()
+    pool = loop_pools.get(key)
+    if pool is None:
+        pool = redis.asyncio.BlockingConnectionPool(
+            max_connections=config.max_connections,
+            timeout=config.pool_timeout,
+            host=config.host,
+            port=config.port,
+            password=config.password,
+            socket_timeout=config.socket_timeout,
+            socket_connect_timeout=config.socket_connect_timeout,
+            socket_keepalive=config.socket_keepalive,
+            decode_responses=True,
+            protocol=2,
+        )
+        loop_pools[key] = pool
+    return pool
+
+
+async def close_async_connection_pools() -> None:
+    """Disconnect and forget the shared pools of the running event loop."""
+    loop_pools = _async_pools.pop(asyncio.get_running_loop(), {})
+    for pool in loop_pools.values():
+        await pool.disconnect()
+
+
+class AsyncRedisStackClient:
+    """
+    Asyncio client for Redis Stack operations.
+    Methods it mirrors from RedisStackClient keep their semantics, as coroutines.
+    """
+
+    def __init__(self, config: RedisConfig):
+        self.config = config
+        self._client: redis.asyncio.Redis | None = None
+        self._index_key_types: dict[str, IndexType] = {}
+
+    @property
+    def client(self) -> redis.asyncio.Redis:
+        """Get or create async Redis client backed by the shared connection pool."""
+        if self._client is None:
+            self._client = redis.asyncio.Redis(
+                connection_pool=get_async_connection_pool(self.config)
+            )
+        return self._client
+
+    async def ping(self) -> bool:
+        """Test connection to Redis."""
+        try:
+            return await self.client.ping()
+        except redis.ConnectionError:
+            return False
+
+    async def get_info(self) -> dict[str, Any]:
+        """Get Redis server information."""
+        return await self.client.info()
+
+    async def get_version(self) -> str:
+        """Get Redis version."""
+        info = await self.get_info()
+        return str(info.get("redis_version", "unknown"))
+
+    async def get_modules(self) -> list[dict[str, Any]]:
+        """Get list of loaded Redis modules."""
+        return await self.client.module_list()
+
+    async def has_module(self, module_name: str) -> bool:
+        """Check if a specific module is loaded."""
+        modules = await self.get_modules()
+        return any(mod.get("name") == module_name for mod in modules)
+
+    async def set(self, key: str, value: str) -> bool:
+        """Set a key-value pair in Redis."""
+        return bool(await self.client.set(key, value))
+
+    async def get(self, key: str) -> str | None:
+        """Get a value from Redis."""
+        # decode_responses is on, so values come back as str
+        return cast(str | None, await self.client.get(key))
+
+    async def delete(self, *keys: str) -> int:
+        """Delete one or more keys from Redis."""
+        return await self.client.delete(*keys)
+
+    async def create_search_index(
+        self,
+        index_name: str,
+        prefix: str | Sequence[str],
+        schema: tuple | SchemaBuilder,
+        wait: bool = False,
+        wait_timeout: float = 30.0,
+        index_type: IndexType = IndexType.HASH,
+        options: IndexOptions | None = None,
+        filter: str | None = None,
+        language: str | None = None,
+        language_field: str | None = None,
+        score: float | None = None,
+        score_field: str | None = None,
+        skip_initial_scan: bool = False,
+    ) -> None:
+        """
+        Create a RediSearch index over hashes or, with IndexType.JSON, JSON documents.
+        See ``RedisStackClient.create_search_index`` for the definition options.
+        With ``wait``, await until existing keys under the prefixes are indexed.
+        """
+        fields, definition, kwargs = _create_index_args(
+            prefix,
+            schema,
+            index_type,
+            options,
+            filter,
+            language,
+            language_field,
+            score,
+            score_field,
+            skip_initial_scan,
+        )
+        await self.client.ft(index_name).create_index(fields, definition=definition, **kwargs)
+        self._index_key_types[index_name] = index_type
+        if wait:
+            await self.wait_for_index(index_name, timeout=wait_timeout)
+
+    async def wait_for_index(
+        self,
+        index_name: str,
+        timeout: float = 30.0,
+        initial_delay: float = 0.005,
+        max_delay: float = 0.5,
+    ) -> dict[str, Any]:
+        """
+        Poll FT.INFO until background indexing has finished and return the final info.
+        The polling delay starts at ``initial_delay`` and doubles up to ``max_delay``.
+        Raises TimeoutError if the index is still indexing after ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while True:
+            info: dict[str, Any] = await self.client.ft(index_name).info()
+            remaining = deadline - time.monotonic()
+            if _index_ready(index_name, info, timeout, remaining):
+                return info
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    async def index_stats(self, index_name: str) -> IndexStats:
+        """Get size, GC and cursor statistics of an index from FT.INFO."""
+        return IndexStats.from_info(await self.client.ft(index_name).info())
+
+    async def drop_search_index(self, index_name: str, delete_documents: bool = False) -> None:
+        """Drop a RediSearch index, and with ``delete_documents`` its documents too."""
+        with suppress(redis.exceptions.ResponseError):
+            # Index doesn't exist, ignore
+            await self.client.ft(index_name).dropindex(delete_documents=delete_documents)
+        self._index_key_types.pop(index_name, None)
+
+    async def add_document(self, key: str, mapping: dict[str, Any]) -> bool:
+        """Add a document to Redis (for searching)."""
+        return bool(await self.client.hset(key, mapping=cast(dict[Any, Any], mapping)))
+
+    async def search(
+        self,
+        index_name: str,
+        query_string: str | QueryExpr,
+        return_fields: Iterable[str] | None = None,
+        no_content: bool = False,
+        offset: int = 0,
+        num: int = 10,
+        sort_by: str | None = None,
+        ascending: bool = True,
+        count_only: bool = False,
+    ) -> Any:
+        """
+        Perform a search query.
+        ``query_string`` is a raw query or a ``QueryExpr`` sent with PARAMS.
+        See ``build_search_query`` for the projection, paging and sorting options.
+        """
+        query, params = prepare_search_query(
+            query_string,
+            return_fields=return_fields,
+            no_content=no_content,
+            offset=offset,
+            num=num,
+            sort_by=sort_by,
+            ascending=ascending,
+            count_only=count_only,
+        )
+        return await self._parse_documents(
+            index_name, await self.client.ft(index_name).search(query, query_params=params)
+        )
+
+    async def _parse_documents(self, index_name: str, result: Any) -> Any:
+        """
+        Decode ``doc.json`` when the hits come from a JSON index. The key type
+        is read from FT.INFO once a hit carries a ``json`` field.
+        """
+        if not any(hasattr(doc, "json") for doc in result.docs):
+            return result
+        if index_name not in self._index_key_types:
+            try:
+                info = await self.client.ft(index_name).info()
+            except redis.exceptions.ResponseError:
+                return result
+            self._index_key_types[index_name] = _index_definition_from_info(info)["index_type"]
+        if self._index_key_types[index_name] == IndexType.JSON:
+            return _parse_json_documents(result)
+        return result
+
+    async def federated_search(
+        self,
+        index_names: Sequence[str],
+        query_string: str | QueryExpr,
+        return_fields: Iterable[str] | None = None,
+        offset: int = 0,
+        num: int = 10,
+        sort_by: str | None = None,
+        ascending: bool = True,
+    ) -> FederatedResult:
+        """
+        Run one query against several indexes concurrently and merge the hits.
+        See ``RedisStackClient.federated_search``.
+        """
+        if return_fields is not None and sort_by is not None:
+            return_fields = list(dict.fromkeys([*return_fields, sort_by]))
+        results = await asyncio.gather(
+            *(
+                self.search(
+                    index_name,
+                    query_string,
+                    return_fields=return_fields,
+                    num=offset + num,
+                    sort_by=sort_by,
+                    ascending=ascending,
+                )
+                for index_name in index_names
+            )
+        )
+        return merge_search_results(
+            dict(zip(index_names, results, strict=True)), offset, num, sort_by, ascending
+        )
+
+    async def aggregate(
+        self,
+        index_name: str,
+        aggregation: Aggregation,
+        dtypes: Mapping[str, Any] | None = None,
+    ) -> AggregateTable:
+        """Run an FT.AGGREGATE pipeline and decode the rows into NumPy columns."""
+        reply = await self.client.execute_command(
+            "FT.AGGREGATE", index_name, *aggregation.build_args()
+        )
+        return AggregateTable.from_reply(reply, dtypes)
+
+    async def json_set(self, key: str, path: str, value: Any) -> bool:
+        """Set a JSON value at a specific path."""
+        return bool(await self.client.json().set(key, path, value))
+
+    async def json_get(self, key: str, path: str | None = None) -> Any:
+        """Get a JSON value from a specific path."""
+        if path:
+            return await self.client.json().get(key, path)
+        return await self.client.json().get(key)
+
+    async def close(self) -> None:
+        """Close the Redis client; pooled connections stay open for reuse."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncRedisStackClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
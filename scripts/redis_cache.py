@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+In-process cache for RediSearch results.
+Entries are keyed by index version, so invalidating an index is a counter
+bump; stale entries are never served and age out of the LRU on their own.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class SearchResultCache:
+    """
+    Thread-safe LRU cache of search results with a per-entry TTL.
+    Cached results are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, index_name: str, query_key: Hashable) -> Hashable:
+        """Build the cache key for a query against the current version of an index."""
+        with self._lock:
+            return (index_name, self._generation, self._versions.get(index_name, 0), query_key)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached result for ``key``, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, index_name: str | None = None) -> None:
+        """Invalidate the cached results of one index, or of every index."""
+        with self._lock:
+            if index_name is None:
+                self._generation += 1
+            else:
+                self._versions[index_name] = self._versions.get(index_name, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for sizing the cache."""
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": size,
+            "maxsize": self.maxsize,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
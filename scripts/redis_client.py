@@ -4,15 +4,65 @@ Redis client wrapper for Redis Stack operations.
 Provides high-level interfaces for Redis, RediSearch, and RedisJSON operations.
 """
 
+import heapq
+import json
 import os
+import re
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar, cast
 
+import numpy as np
 import redis
 from dotenv import load_dotenv
-from redis.commands.search.field import NumericField, TagField, TextField
+from redis.commands.search.field import Field, NumericField, TagField, TextField, VectorField
 from redis.commands.search.index_definition import IndexDefinition, IndexType
+from redis.commands.search.profile_information import ProfileInformation
 from redis.commands.search.query import Query
+from redis.commands.search.result import Result
+
+from scripts.redis_aggregate import AggregateTable, Aggregation
+from scripts.redis_cache import SearchResultCache
+from scripts.redis_profile import SearchProfile
+from scripts.redis_query import MatchAll, NumericRange, QueryExpr, Text
+from scripts.redis_replies import aggregate_rows, parse_pairs
+from scripts.redis_results import LazySearchResult
+from scripts.redis_schema import (
+    IndexMemoryEstimate,
+    IndexOptions,
+    SchemaBuilder,
+    SchemaProposal,
+    infer_schema,
+    resolve_schema,
+)
+from scripts.redis_stats import IndexStats
+
+T = TypeVar("T")
+
+# Compiled queries kept per distinct query shape and search options
+QUERY_CACHE_SIZE = 512
+
+# Vector element types supported by RediSearch vector fields
+VECTOR_DTYPES = {"FLOAT32": np.float32, "FLOAT16": np.float16}
+VECTOR_DISTANCE_METRICS = ("COSINE", "L2", "IP")
+
+
+def _float_setting(
+    value: float | None, env_name: str, default: float | None = None
+) -> float | None:
+    """Resolve a float setting from a parameter, then environment variable, then default."""
+    if value is not None:
+        return float(value)
+    env_value = os.getenv(env_name)
+    return float(env_value) if env_value else default
 
 
 class RedisConfig:
@@ -23,10 +73,24 @@ class RedisConfig:
         host: str | None = None,
         port: int | None = None,
         password: str | None = None,
+        max_connections: int | None = None,
+        pool_timeout: float | None = None,
+        socket_timeout: float | None = None,
+        socket_connect_timeout: float | None = None,
+        socket_keepalive: bool | None = None,
     ):
         self.host = host or os.getenv("REDIS_HOST", "localhost")
         self.port = int(port or os.getenv("REDIS_PORT", "6379"))
         self.password = password or os.getenv("REDIS_PASSWORD")
+        self.max_connections = max_connections or int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+        self.pool_timeout = _float_setting(pool_timeout, "REDIS_POOL_TIMEOUT", 20.0)
+        self.socket_timeout = _float_setting(socket_timeout, "REDIS_SOCKET_TIMEOUT")
+        self.socket_connect_timeout = _float_setting(
+            socket_connect_timeout, "REDIS_SOCKET_CONNECT_TIMEOUT"
+        )
+        if socket_keepalive is None:
+            socket_keepalive = os.getenv("REDIS_SOCKET_KEEPALIVE", "true").lower() == "true"
+        self.socket_keepalive = socket_keepalive
 
     @classmethod
     def from_env(cls, env_path: Path | None = None) -> "RedisConfig":
@@ -49,29 +113,448 @@ class RedisConfig:
             return "None"
         return self.password[0] + "*" * (len(self.password) - 1)
 
+    def pool_key(self) -> tuple:
+        """Key identifying the shared connection pool for this configuration."""
+        return (
+            self.host,
+            self.port,
+            self.password,
+            self.max_connections,
+            self.pool_timeout,
+            self.socket_timeout,
+            self.socket_connect_timeout,
+            self.socket_keepalive,
+        )
+
+
+_pools: dict[tuple, redis.BlockingConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(
+    config: RedisConfig, decode_responses: bool = True
+) -> redis.BlockingConnectionPool:
+    """
+    Get the process-wide connection pool for a configuration.
+    Clients built from equal configurations share one bounded pool; callers
+    block up to ``pool_timeout`` seconds when all connections are checked out.
+    Replies stay bytes on the separate ``decode_responses=False`` pool.
+    Connections speak RESP2, the reply shape the parsers in this module expect.
+    """
+    key = (*config.pool_key(), decode_responses)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = redis.BlockingConnectionPool(
+                max_connections=config.max_connections,
+                timeout=config.pool_timeout,
+                host=config.host,
+                port=config.port,
+                password=config.password,
+                socket_timeout=config.socket_timeout,
+                socket_connect_timeout=config.socket_connect_timeout,
+                socket_keepalive=config.socket_keepalive,
+                decode_responses=decode_responses,
+                protocol=2,
+            )
+            _pools[key] = pool
+        return pool
+
+
+def close_connection_pools() -> None:
+    """Disconnect and forget all shared connection pools."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.disconnect()
+        _pools.clear()
+
+
+def _chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield lists of up to ``size`` items without materializing the whole iterable."""
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def build_search_query(
+    query_string: str,
+    return_fields: Iterable[str] | None = None,
+    no_content: bool = False,
+    offset: int = 0,
+    num: int = 10,
+    sort_by: str | None = None,
+    ascending: bool = True,
+    count_only: bool = False,
+    dialect: int | None = None,
+) -> Query:
+    """
+    Build a scored RediSearch query with optional projection, paging and sorting.
+    ``return_fields`` limits the fields sent back (RETURN), ``no_content`` returns
+    ids and scores only (NOCONTENT), as does an empty ``return_fields``, and
+    ``count_only`` returns just the total (LIMIT 0 0).
+    """
+    query = Query(query_string)
+    if dialect:
+        query.dialect(dialect)
+    if count_only:
+        return query.no_content().paging(0, 0)
+    query.with_scores().paging(offset, num)
+    fields = None if return_fields is None else list(return_fields)
+    if no_content or fields == []:
+        # redis-py drops an empty RETURN, which would return every field
+        query.no_content()
+    elif fields is not None:
+        query.return_fields(*fields)
+    if sort_by:
+        query.sort_by(sort_by, asc=ascending)
+    return query
+
+
+def vector_to_bytes(vector: Any, dtype: str = "FLOAT32") -> bytes:
+    """
+    Pack a vector (NumPy array, sequence of floats, or raw bytes) into the
+    little-endian binary blob RediSearch expects, in one vectorized conversion.
+    """
+    if isinstance(vector, bytes | bytearray | memoryview):
+        return bytes(vector)
+    array = np.asarray(vector, dtype=np.dtype(VECTOR_DTYPES[dtype]).newbyteorder("<"))
+    if array.ndim != 1:
+        raise ValueError(f"Expected a 1-D vector, got shape {array.shape}")
+    return array.tobytes()
+
+
+def _parse_json_documents(result: Any) -> Any:
+    """
+    Parse whole documents returned by a JSON index.
+    redis-py exposes the ``$`` field as the raw JSON string ``doc.json``; it is
+    replaced by the decoded object. Only call this for JSON indexes, where the
+    field is always JSON text.
+    """
+    for doc in result.docs:
+        raw = getattr(doc, "json", None)
+        if isinstance(raw, str):
+            doc.json = json.loads(raw)
+    return result
+
+
+def _decode_hash(mapping: dict[bytes, bytes]) -> dict[str, str | bytes]:
+    """
+    Decode a hash read as bytes. Values that are not UTF-8 text, or hold control
+    characters other than whitespace (like most vector blobs), stay bytes.
+    """
+    document: dict[str, str | bytes] = {}
+    for name, value in mapping.items():
+        key = name.decode(errors="replace")
+        try:
+            text = value.decode()
+        except UnicodeDecodeError:
+            document[key] = value
+            continue
+        printable = all(c.isprintable() or c in "\t\n\r" for c in text)
+        document[key] = text if printable else value
+    return document
+
+
+def _keyset_filter(sort_by: str, ascending: bool, after: tuple[float, str]) -> str:
+    """FILTER expression selecting rows after ``(value, id)`` in ``sort_by, id`` order."""
+    value, doc_id = after
+    quoted = '"' + doc_id.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    beyond = ">" if ascending else "<"
+    return (
+        f"@{sort_by} {beyond} {float(value)!r} || "
+        f"(@{sort_by} == {float(value)!r} && @__key > {quoted})"
+    )
+
+
+def _index_prefixes_from_info(info: dict[str, Any]) -> tuple[str, ...]:
+    """Extract the key prefixes from an FT.INFO reply."""
+    return tuple(parse_pairs(info["index_definition"])["prefixes"])
+
+
+def _index_definition_from_info(info: dict[str, Any]) -> dict[str, Any]:
+    """Extract the ``create_search_index`` definition arguments from an FT.INFO reply."""
+    definition = parse_pairs(info["index_definition"])
+    return {
+        "prefix": list(definition["prefixes"]),
+        "index_type": IndexType.JSON if definition.get("key_type") == "JSON" else IndexType.HASH,
+        "filter": definition.get("filter"),
+        "language": definition.get("default_language"),
+        "language_field": definition.get("language_field"),
+        "score": float(definition["default_score"]) if "default_score" in definition else None,
+        "score_field": definition.get("score_field"),
+    }
+
+
+def _prefix_list(prefix: str | Sequence[str]) -> list[str]:
+    """One key prefix or several, as the list FT.CREATE takes."""
+    return [prefix] if isinstance(prefix, str) else list(prefix)
+
+
+def _create_index_args(
+    prefix: str | Sequence[str],
+    schema: tuple | SchemaBuilder,
+    index_type: IndexType,
+    options: IndexOptions | None,
+    filter: str | None,
+    language: str | None,
+    language_field: str | None,
+    score: float | None,
+    score_field: str | None,
+    skip_initial_scan: bool,
+) -> tuple[list[Field], IndexDefinition, dict[str, Any]]:
+    """The fields, definition and keyword arguments of an FT.CREATE call."""
+    fields, options = resolve_schema(schema, options)
+    if skip_initial_scan:
+        options = replace(options, skip_initial_scan=True)
+    definition = IndexDefinition(
+        prefix=_prefix_list(prefix),
+        index_type=index_type,
+        filter=filter,
+        language=language,
+        language_field=language_field,
+        score=score,
+        score_field=score_field,
+    )
+    return fields, definition, options.create_index_kwargs()
+
+
+def _index_ready(index_name: str, info: dict[str, Any], timeout: float, remaining: float) -> bool:
+    """
+    Whether an FT.INFO reply shows background indexing as finished.
+    Raises TimeoutError when it has not and no time is ``remaining`` of ``timeout``.
+    """
+    indexing = int(float(info.get("indexing", 0)))
+    percent = float(info.get("percent_indexed", 1))
+    if not indexing and percent >= 1:
+        return True
+    if remaining <= 0:
+        raise TimeoutError(
+            f"Index {index_name} still indexing after {timeout}s "
+            f"({percent:.0%} indexed, "
+            f"{info.get('hash_indexing_failures', 0)} indexing failures)"
+        )
+    return False
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _compiled_search_query(
+    shape: str,
+    return_fields: tuple[str, ...] | None,
+    no_content: bool,
+    offset: int,
+    num: int,
+    sort_by: str | None,
+    ascending: bool,
+    count_only: bool,
+) -> Query:
+    """Build (once per shape and options) the DIALECT 2 query for a parameterized shape."""
+    return build_search_query(
+        shape,
+        return_fields=return_fields,
+        no_content=no_content,
+        offset=offset,
+        num=num,
+        sort_by=sort_by,
+        ascending=ascending,
+        count_only=count_only,
+        dialect=2,
+    )
+
+
+def prepare_search_query(
+    query: str | QueryExpr,
+    return_fields: Iterable[str] | None = None,
+    no_content: bool = False,
+    offset: int = 0,
+    num: int = 10,
+    sort_by: str | None = None,
+    ascending: bool = True,
+    count_only: bool = False,
+) -> tuple[Query, dict[str, Any] | None]:
+    """
+    Resolve a raw query string or a query expression into a Query and its PARAMS.
+    Expressions reuse a cached compiled Query for their shape; the returned Query
+    is shared and must not be modified.
+    """
+    if isinstance(query, QueryExpr):
+        shape, params = query.compile()
+        compiled = _compiled_search_query(
+            shape,
+            tuple(return_fields) if return_fields is not None else None,
+            no_content,
+            offset,
+            num,
+            sort_by,
+            ascending,
+            count_only,
+        )
+        return compiled, params
+    built = build_search_query(
+        query,
+        return_fields=return_fields,
+        no_content=no_content,
+        offset=offset,
+        num=num,
+        sort_by=sort_by,
+        ascending=ascending,
+        count_only=count_only,
+    )
+    return built, None
+
+
+def query_cache_info() -> Any:
+    """Hit/miss statistics of the compiled query cache."""
+    return _compiled_search_query.cache_info()
+
+
+@dataclass
+class FederatedResult:
+    """One page of hits merged from several indexes."""
+
+    total: int
+    docs: list[Any]
+    # Index each hit in ``docs`` came from
+    sources: list[str]
+    totals: dict[str, int] = field(default_factory=dict)
+
+
+def _normalized(value: Any) -> str:
+    return str(value).casefold()
+
+
+def _sort_key(sort_by: str | None, ascending: bool, docs: list[Any]) -> Callable[[Any], Any]:
+    """
+    Merge key for hits ordered by score, or by ``sort_by`` (compared as numbers
+    when every present value is numeric); hits without the field sort last.
+    Strings are case-folded, as the server normalizes SORTABLE TEXT and TAG
+    values (fields declared UNF are not supported).
+    """
+    if sort_by is None:
+        return lambda doc: float(doc.score)
+
+    def as_float(value: Any) -> float | None:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    values = [getattr(doc, sort_by, None) for doc in docs]
+    numeric = all(as_float(value) is not None for value in values if value is not None)
+    convert, missing_value = (as_float, 0.0) if numeric else (_normalized, "")
+
+    def key(doc: Any) -> tuple[bool, Any]:
+        value = getattr(doc, sort_by, None)
+        missing = value is None
+        # Descending merges run reversed, so flip the flag to keep missing last
+        return (missing if ascending else not missing, missing_value if missing else convert(value))
+
+    return key
+
+
+def merge_search_results(
+    results: Mapping[str, Any],
+    offset: int = 0,
+    num: int = 10,
+    sort_by: str | None = None,
+    ascending: bool = True,
+) -> FederatedResult:
+    """
+    Merge per-index results, each already in score or ``sort_by`` order, with a
+    k-way heap merge and cut the global ``offset``/``num`` page from it.
+    """
+    ordered = list(results.items())
+    key = _sort_key(sort_by, ascending, [doc for _, result in ordered for doc in result.docs])
+    streams = [[(doc, index_name) for doc in result.docs] for index_name, result in ordered]
+    merged = heapq.merge(
+        *streams,
+        key=lambda hit: key(hit[0]),
+        reverse=sort_by is None or not ascending,
+    )
+    page = list(islice(merged, offset, offset + num))
+    totals = {index_name: result.total for index_name, result in ordered}
+    return FederatedResult(
+        total=sum(totals.values()),
+        docs=[doc for doc, _ in page],
+        sources=[index_name for _, index_name in page],
+        totals=totals,
+    )
+
+
+@dataclass
+class ChunkReport:
+    """Outcome of one pipelined chunk in a bulk operation."""
+
+    index: int
+    size: int
+    seconds: float
+    failures: list[tuple[str, Exception]] = field(default_factory=list)
+
+    @property
+    def items_per_second(self) -> float:
+        """Throughput of this chunk."""
+        return self.size / self.seconds if self.seconds > 0 else float("inf")
+
+
+@dataclass
+class BulkReport:
+    """Aggregate outcome of a chunked bulk operation."""
+
+    total: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    failures: list[tuple[str, Exception]] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        """Number of items written without error."""
+        return self.total - len(self.failures)
+
+    @property
+    def items_per_second(self) -> float:
+        """Overall throughput of the operation."""
+        return self.total / self.seconds if self.seconds > 0 else float("inf")
+
 
 class RedisStackClient:
     """
     High-level client for Redis Stack operations.
     Provides methods for basic Redis, RediSearch, and RedisJSON operations.
+
+    With a ``search_cache``, search results are cached and invalidated when
+    documents are written or deleted through this client under an index's
+    prefixes, or when the index is created or dropped.
     """
 
-    def __init__(self, config: RedisConfig):
+    # First RedisJSON release (2.6.0) that implements JSON.MSET
+    JSON_MSET_MIN_VERSION = 20600
+
+    def __init__(self, config: RedisConfig, search_cache: SearchResultCache | None = None):
         self.config = config
+        self.search_cache = search_cache
         self._client: redis.Redis | None = None
+        self._raw_client: redis.Redis | None = None
+        self._json_mset_supported: bool | None = None
+        self._index_prefixes: dict[str, tuple[str, ...]] = {}
+        self._index_key_types: dict[str, IndexType] = {}
 
     @property
     def client(self) -> redis.Redis:
-        """Get or create Redis client."""
+        """Get or create Redis client backed by the shared connection pool."""
         if self._client is None:
-            self._client = redis.Redis(
-                host=self.config.host,
-                port=self.config.port,
-                password=self.config.password,
-                decode_responses=True,
-            )
+            self._client = redis.Redis(connection_pool=get_connection_pool(self.config))
         return self._client
 
+    @property
+    def raw_client(self) -> redis.Redis:
+        """Get or create a Redis client whose replies are left as bytes."""
+        if self._raw_client is None:
+            self._raw_client = redis.Redis(
+                connection_pool=get_connection_pool(self.config, decode_responses=False)
+            )
+        return self._raw_client
+
     def ping(self) -> bool:
         """Test connection to Redis."""
         try:
@@ -83,6 +566,10 @@ class RedisStackClient:
         """Get Redis server information."""
         return self.client.info()
 
+    def get_memory_info(self) -> dict[str, Any]:
+        """Get the INFO memory section."""
+        return self.client.info("memory")
+
     def get_version(self) -> str:
         """Get Redis version."""
         info = self.get_info()
@@ -107,34 +594,892 @@ class RedisStackClient:
 
     def delete(self, *keys: str) -> int:
         """Delete one or more keys from Redis."""
-        return self.client.delete(*keys)
+        deleted = self.client.delete(*keys)
+        self._documents_written(keys)
+        return deleted
+
+    def create_search_index(
+        self,
+        index_name: str,
+        prefix: str | Sequence[str],
+        schema: tuple | SchemaBuilder,
+        wait: bool = False,
+        wait_timeout: float = 30.0,
+        index_type: IndexType = IndexType.HASH,
+        options: IndexOptions | None = None,
+        filter: str | None = None,
+        language: str | None = None,
+        language_field: str | None = None,
+        score: float | None = None,
+        score_field: str | None = None,
+        skip_initial_scan: bool = False,
+    ) -> None:
+        """
+        Create a RediSearch index over hashes, or over RedisJSON documents with
+        ``index_type=IndexType.JSON`` (schema fields then name JSONPaths, usually
+        with an ``as_name`` alias), under one or more key prefixes.
+        ``schema`` is a field tuple or a SchemaBuilder, whose index options apply
+        unless ``options`` is given.
+        ``filter`` is an expression such as ``@status=="published"``; only keys
+        matching it are indexed, which keeps partial indexes small. ``language``
+        and ``score`` set the defaults, ``language_field`` and ``score_field``
+        name per-document overrides. With ``skip_initial_scan`` existing keys are
+        left unindexed and only later writes are picked up.
+        With ``wait``, block until existing keys under the prefixes are indexed.
+        """
+        fields, definition, kwargs = _create_index_args(
+            prefix,
+            schema,
+            index_type,
+            options,
+            filter,
+            language,
+            language_field,
+            score,
+            score_field,
+            skip_initial_scan,
+        )
+        self.client.ft(index_name).create_index(fields, definition=definition, **kwargs)
+        self._index_prefixes[index_name] = tuple(_prefix_list(prefix))
+        self._index_key_types[index_name] = index_type
+        self._index_changed(index_name)
+        if wait:
+            self.wait_for_index(index_name, timeout=wait_timeout)
+
+    def wait_for_index(
+        self,
+        index_name: str,
+        timeout: float = 30.0,
+        initial_delay: float = 0.005,
+        max_delay: float = 0.5,
+    ) -> dict[str, Any]:
+        """
+        Poll FT.INFO until background indexing has finished and return the final info.
+        The polling delay starts at ``initial_delay`` and doubles up to ``max_delay``.
+        Raises TimeoutError if the index is still indexing after ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while True:
+            info: dict[str, Any] = self.client.ft(index_name).info()
+            remaining = deadline - time.monotonic()
+            if _index_ready(index_name, info, timeout, remaining):
+                return info
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    def index_stats(self, index_name: str) -> IndexStats:
+        """Get size, GC and cursor statistics of an index from FT.INFO."""
+        return IndexStats.from_info(self.client.ft(index_name).info())
 
-    def create_search_index(self, index_name: str, prefix: str, schema: tuple) -> None:
-        """Create a RediSearch index."""
+    def estimate_index_memory(
+        self,
+        schema: tuple | SchemaBuilder,
+        documents: Sequence[Any],
+        index_type: IndexType = IndexType.HASH,
+        options: IndexOptions | None = None,
+        wait_timeout: float = 60.0,
+    ) -> IndexMemoryEstimate:
+        """
+        Measure the index memory of ``schema`` over a sample of documents.
+        The documents (hash mappings, or JSON values for a JSON index) are
+        written under a scratch prefix, indexed by a scratch index and read back
+        with FT.INFO; the scratch index and keys are removed afterwards.
+        """
+        scratch = uuid.uuid4().hex
+        index_name = f"scratch-{scratch}"
+        prefix = f"scratch:{scratch}:"
+        keys = [f"{prefix}{i}" for i in range(len(documents))]
+        fields, options = resolve_schema(schema, options)
         self.client.ft(index_name).create_index(
-            schema, definition=IndexDefinition(prefix=[prefix], index_type=IndexType.HASH)
+            fields,
+            definition=IndexDefinition(prefix=[prefix], index_type=index_type),
+            **options.create_index_kwargs(),
         )
+        try:
+            for chunk in _chunked(zip(keys, documents, strict=True), 1000):
+                pipe = self.client.pipeline(transaction=False)
+                for key, document in chunk:
+                    if index_type == IndexType.JSON:
+                        pipe.json().set(key, "$", document)
+                    else:
+                        pipe.hset(key, mapping=document)
+                pipe.execute()
+            info = self.wait_for_index(index_name, timeout=wait_timeout)
+        finally:
+            self.client.ft(index_name).dropindex()
+            for key_chunk in _chunked(keys, 1000):
+                self.client.unlink(*key_chunk)
+        return IndexMemoryEstimate.from_info(info, len(documents))
 
-    def drop_search_index(self, index_name: str) -> None:
-        """Drop a RediSearch index."""
-        from contextlib import suppress
+    def infer_schema(
+        self,
+        prefix: str,
+        sample_size: int = 500,
+        index_type: IndexType = IndexType.HASH,
+        measure: bool = True,
+        **query_patterns: Any,
+    ) -> SchemaProposal:
+        """
+        Sample up to ``sample_size`` documents under ``prefix`` and propose a schema.
+        Keys are found with SCAN (filtered by type) and read in one pipeline; see
+        ``redis_schema.infer_schema`` for the ``query_patterns`` keywords. With
+        ``measure``, the proposal carries an index size measured on the sample by
+        ``estimate_index_memory``; use ``projected_bytes`` to scale it up.
+        Hashes are read as bytes; fields that are not text, such as vectors,
+        are reported in ``binary_fields`` rather than typed.
+        """
+        is_json = index_type == IndexType.JSON
+        keys = list(
+            islice(
+                self.client.scan_iter(
+                    match=f"{prefix}*", count=1000, _type="ReJSON-RL" if is_json else "hash"
+                ),
+                sample_size,
+            )
+        )
+        if is_json:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.json().get(key)
+            documents = [document for document in pipe.execute() if document]
+        else:
+            pipe = self.raw_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            documents = [_decode_hash(mapping) for mapping in pipe.execute() if mapping]
+        proposal = infer_schema(documents, json_documents=is_json, **query_patterns)
+        if measure and proposal.types:
+            proposal.estimate = self.estimate_index_memory(
+                proposal.builder, documents, index_type=index_type
+            )
+        return proposal
+
+    def compare_index_memory(
+        self,
+        variants: Mapping[str, tuple | SchemaBuilder],
+        documents: Sequence[Any],
+        index_type: IndexType = IndexType.HASH,
+    ) -> dict[str, IndexMemoryEstimate]:
+        """Estimate index memory for each named schema variant over the same sample."""
+        return {
+            name: self.estimate_index_memory(schema, documents, index_type=index_type)
+            for name, schema in variants.items()
+        }
 
+    def drop_search_index(self, index_name: str, delete_documents: bool = False) -> None:
+        """
+        Drop a RediSearch index.
+        With ``delete_documents`` (FT.DROPINDEX ... DD) the indexed documents are
+        deleted along with it, without enumerating keys from the client.
+        """
         with suppress(redis.exceptions.ResponseError):
             # Index doesn't exist, ignore
-            self.client.ft(index_name).dropindex()
+            self.client.ft(index_name).dropindex(delete_documents=delete_documents)
+        self._index_prefixes.pop(index_name, None)
+        self._index_key_types.pop(index_name, None)
+        self._index_changed(index_name)
+        if delete_documents and self.search_cache is not None:
+            # Other indexes may cover the deleted documents
+            self.search_cache.invalidate()
+
+    def purge_index(
+        self,
+        index_name: str,
+        query_string: str = "*",
+        batch_size: int = 1000,
+        chunk_size: int = 100,
+        max_keys_per_second: float | None = None,
+    ) -> int:
+        """
+        Delete the documents matching a query, leaving the index in place.
+        Matching keys are read ``batch_size`` at a time from an FT.AGGREGATE cursor
+        that loads only the key, then unlinked with one pipelined UNLINK per
+        ``chunk_size`` keys, so no command holds the server for long. With
+        ``max_keys_per_second`` the purge sleeps between batches to stay under
+        that rate. Returns the number of keys deleted.
+        """
+        deleted = 0
+        started = time.monotonic()
+        rows = self.iter_search(index_name, query_string, fields=[], count=batch_size)
+        for batch in _chunked((row["id"] for row in rows), batch_size):
+            pipe = self.client.pipeline(transaction=False)
+            for chunk in _chunked(batch, chunk_size):
+                pipe.unlink(*chunk)
+            deleted += sum(pipe.execute())
+            self._documents_written(batch)
+            if max_keys_per_second:
+                ahead = started + deleted / max_keys_per_second - time.monotonic()
+                if ahead > 0:
+                    time.sleep(ahead)
+        return deleted
+
+    def reindex(
+        self,
+        alias: str,
+        schema: tuple | SchemaBuilder,
+        prefix: str | Sequence[str] | None = None,
+        wait_timeout: float = 300.0,
+        drop_old: bool = True,
+    ) -> str:
+        """
+        Rebuild the index behind ``alias`` without a window of failed or partial searches.
+        Builds ``<alias>-v<N+1>`` with ``schema`` (on ``prefix``, or the current
+        index's prefixes, keeping its HASH or JSON type, FILTER, language and
+        score settings), waits until it has indexed every document, then
+        repoints the alias with FT.ALIASUPDATE and drops the previous index in a
+        background thread. Returns the new index name. If indexing times out or
+        the alias cannot be repointed, the new index is dropped and the alias
+        keeps serving the old one. ``alias`` must not be the name of an index.
+        """
+        if resolve_schema(schema)[1].skip_initial_scan:
+            raise ValueError("reindex needs the initial scan; remove skip_initial_scan")
+        definition: dict[str, Any] = {}
+        try:
+            info = self.client.ft(alias).info()
+        except redis.exceptions.ResponseError:
+            old_index = None
+        else:
+            old_index = info["index_name"]
+            definition = _index_definition_from_info(info)
+        if old_index == alias:
+            raise ValueError(
+                f"{alias} is an index, not an alias; reindex it behind a new alias name"
+            )
+        if prefix is not None:
+            definition["prefix"] = prefix
+        elif old_index is None:
+            raise ValueError(f"Alias {alias} does not exist yet; a prefix is required")
+
+        match = re.fullmatch(rf"{re.escape(alias)}-v(\d+)", old_index or "")
+        new_index = f"{alias}-v{int(match.group(1)) + 1 if match else 1}"
+        # Leftover from an interrupted reindex; it is not behind the alias
+        self.drop_search_index(new_index)
+        try:
+            self.create_search_index(
+                new_index, schema=schema, wait=True, wait_timeout=wait_timeout, **definition
+            )
+            self.client.ft(new_index).aliasupdate(alias)
+        except (TimeoutError, redis.RedisError):
+            self.drop_search_index(new_index)
+            raise
+
+        self._index_prefixes.pop(alias, None)
+        self._index_key_types.pop(alias, None)
+        self._index_changed(alias)
+        if old_index and drop_old:
+            threading.Thread(target=self.drop_search_index, args=(old_index,), daemon=True).start()
+        return new_index
 
     def add_document(self, key: str, mapping: dict[str, Any]) -> bool:
         """Add a document to Redis (for searching)."""
-        return self.client.hset(key, mapping=mapping)
+        added = self.client.hset(key, mapping=mapping)
+        self._documents_written([key])
+        return added
+
+    def add_documents(
+        self,
+        documents: Iterable[tuple[str, dict[str, Any]]],
+        chunk_size: int = 500,
+        on_chunk: Callable[[ChunkReport], None] | None = None,
+    ) -> BulkReport:
+        """
+        Add many documents using non-transactional pipelines of ``chunk_size`` HSETs.
+        ``documents`` yields ``(key, mapping)`` pairs and may be a generator; it is
+        consumed one chunk at a time. ``on_chunk`` receives each chunk's report.
+        """
 
-    def search(self, index_name: str, query_string: str) -> Any:
-        """Perform a search query."""
-        query = Query(query_string).with_scores()
-        return self.client.ft(index_name).search(query)
+        def queue(pipe: Any, document: tuple[str, dict[str, Any]]) -> str:
+            key, mapping = document
+            pipe.hset(key, mapping=mapping)
+            return key
+
+        return self._write_documents(documents, chunk_size, queue, on_chunk)
+
+    def add_vectors(
+        self,
+        keys: Sequence[str],
+        matrix: np.ndarray | str | os.PathLike,
+        metadata: Iterable[dict[str, Any]] | None = None,
+        field: str = "embedding",
+        dtype: str | None = None,
+        storage: str = "hash",
+        chunk_size: int = 500,
+        on_chunk: Callable[[ChunkReport], None] | None = None,
+    ) -> BulkReport:
+        """
+        Write one vector per key from the rows of a 2-D array, in pipelined chunks.
+        ``matrix`` may be an array or the path of a ``.npy`` file, which is memory
+        mapped. For hash storage each row is sent as a memoryview slice of the
+        array buffer, so rows are never copied into Python objects; the array is
+        only converted once if it is not already C-contiguous little-endian
+        ``dtype``. For ``storage="json"`` each row becomes a JSON array of floats.
+        ``metadata`` yields extra fields per row and is written alongside.
+        """
+        if storage not in ("hash", "json"):
+            raise ValueError(f"Storage must be 'hash' or 'json', got {storage!r}")
+        array = np.load(matrix, mmap_mode="r") if isinstance(matrix, str | os.PathLike) else matrix
+        if dtype is None:
+            dtype = "FLOAT16" if array.dtype == np.float16 else "FLOAT32"
+        target = np.dtype(VECTOR_DTYPES[dtype]).newbyteorder("<")
+        vectors = np.ascontiguousarray(array, dtype=target)
+        if vectors.ndim != 2:
+            raise ValueError(f"Expected a 2-D matrix, got shape {vectors.shape}")
+        if len(keys) != len(vectors):
+            raise ValueError(f"Got {len(keys)} keys for {len(vectors)} vectors")
+
+        row_bytes = vectors.shape[1] * vectors.itemsize
+        buffer = vectors.data.cast("B") if vectors.size else memoryview(b"")
+        extras = metadata if metadata is not None else repeat({})
+        rows = zip(keys, range(len(vectors)), extras, strict=metadata is not None)
+
+        def queue(pipe: Any, row: tuple[str, int, dict[str, Any]]) -> str:
+            key, index, extra = row
+            if storage == "hash":
+                vector = buffer[index * row_bytes : (index + 1) * row_bytes]
+                pipe.hset(key, mapping={**extra, field: vector})
+            else:
+                pipe.json().set(key, "$", {**extra, field: vectors[index].tolist()})
+            return key
+
+        return self._write_documents(rows, chunk_size, queue, on_chunk)
+
+    def _write_documents(
+        self,
+        items: Iterable[T],
+        chunk_size: int,
+        queue: Callable[[Any, T], str],
+        on_chunk: Callable[[ChunkReport], None] | None = None,
+    ) -> BulkReport:
+        """
+        Pipeline one document write per item.
+        ``queue`` adds the write command for an item and returns the document key.
+        """
+
+        def queue_chunk(pipe: Any, chunk: list[T]) -> list[list[str]]:
+            return [[queue(pipe, item)] for item in chunk]
+
+        return self._pipeline_chunks(items, chunk_size, queue_chunk, on_chunk)
+
+    def set_many(
+        self,
+        items: Mapping[str, str] | Iterable[tuple[str, str]],
+        ttl: int | Mapping[str, int] | None = None,
+        chunk_size: int = 1000,
+        on_chunk: Callable[[ChunkReport], None] | None = None,
+    ) -> BulkReport:
+        """
+        Set many key-value pairs, ``chunk_size`` keys per round-trip.
+        Without ``ttl`` each chunk is a single MSET. With ``ttl`` (seconds, either
+        one value for all keys or a per-key mapping) each chunk is a pipeline of
+        SET ... EX commands; keys missing from a TTL mapping are set without expiry.
+        """
+        pairs = items.items() if isinstance(items, Mapping) else items
+
+        def queue(pipe: Any, chunk: list[tuple[str, str]]) -> list[list[str]]:
+            if ttl is None:
+                pipe.mset(dict(chunk))
+                return [[key for key, _ in chunk]]
+            for key, value in chunk:
+                expiry = ttl.get(key) if isinstance(ttl, Mapping) else ttl
+                pipe.set(key, value, ex=expiry)
+            return [[key] for key, _ in chunk]
+
+        return self._pipeline_chunks(pairs, chunk_size, queue, on_chunk)
+
+    def get_many(self, keys: Iterable[str], chunk_size: int = 1000) -> list[str | None]:
+        """
+        Get many values with one MGET per ``chunk_size`` keys.
+        Values are returned in key order, with None for missing keys.
+        """
+        values: list[Any] = []
+        for chunk in _chunked(keys, chunk_size):
+            values.extend(self.client.mget(chunk))
+        return values
+
+    def delete_many(self, keys: Iterable[str], chunk_size: int = 1000) -> int:
+        """
+        Delete many keys with one UNLINK per ``chunk_size`` keys.
+        Memory is reclaimed in the background, so large values do not block the server.
+        """
+        deleted = 0
+        for chunk in _chunked(keys, chunk_size):
+            deleted += self.client.unlink(*chunk)
+            self._documents_written(chunk)
+        return deleted
+
+    def _pipeline_chunks(
+        self,
+        items: Iterable[T],
+        chunk_size: int,
+        queue: Callable[[Any, list[T]], list[list[str]]],
+        on_chunk: Callable[[ChunkReport], None] | None = None,
+    ) -> BulkReport:
+        """
+        Stream items through non-transactional pipelines, one chunk per round-trip.
+        ``queue`` adds the commands for a chunk to the pipeline and returns, for each
+        command in order, the keys it writes so failures can be attributed to keys
+        and cached search results over those keys invalidated.
+        """
+        report = BulkReport()
+        started = time.perf_counter()
+        for index, chunk in enumerate(_chunked(items, chunk_size)):
+            chunk_started = time.perf_counter()
+            pipe = self.client.pipeline(transaction=False)
+            command_keys = queue(pipe, chunk)
+            results = pipe.execute(raise_on_error=False)
+            self._documents_written(key for keys in command_keys for key in keys)
+            chunk_report = ChunkReport(
+                index=index,
+                size=len(chunk),
+                seconds=time.perf_counter() - chunk_started,
+                failures=[
+                    (key, result)
+                    for keys, result in zip(command_keys, results, strict=True)
+                    if isinstance(result, Exception)
+                    for key in keys
+                ],
+            )
+            report.total += chunk_report.size
+            report.chunks += 1
+            report.failures.extend(chunk_report.failures)
+            if on_chunk:
+                on_chunk(chunk_report)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def search(
+        self,
+        index_name: str,
+        query_string: str | QueryExpr,
+        return_fields: Iterable[str] | None = None,
+        no_content: bool = False,
+        offset: int = 0,
+        num: int = 10,
+        sort_by: str | None = None,
+        ascending: bool = True,
+        count_only: bool = False,
+    ) -> Any:
+        """
+        Perform a search query.
+        ``query_string`` is a raw query or a ``QueryExpr`` sent with PARAMS.
+        See ``build_search_query`` for the projection, paging and sorting options.
+        """
+        query, params = prepare_search_query(
+            query_string,
+            return_fields=return_fields,
+            no_content=no_content,
+            offset=offset,
+            num=num,
+            sort_by=sort_by,
+            ascending=ascending,
+            count_only=count_only,
+        )
+        if self.search_cache is None or not self._learn_index_prefixes(index_name):
+            return self._parse_documents(
+                index_name, self.client.ft(index_name).search(query, query_params=params)
+            )
+
+        args = query.get_args()
+        cache_key = self.search_cache.make_key(
+            index_name,
+            (
+                " ".join(str(args[0]).split()),
+                tuple(args[1:]),
+                tuple(sorted(params.items())) if params else None,
+            ),
+        )
+        result = self.search_cache.get(cache_key)
+        if result is None:
+            result = self._parse_documents(
+                index_name, self.client.ft(index_name).search(query, query_params=params)
+            )
+            self.search_cache.put(cache_key, result)
+        return result
+
+    def federated_search(
+        self,
+        index_names: Sequence[str],
+        query_string: str | QueryExpr,
+        return_fields: Iterable[str] | None = None,
+        offset: int = 0,
+        num: int = 10,
+        sort_by: str | None = None,
+        ascending: bool = True,
+        max_workers: int | None = None,
+    ) -> FederatedResult:
+        """
+        Run one query against several indexes concurrently and merge the hits.
+        Each index returns its top ``offset + num`` hits, which are merged by
+        score (scores use per-index term statistics, so they are only roughly
+        comparable) or by ``sort_by``, and the global page is cut from the merge.
+        Deep offsets therefore cost ``len(index_names) * (offset + num)`` hits.
+        """
+        if return_fields is not None and sort_by is not None:
+            return_fields = list(dict.fromkeys([*return_fields, sort_by]))
+        workers = max_workers or min(len(index_names), self.config.max_connections)
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = {
+                index_name: executor.submit(
+                    self.search,
+                    index_name,
+                    query_string,
+                    return_fields=return_fields,
+                    num=offset + num,
+                    sort_by=sort_by,
+                    ascending=ascending,
+                )
+                for index_name in index_names
+            }
+            results = {index_name: future.result() for index_name, future in futures.items()}
+        return merge_search_results(results, offset, num, sort_by, ascending)
+
+    def profile_search(
+        self,
+        index_name: str,
+        query_string: str | QueryExpr,
+        return_fields: Iterable[str] | None = None,
+        no_content: bool = False,
+        offset: int = 0,
+        num: int = 10,
+        sort_by: str | None = None,
+        ascending: bool = True,
+        limited: bool = False,
+    ) -> tuple[Any, SearchProfile]:
+        """
+        Run a search under FT.PROFILE, bypassing the result cache.
+        Returns the result and the parsed iterator tree and stage timings;
+        ``limited`` omits reader iterator details. Takes the options of ``search``.
+        """
+        query, params = prepare_search_query(
+            query_string,
+            return_fields=return_fields,
+            no_content=no_content,
+            offset=offset,
+            num=num,
+            sort_by=sort_by,
+            ascending=ascending,
+        )
+        reply = self.client.ft(index_name).profile(query, limited=limited, query_params=params)
+        # A search profile always replies with the result and the profile
+        result, profile = cast(tuple[Result, ProfileInformation], reply)
+        return self._parse_documents(index_name, result), SearchProfile.from_info(profile.info)
+
+    def search_records(
+        self,
+        index_name: str,
+        query_string: str | QueryExpr,
+        return_fields: Iterable[str] | None = None,
+        no_content: bool = False,
+        offset: int = 0,
+        num: int = 10,
+        sort_by: str | None = None,
+        ascending: bool = True,
+    ) -> LazySearchResult:
+        """
+        Perform a search and return a LazySearchResult instead of Documents.
+        The reply is read as bytes over ``raw_client``; fields are decoded only
+        when accessed and numeric fields parse into arrays with ``numeric()``.
+        Takes the options of ``search``; results are not cached.
+        """
+        if return_fields is not None:
+            return_fields = list(return_fields)
+            no_content = no_content or not return_fields
+        query, params = prepare_search_query(
+            query_string,
+            return_fields=return_fields,
+            no_content=no_content,
+            offset=offset,
+            num=num,
+            sort_by=sort_by,
+            ascending=ascending,
+        )
+        args = ["FT.SEARCH", index_name, *query.get_args()]
+        if params:
+            args += ["PARAMS", len(params) * 2, *(item for pair in params.items() for item in pair)]
+        return LazySearchResult(self.raw_client.execute_command(*args), has_content=not no_content)
+
+    def _learn_index_prefixes(self, index_name: str) -> bool:
+        """
+        Make sure the key prefixes and key type of an index are known, reading
+        FT.INFO once. Returns False when the index does not exist.
+        """
+        if index_name not in self._index_prefixes:
+            try:
+                info = self.client.ft(index_name).info()
+            except redis.exceptions.ResponseError:
+                return False
+            self._index_prefixes[index_name] = _index_prefixes_from_info(info)
+            self._index_key_types[index_name] = _index_definition_from_info(info)["index_type"]
+        return True
+
+    def _parse_documents(self, index_name: str, result: Any) -> Any:
+        """
+        Decode ``doc.json`` when the hits come from a JSON index. The key type
+        is only looked up once a hit carries a ``json`` field.
+        """
+        if any(hasattr(doc, "json") for doc in result.docs) and (
+            self._learn_index_prefixes(index_name)
+            and self._index_key_types[index_name] == IndexType.JSON
+        ):
+            return _parse_json_documents(result)
+        return result
+
+    def _index_changed(self, index_name: str) -> None:
+        """Invalidate cached results of an index that was created or dropped."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(index_name)
+
+    def _documents_written(self, keys: Iterable[str]) -> None:
+        """Invalidate cached results of every known index whose prefixes cover ``keys``."""
+        if self.search_cache is None:
+            return
+        touched: set[str] = set()
+        for key in keys:
+            touched.update(
+                name for name, prefixes in self._index_prefixes.items() if key.startswith(prefixes)
+            )
+        for index_name in touched:
+            self.search_cache.invalidate(index_name)
+
+    def knn_search(
+        self,
+        index_name: str,
+        vector: Any,
+        k: int = 10,
+        field: str = "embedding",
+        filter: str | QueryExpr | None = None,
+        return_fields: Iterable[str] | None = None,
+        dtype: str = "FLOAT32",
+        score_field: str = "vector_score",
+    ) -> Any:
+        """
+        Find the ``k`` nearest neighbours of ``vector`` in a vector field.
+        ``filter`` (a raw query or ``QueryExpr``) restricts the candidates; hits are
+        sorted by distance, which is returned as ``score_field`` alongside
+        ``return_fields`` (the binary vector itself is never returned).
+        """
+        return self.hybrid_search(
+            index_name,
+            vector,
+            k=k,
+            filter=filter,
+            field=field,
+            return_fields=return_fields,
+            dtype=dtype,
+            score_field=score_field,
+        )
+
+    def hybrid_search(
+        self,
+        index_name: str,
+        vector: Any,
+        k: int = 10,
+        text: str | QueryExpr | None = None,
+        filter: str | QueryExpr | None = None,
+        field: str = "embedding",
+        mode: str = "knn",
+        radius: float | None = None,
+        ef_runtime: int | None = None,
+        return_fields: Iterable[str] | None = None,
+        sort_by: str | None = None,
+        ascending: bool = True,
+        dtype: str = "FLOAT32",
+        score_field: str = "vector_score",
+    ) -> Any:
+        """
+        Combine a full-text clause, filters and a vector clause in one query.
+        ``text`` is matched word by word as PARAMS (or may be a ``QueryExpr``) and is
+        ANDed with ``filter``. In ``"knn"`` mode they pre-filter a KNN search of
+        ``k`` neighbours (``ef_runtime`` tunes HNSW recall); in ``"range"`` mode
+        they are intersected with every vector within ``radius``, returning at
+        most ``k`` hits. The distance is yielded as ``score_field``, which is the
+        default sort key and is always returned with ``return_fields``.
+        """
+        if mode not in ("knn", "range"):
+            raise ValueError(f"Mode must be 'knn' or 'range', got {mode!r}")
+        if mode == "range" and radius is None:
+            raise ValueError("Range mode needs a radius")
+        if mode == "range" and ef_runtime is not None:
+            raise ValueError("EF_RUNTIME only applies to KNN mode")
+
+        params: dict[str, Any] = {}
+        clauses = []
+        if text:
+            clauses.append((Text(text) if isinstance(text, str) else text).render(params))
+        if isinstance(filter, QueryExpr):
+            clauses.append(filter.render(params))
+        elif filter:
+            clauses.append(f"({filter})")
+        prefilter = " ".join(clauses) or "*"
+
+        params["knn_vector"] = vector_to_bytes(vector, dtype)
+        if mode == "knn":
+            params["knn_k"] = k
+            ef = ""
+            if ef_runtime is not None:
+                params["knn_ef_runtime"] = ef_runtime
+                ef = " EF_RUNTIME $knn_ef_runtime"
+            query_string = f"({prefilter})=>[KNN $knn_k @{field} $knn_vector{ef} AS {score_field}]"
+        else:
+            params["knn_radius"] = radius
+            vector_clause = (
+                f"@{field}:[VECTOR_RANGE $knn_radius $knn_vector]"
+                f"=>{{$YIELD_DISTANCE_AS: {score_field}}}"
+            )
+            query_string = vector_clause if prefilter == "*" else f"{prefilter} {vector_clause}"
+
+        query = (
+            Query(query_string)
+            .sort_by(sort_by or score_field, asc=ascending)
+            .paging(0, k)
+            .dialect(2)
+            .return_fields(*(return_fields or ()), score_field)
+        )
+        return self.client.ft(index_name).search(query, query_params=params)
+
+    def iter_search(
+        self,
+        index_name: str,
+        query_string: str = "*",
+        fields: Iterable[str] | None = None,
+        count: int = 1000,
+        max_idle_ms: int = 300_000,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yield every match of a query as a dict, via FT.AGGREGATE WITHCURSOR.
+        Rows are fetched ``count`` at a time, so memory stays bounded and the
+        MAXSEARCHRESULTS cap does not apply. With ``fields`` only those fields are
+        loaded and each row carries the document key as ``id``; otherwise all
+        fields are loaded. The server drops the cursor after ``max_idle_ms``
+        without a read; closing the generator early deletes it immediately.
+        """
+        if fields is None:
+            load = ["LOAD", "*"]
+        else:
+            load_fields = ["@__key", *(f"@{name.lstrip('@')}" for name in fields)]
+            load = ["LOAD", str(len(load_fields)), *load_fields]
+        batch, cursor_id = self.client.execute_command(
+            "FT.AGGREGATE",
+            index_name,
+            query_string,
+            *load,
+            "WITHCURSOR",
+            "COUNT",
+            count,
+            "MAXIDLE",
+            max_idle_ms,
+            "DIALECT",
+            2,
+        )
+        try:
+            while True:
+                for row in aggregate_rows(batch)[1:]:
+                    doc = dict(zip(row[::2], row[1::2], strict=True))
+                    if "__key" in doc:
+                        doc["id"] = doc.pop("__key")
+                    yield doc
+                if not cursor_id:
+                    break
+                batch, cursor_id = self.client.execute_command(
+                    "FT.CURSOR", "READ", index_name, cursor_id, "COUNT", count
+                )
+        finally:
+            if cursor_id:
+                with suppress(redis.exceptions.ResponseError):
+                    self.client.execute_command("FT.CURSOR", "DEL", index_name, cursor_id)
+
+    def aggregate(
+        self,
+        index_name: str,
+        aggregation: Aggregation,
+        dtypes: Mapping[str, Any] | None = None,
+    ) -> AggregateTable:
+        """
+        Run an FT.AGGREGATE pipeline and decode the rows into NumPy columns.
+        ``dtypes`` overrides the inferred type of named columns.
+        """
+        reply = self.client.execute_command("FT.AGGREGATE", index_name, *aggregation.build_args())
+        return AggregateTable.from_reply(reply, dtypes)
+
+    def iter_pages(
+        self,
+        index_name: str,
+        query_string: str | QueryExpr = "*",
+        sort_by: str = "doc_score",
+        page_size: int = 100,
+        ascending: bool = True,
+        fields: Iterable[str] | None = None,
+        after: tuple[float, str] | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield pages of matches in ``(sort_by, id)`` order using keyset pagination.
+        Instead of skipping ``offset`` rows, each page is fetched with FT.AGGREGATE
+        after the last row of the previous one: a range on the SORTABLE numeric
+        ``sort_by`` field narrows the query, a FILTER breaks ties on the document
+        key and SORTBY ... MAX keeps only a page-sized heap, so deep pages cost
+        the same as the first. The default ``doc_score`` is sortable in the blog
+        schema; other indexes pass their own ``sort_by``. Rows are dicts like
+        those of ``iter_search``; documents without a ``sort_by`` value are not
+        returned. Pass ``after`` (a ``(value, id)`` pair taken from a row) to
+        resume from that row.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        direction = "ASC" if ascending else "DESC"
+        if fields is None:
+            load = ["LOAD", "*"]
+        else:
+            load_fields = [f"@{name.lstrip('@')}" for name in fields]
+            load = ["LOAD", str(len(load_fields)), *load_fields] if load_fields else []
+        while True:
+            if after is None:
+                low = high = None
+            else:
+                low, high = (after[0], None) if ascending else (None, after[0])
+            # A wildcard only matches everything on its own, not inside an
+            # intersection, so match-all queries send the range clause alone
+            if isinstance(query_string, MatchAll):
+                shape, params = NumericRange(sort_by, low, high).compile()
+            elif isinstance(query_string, QueryExpr):
+                shape, params = (query_string & NumericRange(sort_by, low, high)).compile()
+            else:
+                low_bound = "-inf" if low is None else repr(float(low))
+                high_bound = "+inf" if high is None else repr(float(high))
+                shape, params = f"@{sort_by}:[{low_bound} {high_bound}]", {}
+                if query_string.strip() != "*":
+                    shape = f"({query_string}) {shape}"
+            args: list[Any] = ["FT.AGGREGATE", index_name, shape, "LOAD", "2"]
+            args += ["@__key", f"@{sort_by}"]
+            if after is not None:
+                args += ["FILTER", _keyset_filter(sort_by, ascending, after)]
+            args += ["SORTBY", "4", f"@{sort_by}", direction, "@__key", "ASC"]
+            args += ["MAX", page_size, *load]
+            if params:
+                args += [
+                    "PARAMS",
+                    len(params) * 2,
+                    *(item for pair in params.items() for item in pair),
+                ]
+            reply = self.client.execute_command(*args, "DIALECT", 2)
+
+            page = []
+            for row in aggregate_rows(reply)[1:]:
+                doc = dict(zip(row[::2], row[1::2], strict=True))
+                doc["id"] = doc.pop("__key")
+                page.append(doc)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = (float(page[-1][sort_by]), page[-1]["id"])
 
     def json_set(self, key: str, path: str, value: Any) -> bool:
         """Set a JSON value at a specific path."""
-        return self.client.json().set(key, path, value)
+        result = self.client.json().set(key, path, value)
+        self._documents_written([key])
+        return result
 
     def json_get(self, key: str, path: str | None = None) -> Any:
         """Get a JSON value from a specific path."""
@@ -142,11 +1487,61 @@ class RedisStackClient:
             return self.client.json().get(key, path)
         return self.client.json().get(key)
 
+    def json_set_many(
+        self,
+        items: Mapping[str, Any] | Iterable[tuple[str, Any]],
+        path: str = "$",
+        chunk_size: int = 500,
+        on_chunk: Callable[[ChunkReport], None] | None = None,
+    ) -> BulkReport:
+        """
+        Set a JSON value at ``path`` for many keys, ``chunk_size`` keys per round-trip.
+        Uses one JSON.MSET per chunk when the server supports it, otherwise a
+        pipeline of JSON.SET commands.
+        """
+        pairs = items.items() if isinstance(items, Mapping) else items
+        use_mset = self.supports_json_mset()
+
+        def queue(pipe: Any, chunk: list[tuple[str, Any]]) -> list[list[str]]:
+            if use_mset:
+                pipe.json().mset([(key, path, value) for key, value in chunk])
+                return [[key for key, _ in chunk]]
+            for key, value in chunk:
+                pipe.json().set(key, path, value)
+            return [[key] for key, _ in chunk]
+
+        return self._pipeline_chunks(pairs, chunk_size, queue, on_chunk)
+
+    def json_get_many(
+        self, keys: Iterable[str], path: str = ".", chunk_size: int = 500
+    ) -> list[Any]:
+        """
+        Get the JSON value at ``path`` for many keys with one JSON.MGET per chunk.
+        The default root path matches ``json_get(key)``; results are in key order,
+        with None for missing keys.
+        """
+        values: list[Any] = []
+        for chunk in _chunked(keys, chunk_size):
+            values.extend(self.client.json().mget(chunk, path))
+        return values
+
+    def supports_json_mset(self) -> bool:
+        """Check (once per client) whether the loaded RedisJSON implements JSON.MSET."""
+        if self._json_mset_supported is None:
+            versions = [
+                mod.get("ver", 0) for mod in self.get_modules() if mod.get("name") == "ReJSON"
+            ]
+            self._json_mset_supported = bool(versions) and versions[0] >= self.JSON_MSET_MIN_VERSION
+        return self._json_mset_supported
+
     def close(self) -> None:
-        """Close the Redis connection."""
+        """Close the Redis clients; pooled connections stay open for reuse."""
         if self._client:
             self._client.close()
             self._client = None
+        if self._raw_client:
+            self._raw_client.close()
+            self._raw_client = None
 
     def __enter__(self) -> "RedisStackClient":
         """Context manager entry."""
@@ -163,11 +1558,69 @@ class RedisSearchHelper:
     @staticmethod
     def create_blog_schema() -> tuple:
         """Create a standard blog post schema for testing."""
+        return RedisSearchHelper.blog_schema_builder().build()
+
+    @staticmethod
+    def blog_schema_builder() -> SchemaBuilder:
+        """Create a builder for the blog post schema, to derive tuned variants from."""
+        return (
+            SchemaBuilder()
+            .text("title", weight=5.0)
+            .text("content")
+            .tag("tags")
+            .numeric("doc_score", sortable=True)
+        )
+
+    @staticmethod
+    def create_vector_field(
+        name: str,
+        dim: int,
+        algorithm: str = "HNSW",
+        dtype: str = "FLOAT32",
+        distance_metric: str = "COSINE",
+        initial_cap: int | None = None,
+        m: int | None = None,
+        ef_construction: int | None = None,
+        ef_runtime: int | None = None,
+    ) -> VectorField:
+        """
+        Create a FLAT or HNSW vector field.
+        ``m``, ``ef_construction`` and ``ef_runtime`` tune HNSW graphs only.
+        """
+        algorithm = algorithm.upper()
+        if algorithm not in ("FLAT", "HNSW"):
+            raise ValueError(f"Vector algorithm must be FLAT or HNSW, got {algorithm!r}")
+        if dtype not in VECTOR_DTYPES:
+            raise ValueError(f"Vector type must be one of {tuple(VECTOR_DTYPES)}, got {dtype!r}")
+        if distance_metric not in VECTOR_DISTANCE_METRICS:
+            raise ValueError(
+                f"Distance metric must be one of {VECTOR_DISTANCE_METRICS}, got {distance_metric!r}"
+            )
+        attributes: dict[str, Any] = {"TYPE": dtype, "DIM": dim, "DISTANCE_METRIC": distance_metric}
+        if initial_cap is not None:
+            attributes["INITIAL_CAP"] = initial_cap
+        hnsw_params = {"M": m, "EF_CONSTRUCTION": ef_construction, "EF_RUNTIME": ef_runtime}
+        if algorithm == "FLAT" and any(value is not None for value in hnsw_params.values()):
+            raise ValueError("M, EF_CONSTRUCTION and EF_RUNTIME only apply to HNSW fields")
+        attributes.update({key: value for key, value in hnsw_params.items() if value is not None})
+        return VectorField(name, algorithm, attributes)
+
+    @staticmethod
+    def create_blog_vector_schema(dim: int, algorithm: str = "HNSW") -> tuple:
+        """Create the blog post schema with an ``embedding`` vector field."""
+        return (
+            *RedisSearchHelper.create_blog_schema(),
+            RedisSearchHelper.create_vector_field("embedding", dim, algorithm=algorithm),
+        )
+
+    @staticmethod
+    def create_blog_json_schema() -> tuple:
+        """Create the blog post schema for JSON documents, aliasing JSONPaths to field names."""
         return (
-            TextField("title", weight=5.0),
-            TextField("content"),
-            TagField("tags"),
-            NumericField("doc_score"),
+            TextField("$.title", weight=5.0, as_name="title"),
+            TextField("$.content", as_name="content"),
+            TagField("$.tags[*]", as_name="tags"),
+            NumericField("$.doc_score", as_name="doc_score", sortable=True),
         )
 
     @staticmethod
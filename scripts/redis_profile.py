@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Structured FT.PROFILE output for RediSearch queries.
+Normalizes the profile reply of RediSearch 2.x and of Redis 8 (per-shard
+sections) into an iterator tree and result-processor timings.
+
+Usage:
+    python -m scripts.redis_profile INDEX QUERY [--top N] [--limited]
+"""
+
+import argparse
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from scripts.redis_replies import parse_number, parse_pairs
+
+
+def _sections(raw: Any) -> dict[str, Any]:
+    """
+    Turn a profile section into a dict. RediSearch 2.x replies with
+    ``[[key, value...], ...]`` pairs, newer servers with a flat key/value list.
+    """
+    if isinstance(raw, dict):
+        return raw
+    if isinstance(raw, list) and raw and isinstance(raw[0], list):
+        return {entry[0]: entry[1] if len(entry) == 2 else entry[1:] for entry in raw if entry}
+    return parse_pairs(raw)
+
+
+@dataclass
+class ProfileIterator:
+    """A node of the query iterator tree; ``time_ms`` includes its children."""
+
+    type: str
+    time_ms: float = 0.0
+    counter: int = 0
+    detail: str | None = None
+    size: int | None = None
+    children: list["ProfileIterator"] = field(default_factory=list)
+
+    @classmethod
+    def from_info(cls, raw: Any) -> "ProfileIterator":
+        if isinstance(raw, dict):
+            values, children = raw, raw.get("Child iterators") or []
+        else:
+            values, children = {}, []
+            for i in range(0, len(raw) - 1, 2):
+                if raw[i] == "Child iterators":
+                    # 2.x appends the children after the key instead of nesting them
+                    children = raw[i + 1 :]
+                    if len(children) == 1 and children[0] and isinstance(children[0][0], list):
+                        children = children[0]
+                    break
+                values[raw[i]] = raw[i + 1]
+        detail = values.get("Term", values.get("Query type"))
+        return cls(
+            type=str(values.get("Type", "")),
+            time_ms=parse_number(values.get("Time")),
+            counter=int(parse_number(values.get("Counter"))),
+            detail=None if detail is None else str(detail),
+            size=int(parse_number(values["Size"])) if "Size" in values else None,
+            children=[cls.from_info(child) for child in children],
+        )
+
+    @property
+    def label(self) -> str:
+        return f"{self.type} {self.detail}" if self.detail else self.type
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, "ProfileIterator"]]:
+        """Yield ``(depth, node)`` for this node and its descendants, depth first."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+@dataclass
+class ResultProcessorProfile:
+    """Cost of one stage of the result-processing pipeline."""
+
+    type: str
+    time_ms: float = 0.0
+    counter: int = 0
+
+    @classmethod
+    def from_info(cls, raw: Any) -> "ResultProcessorProfile":
+        values = parse_pairs(raw)
+        return cls(
+            type=str(values.get("Type", "")),
+            time_ms=parse_number(values.get("Time")),
+            counter=int(parse_number(values.get("Counter"))),
+        )
+
+
+@dataclass
+class SearchProfile:
+    """Parsed FT.PROFILE output of one search; times are in milliseconds."""
+
+    total_ms: float
+    parsing_ms: float
+    pipeline_creation_ms: float
+    warning: str | None
+    iterators: ProfileIterator | None
+    processors: list[ResultProcessorProfile]
+    raw: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_info(cls, raw: Any) -> "SearchProfile":
+        """Parse a profile reply; multi-shard replies report the first shard."""
+        sections = _sections(raw)
+        if "Shards" in sections:
+            shards = sections["Shards"]
+            if isinstance(shards, dict):
+                shards = list(shards.values())
+            sections = _sections(shards[0]) if shards else {}
+        iterators = sections.get("Iterators profile")
+        processors = sections.get("Result processors profile") or []
+        if processors and not isinstance(processors[0], list | dict):
+            processors = [processors]
+        warning = sections.get("Warning")
+        return cls(
+            total_ms=parse_number(sections.get("Total profile time")),
+            parsing_ms=parse_number(sections.get("Parsing time")),
+            pipeline_creation_ms=parse_number(sections.get("Pipeline creation time")),
+            warning=None if warning in (None, "None", []) else str(warning),
+            iterators=ProfileIterator.from_info(iterators) if iterators else None,
+            processors=[ResultProcessorProfile.from_info(p) for p in processors],
+            raw=raw,
+        )
+
+    def stages(self) -> list[tuple[str, float]]:
+        """Every timed stage as ``(name, time_ms)``."""
+        stages = [("parsing", self.parsing_ms), ("pipeline creation", self.pipeline_creation_ms)]
+        if self.iterators is not None:
+            stages += [
+                (f"iterator {'  ' * depth}{node.label}", node.time_ms)
+                for depth, node in self.iterators.walk()
+            ]
+        stages += [(f"processor {p.type}", p.time_ms) for p in self.processors]
+        return stages
+
+    def slowest(self, n: int = 10) -> list[tuple[str, float]]:
+        """The ``n`` most expensive stages, slowest first."""
+        return sorted(self.stages(), key=lambda stage: stage[1], reverse=True)[:n]
+
+
+def format_profile(profile: SearchProfile, top: int = 10) -> str:
+    """Render a profile summary with its slowest stages."""
+    lines = [
+        f"Total {profile.total_ms:.3f} ms "
+        f"(parsing {profile.parsing_ms:.3f} ms, "
+        f"pipeline creation {profile.pipeline_creation_ms:.3f} ms)"
+    ]
+    if profile.warning:
+        lines.append(f"Warning: {profile.warning}")
+    lines.append("Slowest stages:")
+    lines += [f"  {time_ms:10.3f} ms  {name}" for name, time_ms in profile.slowest(top)]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Profile a query against an index and print its slowest stages."""
+    from scripts.redis_client import RedisConfig, RedisStackClient
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("index", help="index or alias to query")
+    parser.add_argument("query", help="RediSearch query string")
+    parser.add_argument("--top", type=int, default=10, help="number of stages to print")
+    parser.add_argument("--limited", action="store_true", help="omit reader iterator details")
+    args = parser.parse_args(argv)
+
+    with RedisStackClient(RedisConfig.from_env()) as client:
+        result, profile = client.profile_search(args.index, args.query, limited=args.limited)
+    print(f"{result.total} results")
+    print(format_profile(profile, top=args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
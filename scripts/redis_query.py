@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Typed query builder for RediSearch.
+Builds DIALECT 2 query strings whose values are passed as PARAMS, so user
+input never needs escaping and queries of the same shape share one string.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+GEO_UNITS = ("m", "km", "mi", "ft")
+
+
+class QueryExpr(ABC):
+    """
+    Base class for query expressions.
+    Expressions combine with ``&`` (and), ``|`` (or) and ``~`` (not).
+    """
+
+    @abstractmethod
+    def render(self, params: dict[str, Any]) -> str:
+        """Render the query string, registering values in ``params``."""
+
+    def compile(self) -> tuple[str, dict[str, Any]]:
+        """
+        Return the parameterized query string (the query shape) and its PARAMS.
+        Parameters are named in render order, so equal shapes give equal strings.
+        """
+        params: dict[str, Any] = {}
+        return self.render(params), params
+
+    def __and__(self, other: "QueryExpr") -> "And":
+        return And(self, other)
+
+    def __or__(self, other: "QueryExpr") -> "Or":
+        return Or(self, other)
+
+    def __invert__(self) -> "Not":
+        return Not(self)
+
+
+def _param(params: dict[str, Any], value: Any) -> str:
+    """Register a parameter value and return its placeholder."""
+    name = f"p{len(params)}"
+    params[name] = value
+    return f"${name}"
+
+
+class MatchAll(QueryExpr):
+    """Match every document in the index."""
+
+    def render(self, params: dict[str, Any]) -> str:  # noqa: ARG002
+        return "*"
+
+
+class Text(QueryExpr):
+    """Full-text match of every word in ``value``, optionally limited to one field."""
+
+    def __init__(self, value: str, field: str | None = None):
+        self.words = value.split()
+        if not self.words:
+            raise ValueError("Text query value must contain at least one word")
+        self.field = field
+
+    def render(self, params: dict[str, Any]) -> str:
+        terms = " ".join(_param(params, word) for word in self.words)
+        clause = f"({terms})" if len(self.words) > 1 else terms
+        return f"@{self.field}:{clause}" if self.field else clause
+
+
+class Tag(QueryExpr):
+    """Match documents whose tag field contains any of ``values``."""
+
+    def __init__(self, field: str, *values: str):
+        if not values:
+            raise ValueError("Tag query needs at least one value")
+        self.field = field
+        self.values = values
+
+    def render(self, params: dict[str, Any]) -> str:
+        tags = " | ".join(_param(params, value) for value in self.values)
+        return f"@{self.field}:{{{tags}}}"
+
+
+class NumericRange(QueryExpr):
+    """Match documents with ``low <= field <= high``; a missing bound is open."""
+
+    def __init__(self, field: str, low: float | None = None, high: float | None = None):
+        self.field = field
+        self.low = low
+        self.high = high
+
+    def render(self, params: dict[str, Any]) -> str:
+        low = "-inf" if self.low is None else _param(params, self.low)
+        high = "+inf" if self.high is None else _param(params, self.high)
+        return f"@{self.field}:[{low} {high}]"
+
+
+class GeoRadius(QueryExpr):
+    """Match documents within ``radius`` of a longitude/latitude point."""
+
+    def __init__(self, field: str, lon: float, lat: float, radius: float, unit: str = "km"):
+        if unit not in GEO_UNITS:
+            raise ValueError(f"Geo unit must be one of {GEO_UNITS}, got {unit!r}")
+        self.field = field
+        self.lon = lon
+        self.lat = lat
+        self.radius = radius
+        self.unit = unit
+
+    def render(self, params: dict[str, Any]) -> str:
+        lon = _param(params, self.lon)
+        lat = _param(params, self.lat)
+        radius = _param(params, self.radius)
+        return f"@{self.field}:[{lon} {lat} {radius} {self.unit}]"
+
+
+class And(QueryExpr):
+    """Match documents satisfying every clause."""
+
+    def __init__(self, *clauses: QueryExpr):
+        if not clauses:
+            raise ValueError("And needs at least one clause")
+        self.clauses = clauses
+
+    def render(self, params: dict[str, Any]) -> str:
+        return "(" + " ".join(clause.render(params) for clause in self.clauses) + ")"
+
+
+class Or(QueryExpr):
+    """Match documents satisfying any clause."""
+
+    def __init__(self, *clauses: QueryExpr):
+        if not clauses:
+            raise ValueError("Or needs at least one clause")
+        self.clauses = clauses
+
+    def render(self, params: dict[str, Any]) -> str:
+        return "(" + " | ".join(clause.render(params) for clause in self.clauses) + ")"
+
+
+class Not(QueryExpr):
+    """Match documents that do not satisfy the clause."""
+
+    def __init__(self, clause: QueryExpr):
+        self.clause = clause
+
+    def render(self, params: dict[str, Any]) -> str:
+        return f"-{self.clause.render(params)}"
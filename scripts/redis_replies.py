@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Parsers for Redis command replies.
+Numbers, sizes and nested ``[key, value, ...]`` lists as RediSearch reports
+them, and RESP3 result maps brought back to the RESP2 shapes the clients parse.
+"""
+
+import math
+from typing import Any
+
+MB = 1024 * 1024
+
+
+def parse_number(value: Any) -> float:
+    """Parse a reply number; missing or nan values count as 0."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return number if math.isfinite(number) else 0.0
+
+
+def parse_megabytes(value: Any) -> int | None:
+    """Convert a size in MB to bytes; None when it is missing or not a number."""
+    try:
+        megabytes = float(value)
+    except (TypeError, ValueError):
+        return None
+    return round(megabytes * MB) if math.isfinite(megabytes) else None
+
+
+def parse_pairs(value: Any) -> dict[str, Any]:
+    """Turn a nested ``[key, value, ...]`` reply, or a RESP3 map, into a dict."""
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, list):
+        return {}
+    return dict(zip(value[::2], value[1::2], strict=False))
+
+
+def map_get(reply: dict[Any, Any], name: str) -> Any:
+    """Look up a RESP3 map key, which is bytes on connections that do not decode."""
+    return reply[name] if name in reply else reply.get(name.encode())
+
+
+def aggregate_rows(reply: list[Any] | dict[Any, Any]) -> list[Any]:
+    """
+    An FT.AGGREGATE or FT.CURSOR batch in the RESP2 shape
+    ``[total, [key, value, ...], ...]``. RESP3 replies are maps whose
+    ``results`` rows keep their fields under ``extra_attributes``.
+    """
+    if not isinstance(reply, dict):
+        return reply
+    rows = [
+        [item for pair in (map_get(row, "extra_attributes") or {}).items() for item in pair]
+        for row in map_get(reply, "results") or []
+    ]
+    return [map_get(reply, "total_results"), *rows]
+
+
+def search_rows(reply: list[Any] | dict[Any, Any], has_content: bool = True) -> list[Any]:
+    """
+    An FT.SEARCH ... WITHSCORES reply in the RESP2 shape
+    ``[total, id, score, [key, value, ...], ...]``, without the field lists
+    when ``has_content`` is false. RESP3 replies are maps of ``results`` rows.
+    """
+    if not isinstance(reply, dict):
+        return reply
+    flat = [map_get(reply, "total_results")]
+    for row in map_get(reply, "results") or []:
+        flat += [map_get(row, "id"), map_get(row, "score")]
+        if has_content:
+            attributes = map_get(row, "extra_attributes") or {}
+            flat.append([item for pair in attributes.items() for item in pair])
+    return flat
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Lazy, array-backed search results.
+Keeps the raw FT.SEARCH reply as bytes and decodes a field only when it is
+read; numeric fields are parsed once per result set into NumPy arrays.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+from scripts.redis_replies import search_rows
+
+
+class SearchRecord:
+    """
+    View of one hit in a LazySearchResult; fields decode on attribute access.
+    ``record.title`` returns a str and raises AttributeError when the hit has no
+    such field, like a redis-py Document; ``record.raw("title")`` returns bytes.
+    """
+
+    __slots__ = ("_results", "_index")
+
+    def __init__(self, results: "LazySearchResult", index: int):
+        self._results = results
+        self._index = index
+
+    @property
+    def id(self) -> str:
+        return self._results._ids[self._index].decode()
+
+    @property
+    def score(self) -> float:
+        return float(self._results.scores[self._index])
+
+    def raw(self, name: str) -> bytes | None:
+        """The undecoded value of a field, or None if the hit lacks it."""
+        return self._results._raw_value(self._index, name.encode())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        value = self.raw(name)
+        return default if value is None else value.decode()
+
+    def __getattr__(self, name: str) -> str:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = self.raw(name)
+        if value is None:
+            raise AttributeError(name)
+        return value.decode()
+
+    def __repr__(self) -> str:
+        return f"SearchRecord(id={self.id!r})"
+
+
+class LazySearchResult:
+    """
+    Search result backed by the raw reply of FT.SEARCH ... WITHSCORES, in
+    either RESP shape. Iterating yields SearchRecord views; no per-hit objects
+    are kept.
+    """
+
+    __slots__ = ("total", "_ids", "_raw_scores", "_rows", "_scores", "_numeric")
+
+    def __init__(self, reply: list[Any] | dict[Any, Any], has_content: bool = True):
+        reply = search_rows(reply, has_content)
+        step = 3 if has_content else 2
+        self.total: int = int(reply[0])
+        self._ids: list[bytes] = reply[1::step]
+        self._raw_scores: list[bytes] = reply[2::step]
+        self._rows: list[list[bytes]] | None = reply[3::step] if has_content else None
+        self._scores: np.ndarray | None = None
+        self._numeric: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> SearchRecord:
+        if not -len(self) <= index < len(self):
+            raise IndexError("search result index out of range")
+        return SearchRecord(self, index % len(self))
+
+    def __iter__(self) -> Iterator[SearchRecord]:
+        return (SearchRecord(self, index) for index in range(len(self)))
+
+    @property
+    def ids(self) -> list[str]:
+        """Document ids of the hits, decoded."""
+        return [doc_id.decode() for doc_id in self._ids]
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Scores of the hits, parsed once into a float64 array."""
+        if self._scores is None:
+            self._scores = np.array(self._raw_scores, dtype=np.bytes_).astype(np.float64)
+        return self._scores
+
+    def numeric(self, name: str) -> np.ndarray:
+        """
+        Values of a numeric field as a float64 array, parsed once and cached.
+        Hits without the field are nan.
+        """
+        column = self._numeric.get(name)
+        if column is None:
+            key = name.encode()
+            values = [self._raw_value(index, key) for index in range(len(self))]
+            raw = np.array(
+                [b"nan" if value is None else value for value in values], dtype=np.bytes_
+            )
+            column = self._numeric[name] = raw.astype(np.float64)
+        return column
+
+    def _raw_value(self, index: int, key: bytes) -> bytes | None:
+        if self._rows is None:
+            return None
+        row = self._rows[index]
+        for position in range(0, len(row) - 1, 2):
+            if row[position] == key:
+                return row[position + 1]
+        return None
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Schema builder for RediSearch indexes.
+Exposes the per-field and index-wide options that trade query features for
+index memory, so variants of a schema can be measured against each other.
+"""
+
+import math
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from redis.commands.search.field import Field, NumericField, TagField, TextField
+
+from scripts.redis_replies import parse_megabytes
+
+# FT.INFO memory components, in MB, that together make up the index size
+INDEX_MEMORY_FIELDS = (
+    "inverted_sz_mb",
+    "offset_vectors_sz_mb",
+    "doc_table_size_mb",
+    "sortable_values_size_mb",
+    "key_table_size_mb",
+    "tag_overhead_sz_mb",
+    "text_overhead_sz_mb",
+    "vector_index_sz_mb",
+)
+
+
+@dataclass(frozen=True)
+class IndexOptions:
+    """
+    Index-wide FT.CREATE options.
+    ``no_offsets`` drops term positions (no exact phrases, no highlighting),
+    ``no_highlight`` drops highlighting data only, and ``no_freqs`` drops term
+    frequencies (no TF-IDF style scoring). ``stopwords=()`` disables stopwords.
+    """
+
+    no_offsets: bool = False
+    no_highlight: bool = False
+    no_freqs: bool = False
+    no_fields: bool = False
+    stopwords: tuple[str, ...] | None = None
+    skip_initial_scan: bool = False
+    max_text_fields: bool = False
+
+    def create_index_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for redis-py's ``create_index``."""
+        return {
+            "no_term_offsets": self.no_offsets,
+            "no_highlight": self.no_highlight,
+            "no_term_frequencies": self.no_freqs,
+            "no_field_flags": self.no_fields,
+            "stopwords": None if self.stopwords is None else list(self.stopwords),
+            "skip_initial_scan": self.skip_initial_scan,
+            "max_text_fields": self.max_text_fields,
+        }
+
+
+def _sortable(schema_field: Field, unf: bool) -> Field:
+    """Append UNF, which must directly follow SORTABLE."""
+    if unf:
+        if Field.SORTABLE not in schema_field.args_suffix:
+            raise ValueError(f"UNF requires a sortable field ({schema_field.name})")
+        schema_field.args_suffix.append("UNF")
+    return schema_field
+
+
+class SchemaBuilder:
+    """
+    Fluent builder for a schema and its index options.
+    ``build()`` returns the field tuple accepted by ``create_search_index``,
+    which also takes the builder itself to apply ``options`` as well.
+    """
+
+    def __init__(self, options: IndexOptions | None = None):
+        self.fields: list[Field] = []
+        self.options = options or IndexOptions()
+
+    def text(
+        self,
+        name: str,
+        weight: float = 1.0,
+        sortable: bool = False,
+        unf: bool = False,
+        no_stem: bool = False,
+        no_index: bool = False,
+        withsuffixtrie: bool = False,
+        phonetic: str | None = None,
+        as_name: str | None = None,
+    ) -> "SchemaBuilder":
+        """Add a TEXT field; ``unf`` keeps the sortable value unnormalized."""
+        schema_field = TextField(
+            name,
+            weight=weight,
+            no_stem=no_stem,
+            phonetic_matcher=phonetic,  # type: ignore[arg-type]  # redis-py defaults it to None
+            withsuffixtrie=withsuffixtrie,
+            sortable=sortable,
+            no_index=no_index,
+            as_name=as_name,
+        )
+        return self.add(_sortable(schema_field, unf))
+
+    def tag(
+        self,
+        name: str,
+        separator: str = ",",
+        case_sensitive: bool = False,
+        sortable: bool = False,
+        unf: bool = False,
+        no_index: bool = False,
+        withsuffixtrie: bool = False,
+        as_name: str | None = None,
+    ) -> "SchemaBuilder":
+        """Add a TAG field."""
+        schema_field = TagField(
+            name,
+            separator=separator,
+            case_sensitive=case_sensitive,
+            withsuffixtrie=withsuffixtrie,
+            sortable=sortable,
+            no_index=no_index,
+            as_name=as_name,
+        )
+        return self.add(_sortable(schema_field, unf))
+
+    def numeric(
+        self,
+        name: str,
+        sortable: bool = False,
+        no_index: bool = False,
+        as_name: str | None = None,
+    ) -> "SchemaBuilder":
+        """Add a NUMERIC field."""
+        return self.add(NumericField(name, sortable=sortable, no_index=no_index, as_name=as_name))
+
+    def add(self, schema_field: Field) -> "SchemaBuilder":
+        """Add a prebuilt field, such as a vector field."""
+        self.fields.append(schema_field)
+        return self
+
+    def with_options(self, **options: Any) -> "SchemaBuilder":
+        """Replace index options, e.g. ``with_options(no_offsets=True)``."""
+        if options.get("stopwords") is not None:
+            options["stopwords"] = tuple(options["stopwords"])
+        self.options = replace(self.options, **options)
+        return self
+
+    def build(self) -> tuple:
+        """Return the schema fields."""
+        return tuple(self.fields)
+
+
+def resolve_schema(
+    schema: "tuple | SchemaBuilder", options: IndexOptions | None = None
+) -> tuple[list[Field], IndexOptions]:
+    """Split a schema tuple or builder into fields and index options."""
+    if isinstance(schema, SchemaBuilder):
+        return list(schema.build()), options or schema.options
+    return list(schema), options or IndexOptions()
+
+
+def index_memory_components(info: dict[str, Any]) -> dict[str, int]:
+    """Bytes per FT.INFO memory field; fields missing or nan on this server are left out."""
+    components = {}
+    for name in INDEX_MEMORY_FIELDS:
+        size = parse_megabytes(info.get(name))
+        if size is not None:
+            components[name] = size
+    return components
+
+
+@dataclass
+class IndexMemoryEstimate:
+    """Index memory measured with FT.INFO over a sample of documents."""
+
+    num_docs: int
+    # Bytes per FT.INFO memory field
+    components: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        """Sum of the index memory components."""
+        return sum(self.components.values())
+
+    @property
+    def bytes_per_document(self) -> float:
+        """Average index memory per sampled document."""
+        return self.total_bytes / self.num_docs if self.num_docs else 0.0
+
+    def projected_bytes(self, num_docs: int) -> int:
+        """
+        Linear projection to ``num_docs`` documents.
+        Term dictionaries grow sublinearly, so this leans towards overestimating.
+        """
+        return round(self.bytes_per_document * num_docs)
+
+    @classmethod
+    def from_info(cls, info: dict[str, Any], num_docs: int) -> "IndexMemoryEstimate":
+        """Read the memory components of an FT.INFO reply."""
+        return cls(num_docs=num_docs, components=index_memory_components(info))
+
+
+# Strings of at most this many words and characters are categories (TAG)
+# when they repeat, at most TAG_MAX_DISTINCT_RATIO distinct values per document
+TAG_MAX_WORDS = 3
+TAG_MAX_LENGTH = 64
+TAG_MAX_DISTINCT_RATIO = 0.5
+TAG_SEPARATORS = (",", ";", "|")
+
+
+@dataclass
+class FieldProfile:
+    """Observed values of one hash field or JSONPath across sampled documents."""
+
+    name: str
+    alias: str | None = None
+    count: int = 0
+    values_seen: int = 0
+    numeric: int = 0
+    lists: int = 0
+    total_length: int = 0
+    max_length: int = 0
+    max_words: int = 0
+    separated: int = 0
+    # Values that are not text, such as vector blobs
+    binary: int = 0
+    separators_seen: set[str] = field(default_factory=set, repr=False)
+    distinct_values: set[Any] = field(default_factory=set, repr=False)
+
+    @property
+    def label(self) -> str:
+        """Name the field is queried by."""
+        return self.alias or self.name
+
+    @property
+    def distinct(self) -> int:
+        return len(self.distinct_values)
+
+    @property
+    def avg_length(self) -> float:
+        return self.total_length / self.values_seen if self.values_seen else 0.0
+
+    def add(self, value: Any) -> None:
+        """Record the value of one document (a scalar or, for JSON, a list of scalars)."""
+        self.count += 1
+        if isinstance(value, list):
+            self.lists += 1
+            for item in value:
+                self._add_scalar(item)
+        else:
+            self._add_scalar(value)
+
+    def _add_scalar(self, value: Any) -> None:
+        self.values_seen += 1
+        if isinstance(value, bytes):
+            self.binary += 1
+            self.max_length = max(self.max_length, len(value))
+            return
+        if isinstance(value, bool):
+            value = str(value).lower()
+        if isinstance(value, int | float) and math.isfinite(value):
+            self.numeric += 1
+            self.distinct_values.add(value)
+            return
+        value = str(value)
+        self.distinct_values.add(value)
+        # float() also accepts "nan" and "inf", which NUMERIC fields cannot index
+        with suppress(ValueError):
+            if math.isfinite(float(value)):
+                self.numeric += 1
+        self.total_length += len(value)
+        self.max_length = max(self.max_length, len(value))
+        self.max_words = max(self.max_words, len(value.split()))
+        self.separators_seen.update(sep for sep in TAG_SEPARATORS if sep in value)
+        parts = value.split(",")
+        if len(parts) > 1 and all(
+            0 < len(part) <= TAG_MAX_LENGTH and not any(c.isspace() for c in part) for part in parts
+        ):
+            self.separated += 1
+
+    def field_type(self) -> str:
+        """Cheapest field type that still answers the queries the values suggest."""
+        if self.values_seen and self.numeric == self.values_seen:
+            return "NUMERIC"
+        if self.lists or (self.separated and self.separated == self.values_seen):
+            return "TAG"
+        if self.max_words <= 1 and self.max_length <= TAG_MAX_LENGTH:
+            return "TAG"
+        repeated = self.distinct <= TAG_MAX_DISTINCT_RATIO * self.count
+        if repeated and self.max_words <= TAG_MAX_WORDS and self.max_length <= TAG_MAX_LENGTH:
+            return "TAG"
+        return "TEXT"
+
+    def separator(self) -> str:
+        """Tag separator: comma for comma-separated lists, else one the values never contain."""
+        if self.separated:
+            return ","
+        return next((sep for sep in TAG_SEPARATORS if sep not in self.separators_seen), ",")
+
+
+def _json_fields(value: Any, path: str = "$", alias: str = "") -> Iterator[tuple[str, str, Any]]:
+    """Yield ``(JSONPath, alias, value)`` for every scalar and scalar array in a document."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            step = f".{key}" if re.fullmatch(r"[A-Za-z_]\w*", key) else f'["{key}"]'
+            name = re.sub(r"\W", "_", key)
+            yield from _json_fields(item, path + step, f"{alias}_{name}" if alias else name)
+    elif isinstance(value, list):
+        # Arrays of objects are not profiled
+        if all(not isinstance(item, dict | list) for item in value):
+            yield f"{path}[*]", alias, value
+    elif value is not None:
+        yield path, alias, value
+
+
+@dataclass
+class SchemaProposal:
+    """Schema inferred from sampled documents, with the evidence behind each field."""
+
+    builder: SchemaBuilder
+    types: dict[str, str]
+    profiles: dict[str, FieldProfile]
+    sample_size: int
+    estimate: IndexMemoryEstimate | None = None
+    # Fields holding binary values (bytes), such as vectors, left out of the schema
+    binary_fields: list[str] = field(default_factory=list)
+
+    @property
+    def schema(self) -> tuple:
+        return self.builder.build()
+
+
+def infer_schema(
+    documents: Iterable[Any],
+    json_documents: bool = False,
+    fields: Iterable[str] | None = None,
+    full_text: Iterable[str] | None = None,
+    sortable: Iterable[str] = (),
+    phrase_queries: bool = True,
+    highlight: bool = True,
+) -> SchemaProposal:
+    """
+    Propose a schema for sampled hash mappings or, with ``json_documents``, JSON documents.
+    Fields with bytes values, such as vectors, are listed in ``binary_fields``
+    instead of being typed; add them with ``RedisSearchHelper.create_vector_field``.
+    Numeric values become NUMERIC, identifiers, categories and lists become TAG,
+    and only prose becomes TEXT. The observed query patterns narrow it further:
+    ``fields`` limits the schema to the fields that are queried, ``full_text``
+    names the fields searched by words (other prose is then a TAG if listed in
+    ``fields`` and left out otherwise), ``sortable`` the fields sorted on, and
+    without ``phrase_queries`` or ``highlight`` term offsets (NOOFFSETS) or
+    highlighting data (NOHL) are dropped.
+    """
+    profiles: dict[str, FieldProfile] = {}
+    sample_size = 0
+    for document in documents:
+        sample_size += 1
+        items = (
+            _json_fields(document)
+            if json_documents
+            else ((k, None, v) for k, v in document.items())
+        )
+        for name, alias, value in items:
+            profile = profiles.get(name)
+            if profile is None:
+                profile = profiles[name] = FieldProfile(name, alias)
+            profile.add(value)
+
+    queried = None if fields is None else set(fields)
+    text_fields = None if full_text is None else set(full_text)
+    sort_fields = set(sortable)
+    builder = SchemaBuilder(IndexOptions(no_offsets=not phrase_queries, no_highlight=not highlight))
+    types: dict[str, str] = {}
+    binary_fields = []
+    for profile in profiles.values():
+        label = profile.label
+        if queried is not None and label not in queried:
+            continue
+        if profile.binary:
+            binary_fields.append(label)
+            continue
+        field_type = profile.field_type()
+        if text_fields is not None:
+            if label in text_fields:
+                field_type = "TEXT"
+            elif field_type == "TEXT":
+                if queried is None:
+                    continue
+                field_type = "TAG"
+        sortable_field = label in sort_fields
+        if field_type == "NUMERIC":
+            builder.numeric(profile.name, sortable=sortable_field, as_name=profile.alias)
+        elif field_type == "TAG":
+            builder.tag(
+                profile.name,
+                separator=profile.separator(),
+                sortable=sortable_field,
+                as_name=profile.alias,
+            )
+        else:
+            builder.text(profile.name, sortable=sortable_field, as_name=profile.alias)
+        types[label] = field_type
+    return SchemaProposal(
+        builder=builder,
+        types=types,
+        profiles={profile.label: profile for profile in profiles.values()},
+        sample_size=sample_size,
+        binary_fields=binary_fields,
+    )
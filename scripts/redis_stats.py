@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Index statistics for RediSearch.
+Parses FT.INFO into typed records and samples them over time, next to the
+server's INFO memory section, so index growth and GC pressure can be graphed.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import redis
+
+from scripts.redis_replies import parse_number, parse_pairs
+from scripts.redis_schema import index_memory_components
+
+if TYPE_CHECKING:
+    from scripts.redis_client import RedisStackClient
+
+# INFO memory fields recorded by the sampler
+MEMORY_METRICS = ("used_memory", "used_memory_rss", "used_memory_peak", "mem_fragmentation_ratio")
+
+
+@dataclass(frozen=True)
+class GCStats:
+    """Garbage collector counters of one index."""
+
+    bytes_collected: int = 0
+    total_cycles: int = 0
+    total_ms_run: float = 0.0
+    average_cycle_time_ms: float = 0.0
+    last_run_time_ms: float = 0.0
+
+    @classmethod
+    def from_info(cls, value: Any) -> "GCStats":
+        stats = parse_pairs(value)
+        return cls(
+            bytes_collected=int(parse_number(stats.get("bytes_collected"))),
+            total_cycles=int(parse_number(stats.get("total_cycles"))),
+            total_ms_run=parse_number(stats.get("total_ms_run")),
+            average_cycle_time_ms=parse_number(stats.get("average_cycle_time_ms")),
+            last_run_time_ms=parse_number(stats.get("last_run_time_ms")),
+        )
+
+
+@dataclass(frozen=True)
+class CursorStats:
+    """Open aggregation cursors, for this index and across the server."""
+
+    index_total: int = 0
+    index_capacity: int = 0
+    global_total: int = 0
+    global_idle: int = 0
+
+    @classmethod
+    def from_info(cls, value: Any) -> "CursorStats":
+        stats = parse_pairs(value)
+        return cls(
+            index_total=int(parse_number(stats.get("index_total"))),
+            index_capacity=int(parse_number(stats.get("index_capacity"))),
+            global_total=int(parse_number(stats.get("global_total"))),
+            global_idle=int(parse_number(stats.get("global_idle"))),
+        )
+
+
+@dataclass(frozen=True)
+class IndexStats:
+    """Typed view of an FT.INFO reply; sizes are in bytes."""
+
+    index_name: str
+    num_docs: int
+    max_doc_id: int
+    num_terms: int
+    num_records: int
+    inverted_bytes: int
+    vector_index_bytes: int
+    offset_vectors_bytes: int
+    doc_table_bytes: int
+    sortable_values_bytes: int
+    key_table_bytes: int
+    text_overhead_bytes: int
+    tag_overhead_bytes: int
+    records_per_doc_avg: float
+    bytes_per_record_avg: float
+    indexing_failures: int
+    indexing: bool
+    percent_indexed: float
+    gc: GCStats
+    cursors: CursorStats
+    # Bytes per FT.INFO memory field, see redis_schema.INDEX_MEMORY_FIELDS
+    memory_components: dict[str, int] = field(default_factory=dict)
+    raw: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def total_memory_bytes(self) -> int:
+        """Index size in bytes, over every FT.INFO memory field."""
+        return sum(self.memory_components.values())
+
+    @classmethod
+    def from_info(cls, info: dict[str, Any]) -> "IndexStats":
+        """Parse an FT.INFO reply as returned by redis-py."""
+        components = index_memory_components(info)
+        return cls(
+            index_name=info.get("index_name", ""),
+            num_docs=int(parse_number(info.get("num_docs"))),
+            max_doc_id=int(parse_number(info.get("max_doc_id"))),
+            num_terms=int(parse_number(info.get("num_terms"))),
+            num_records=int(parse_number(info.get("num_records"))),
+            inverted_bytes=components.get("inverted_sz_mb", 0),
+            vector_index_bytes=components.get("vector_index_sz_mb", 0),
+            offset_vectors_bytes=components.get("offset_vectors_sz_mb", 0),
+            doc_table_bytes=components.get("doc_table_size_mb", 0),
+            sortable_values_bytes=components.get("sortable_values_size_mb", 0),
+            key_table_bytes=components.get("key_table_size_mb", 0),
+            text_overhead_bytes=components.get("text_overhead_sz_mb", 0),
+            tag_overhead_bytes=components.get("tag_overhead_sz_mb", 0),
+            records_per_doc_avg=parse_number(info.get("records_per_doc_avg")),
+            bytes_per_record_avg=parse_number(info.get("bytes_per_record_avg")),
+            indexing_failures=int(parse_number(info.get("hash_indexing_failures"))),
+            indexing=bool(parse_number(info.get("indexing"))),
+            percent_indexed=parse_number(info.get("percent_indexed", 1)),
+            gc=GCStats.from_info(info.get("gc_stats")),
+            cursors=CursorStats.from_info(info.get("cursor_stats")),
+            memory_components=components,
+            raw=info,
+        )
+
+    def metrics(self) -> dict[str, float]:
+        """Numeric metrics of the index, flattened for time series."""
+        return {
+            "num_docs": self.num_docs,
+            "num_terms": self.num_terms,
+            "num_records": self.num_records,
+            "total_memory_bytes": self.total_memory_bytes,
+            "inverted_bytes": self.inverted_bytes,
+            "vector_index_bytes": self.vector_index_bytes,
+            "offset_vectors_bytes": self.offset_vectors_bytes,
+            "doc_table_bytes": self.doc_table_bytes,
+            "indexing_failures": self.indexing_failures,
+            "percent_indexed": self.percent_indexed,
+            "gc_bytes_collected": self.gc.bytes_collected,
+            "gc_total_cycles": self.gc.total_cycles,
+            "gc_total_ms_run": self.gc.total_ms_run,
+            "cursors_open": self.cursors.index_total,
+        }
+
+
+@dataclass(frozen=True)
+class StatsSample:
+    """Index statistics and server memory at one point in time."""
+
+    timestamp: float
+    indexes: dict[str, IndexStats]
+    memory: dict[str, Any]
+
+    def row(self) -> dict[str, float]:
+        """Flat metrics, with index metrics named ``<index>.<metric>``."""
+        row = {"timestamp": self.timestamp}
+        for name in MEMORY_METRICS:
+            row[name] = parse_number(self.memory.get(name))
+        for index_name, stats in self.indexes.items():
+            for metric, value in stats.metrics().items():
+                row[f"{index_name}.{metric}"] = value
+        return row
+
+
+class IndexStatsSampler:
+    """
+    Record index statistics and INFO memory at a fixed interval.
+    Call ``sample()`` from your own scheduler, or ``start()`` a background
+    thread (also as a context manager). Only the last ``maxlen`` samples are kept.
+    """
+
+    def __init__(
+        self,
+        client: "RedisStackClient",
+        index_names: list[str],
+        interval: float = 10.0,
+        maxlen: int = 8640,
+    ):
+        self.client = client
+        self.index_names = list(index_names)
+        self.interval = interval
+        self.samples: deque[StatsSample] = deque(maxlen=maxlen)
+        self.last_error: redis.RedisError | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sample(self) -> StatsSample:
+        """Take and record one sample."""
+        sample = StatsSample(
+            timestamp=time.time(),
+            indexes={name: self.client.index_stats(name) for name in self.index_names},
+            memory=self.client.get_memory_info(),
+        )
+        self.samples.append(sample)
+        return sample
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except redis.RedisError as exc:
+                # Keep sampling through transient errors; the gap shows in the series
+                self.last_error = exc
+            self._stop.wait(self.interval)
+
+    def start(self) -> "IndexStatsSampler":
+        """Start sampling in a daemon thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Samples as one float array per metric, ready for plotting.
+        Metrics missing from a sample (e.g. an index created later) are nan.
+        """
+        rows = [sample.row() for sample in self.samples]
+        columns = dict.fromkeys(key for row in rows for key in row)
+        return {
+            column: np.array([row.get(column, np.nan) for row in rows], dtype=np.float64)
+            for column in columns
+        }
+
+    def __enter__(self) -> "IndexStatsSampler":
+        return self.start()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
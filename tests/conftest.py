@@ -1,12 +1,14 @@
 """Pytest configuration and shared fixtures."""
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 
+from scripts.redis_async_client import AsyncRedisStackClient
 from scripts.redis_client import RedisConfig, RedisStackClient
 
 
@@ -36,6 +38,16 @@ def redis_client(redis_config: RedisConfig) -> Generator[RedisStackClient, None,
     client.close()
 
 
+@pytest_asyncio.fixture
+async def async_redis_client(
+    redis_config: RedisConfig,
+) -> AsyncGenerator[AsyncRedisStackClient, None]:
+    """Create an async Redis client for testing."""
+    client = AsyncRedisStackClient(redis_config)
+    yield client
+    await client.close()
+
+
 @pytest.fixture
 def clean_redis(redis_client: RedisStackClient) -> Generator[RedisStackClient, None, None]:
     """Provide a clean Redis instance for each test."""
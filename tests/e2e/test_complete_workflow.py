@@ -1,7 +1,5 @@
 """End-to-end tests for complete Redis Stack workflows."""
 
-import time
-
 import pytest
 
 from scripts.redis_client import RedisSearchHelper, RedisStackClient
@@ -24,11 +22,8 @@ class TestCompleteWorkflow:
 
         yield
 
-        # Cleanup after test
-        redis_client.drop_search_index(self.index_name)
-        for i in range(1, 20):
-            redis_client.delete(f"{self.key_prefix}{i}")
-            redis_client.delete(f"{self.json_prefix}{i}")
+        # Cleanup after test, together with the indexed blog posts
+        redis_client.drop_search_index(self.index_name, delete_documents=True)
 
     def test_blog_platform_workflow(self, redis_client: RedisStackClient) -> None:
         """
@@ -171,9 +166,7 @@ class TestCompleteWorkflow:
 
         # Cleanup
         redis_client.delete(pref_key)
-        redis_client.drop_search_index(activity_index)
-        for i in range(1, 3):
-            redis_client.delete(f"{activity_prefix}{i}")
+        redis_client.drop_search_index(activity_index, delete_documents=True)
 
     def test_caching_and_search_workflow(self, redis_client: RedisStackClient) -> None:
         """
@@ -189,8 +182,8 @@ class TestCompleteWorkflow:
             "prod:3": '{"id": 3, "name": "Keyboard", "price": 79.99}',
         }
 
-        for key, value in products.items():
-            redis_client.set(key, value)
+        report = redis_client.set_many(products)
+        assert report.failures == []
 
         # Step 2: Create searchable product index
         schema = RedisSearchHelper.create_blog_schema()
@@ -219,8 +212,8 @@ class TestCompleteWorkflow:
         for i, prod in enumerate(searchable_products, start=1):
             redis_client.add_document(f"{product_prefix}{i}", prod)
 
-        # Allow index to update
-        time.sleep(0.1)
+        # Wait for the index to finish indexing
+        redis_client.wait_for_index(product_index, timeout=5)
 
         # Step 3: Search products
         results = redis_client.search(product_index, "laptop")
@@ -231,13 +224,12 @@ class TestCompleteWorkflow:
         assert results.total == 1
 
         # Step 4: Retrieve cached data
-        laptop_data = redis_client.get("prod:1")
+        laptop_data, mouse_data, missing = redis_client.get_many(["prod:1", "prod:2", "prod:404"])
         assert laptop_data is not None
         assert "Laptop" in laptop_data
+        assert "Mouse" in mouse_data
+        assert missing is None
 
         # Cleanup
-        for key in products:
-            redis_client.delete(key)
-        redis_client.drop_search_index(product_index)
-        for i in range(1, 3):
-            redis_client.delete(f"{product_prefix}{i}")
+        redis_client.delete_many(products)
+        redis_client.drop_search_index(product_index, delete_documents=True)
@@ -0,0 +1,57 @@
+"""Integration tests for AsyncRedisStackClient."""
+
+import pytest
+
+from scripts.redis_async_client import AsyncRedisStackClient
+from scripts.redis_client import RedisSearchHelper
+
+
+@pytest.mark.integration
+@pytest.mark.requires_redis
+class TestAsyncRedisStackClient:
+    """Test asyncio client operations against Redis Stack."""
+
+    @pytest.mark.asyncio
+    async def test_ping_and_version(self, async_redis_client: AsyncRedisStackClient) -> None:
+        """Test async ping and server version lookup."""
+        assert await async_redis_client.ping() is True
+        assert await async_redis_client.get_version() != "unknown"
+        assert await async_redis_client.has_module("search") is True
+
+    @pytest.mark.asyncio
+    async def test_set_get_delete(self, async_redis_client: AsyncRedisStackClient) -> None:
+        """Test async key-value operations."""
+        key = "test:async:set_get"
+        assert await async_redis_client.set(key, "value") is True
+        assert await async_redis_client.get(key) == "value"
+        assert await async_redis_client.delete(key) == 1
+        assert await async_redis_client.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_search(self, async_redis_client: AsyncRedisStackClient) -> None:
+        """Test async index creation, document add and search."""
+        index_name = "test-async-blog-idx"
+        doc_key = "test:async:blog:1"
+        await async_redis_client.drop_search_index(index_name)
+        try:
+            schema = RedisSearchHelper.create_blog_schema()
+            await async_redis_client.create_search_index(index_name, "test:async:blog:", schema)
+            await async_redis_client.add_document(
+                doc_key, RedisSearchHelper.create_sample_blog_post()
+            )
+
+            results = await async_redis_client.search(index_name, "Redis")
+            assert results.total == 1
+            assert results.docs[0].id == doc_key
+        finally:
+            await async_redis_client.drop_search_index(index_name)
+            await async_redis_client.delete(doc_key)
+
+    @pytest.mark.asyncio
+    async def test_json_set_get(self, async_redis_client: AsyncRedisStackClient) -> None:
+        """Test async RedisJSON operations."""
+        key = "test:async:json"
+        await async_redis_client.json_set(key, "$", {"name": "Ada", "tags": ["a"]})
+        assert (await async_redis_client.json_get(key))["name"] == "Ada"
+        assert await async_redis_client.json_get(key, "$.tags[0]") == ["a"]
+        await async_redis_client.delete(key)
@@ -93,6 +93,30 @@ class TestRedisBasicOperations:
         deleted_count = redis_client.delete("test:nonexistent")
         assert deleted_count == 0
 
+    def test_set_many_and_get_many(self, redis_client: RedisStackClient) -> None:
+        """Test batch set and get across several chunks."""
+        items = {f"test:batch:{i}": str(i) for i in range(10)}
+
+        report = redis_client.set_many(items, chunk_size=3)
+        assert report.total == 10
+        assert report.chunks == 4
+
+        keys = [*items, "test:batch:missing"]
+        assert redis_client.get_many(keys, chunk_size=4) == [*items.values(), None]
+
+        assert redis_client.delete_many(items, chunk_size=3) == 10
+        assert redis_client.get_many(items) == [None] * 10
+
+    def test_set_many_with_ttl(self, redis_client: RedisStackClient) -> None:
+        """Test batch set with an expiry on every key."""
+        keys = ["test:batch:ttl1", "test:batch:ttl2"]
+        redis_client.set_many(dict.fromkeys(keys, "value"), ttl=60)
+
+        for key in keys:
+            assert 0 < redis_client.client.ttl(key) <= 60
+
+        redis_client.delete_many(keys)
+
 
 @pytest.mark.integration
 @pytest.mark.requires_redis
@@ -1,8 +1,15 @@
 """Integration tests for RediSearch operations."""
 
+import numpy as np
 import pytest
+from redis.commands.search.field import NumericField, TagField, TextField
+from redis.commands.search.index_definition import IndexType
 
-from scripts.redis_client import RedisSearchHelper, RedisStackClient
+from scripts.redis_aggregate import Aggregation, Reducer
+from scripts.redis_cache import SearchResultCache
+from scripts.redis_client import RedisSearchHelper, RedisStackClient, vector_to_bytes
+from scripts.redis_query import NumericRange, Tag, Text
+from scripts.redis_schema import SchemaBuilder
 
 
 @pytest.mark.integration
@@ -21,11 +28,8 @@ class TestRediSearch:
 
         yield
 
-        # Cleanup after test
-        redis_client.drop_search_index(self.index_name)
-        # Clean up any test documents
-        for i in range(1, 10):
-            redis_client.delete(f"{self.key_prefix}{i}")
+        # Cleanup after test, together with the indexed test documents
+        redis_client.drop_search_index(self.index_name, delete_documents=True)
 
     def test_create_search_index(self, redis_client: RedisStackClient) -> None:
         """Test creating a search index."""
@@ -114,3 +118,454 @@ class TestRediSearch:
         results = redis_client.search(self.index_name, "nonexistent")
         assert results.total == 0
         assert len(results.docs) == 0
+
+    def test_add_documents_bulk(self, redis_client: RedisStackClient) -> None:
+        """Test chunked bulk ingestion from a generator."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+
+        documents = (
+            (f"{self.key_prefix}{i}", RedisSearchHelper.create_sample_blog_post())
+            for i in range(1, 10)
+        )
+        report = redis_client.add_documents(documents, chunk_size=4)
+
+        assert report.total == 9
+        assert report.chunks == 3
+        assert report.failures == []
+
+        results = redis_client.search(self.index_name, "Redis")
+        assert results.total == 9
+
+    def test_iter_search_streams_all_matches(self, redis_client: RedisStackClient) -> None:
+        """Test streaming every match through a small cursor page size."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+        redis_client.add_documents(
+            (f"{self.key_prefix}{i}", RedisSearchHelper.create_sample_blog_post())
+            for i in range(1, 10)
+        )
+
+        rows = list(redis_client.iter_search(self.index_name, "Redis", fields=["title"], count=2))
+
+        assert len(rows) == 9
+        assert {row["id"] for row in rows} == {f"{self.key_prefix}{i}" for i in range(1, 10)}
+        assert all(row["title"] == "Redis Stack Tutorial" for row in rows)
+
+    def test_search_projection_and_count(self, redis_client: RedisStackClient) -> None:
+        """Test RETURN, NOCONTENT, SORTBY and count-only search options."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+        for i in range(1, 4):
+            doc = RedisSearchHelper.create_sample_blog_post()
+            doc["doc_score"] = i / 10
+            redis_client.add_document(f"{self.key_prefix}{i}", doc)
+
+        results = redis_client.search(self.index_name, "Redis", return_fields=["title"])
+        assert results.total == 3
+        assert results.docs[0].title == "Redis Stack Tutorial"
+        assert not hasattr(results.docs[0], "content")
+
+        results = redis_client.search(self.index_name, "Redis", no_content=True)
+        assert {doc.id for doc in results.docs} == {f"{self.key_prefix}{i}" for i in range(1, 4)}
+
+        results = redis_client.search(
+            self.index_name, "Redis", sort_by="doc_score", ascending=False, num=1
+        )
+        assert [doc.id for doc in results.docs] == [f"{self.key_prefix}3"]
+
+        results = redis_client.search(self.index_name, "Redis", count_only=True)
+        assert results.total == 3
+        assert results.docs == []
+
+    def test_search_with_query_expression(self, redis_client: RedisStackClient) -> None:
+        """Test parameterized expressions against a live index."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+        redis_client.add_document(
+            f"{self.key_prefix}1",
+            {"title": "Redis Guide", "content": "c", "tags": "redis,db", "doc_score": 0.9},
+        )
+        redis_client.add_document(
+            f"{self.key_prefix}2",
+            {"title": "Python Guide", "content": "c", "tags": "python", "doc_score": 0.4},
+        )
+
+        results = redis_client.search(self.index_name, Text("guide", field="title"))
+        assert results.total == 2
+
+        results = redis_client.search(
+            self.index_name, Tag("tags", "redis") & NumericRange("doc_score", low=0.5)
+        )
+        assert [doc.id for doc in results.docs] == [f"{self.key_prefix}1"]
+
+        results = redis_client.search(self.index_name, ~Tag("tags", "redis"))
+        assert [doc.id for doc in results.docs] == [f"{self.key_prefix}2"]
+
+    def test_search_cache_invalidated_by_writes(self, redis_config) -> None:
+        """Test that cached results are refreshed after documents are added."""
+        cache = SearchResultCache(maxsize=16, ttl=60)
+        with RedisStackClient(redis_config, search_cache=cache) as client:
+            schema = RedisSearchHelper.create_blog_schema()
+            client.create_search_index(self.index_name, self.key_prefix, schema)
+            client.add_document(f"{self.key_prefix}1", RedisSearchHelper.create_sample_blog_post())
+
+            assert client.search(self.index_name, "Redis").total == 1
+            assert client.search(self.index_name, "Redis").total == 1
+            assert cache.hits == 1
+
+            client.add_document(f"{self.key_prefix}2", RedisSearchHelper.create_sample_blog_post())
+            assert client.search(self.index_name, "Redis").total == 2
+
+    def test_knn_search(self, redis_client: RedisStackClient) -> None:
+        """Test nearest-neighbour search on an HNSW vector field."""
+        schema = RedisSearchHelper.create_blog_vector_schema(dim=4)
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+        vectors = {1: [1.0, 0.0, 0.0, 0.0], 2: [0.0, 1.0, 0.0, 0.0], 3: [0.9, 0.1, 0.0, 0.0]}
+        for i, vector in vectors.items():
+            doc = RedisSearchHelper.create_sample_blog_post()
+            doc["embedding"] = vector_to_bytes(vector)
+            doc["tags"] = "near" if i != 2 else "far"
+            redis_client.add_document(f"{self.key_prefix}{i}", doc)
+
+        results = redis_client.knn_search(
+            self.index_name, np.array([1.0, 0.0, 0.0, 0.0]), k=2, return_fields=["title"]
+        )
+        assert [doc.id for doc in results.docs] == [f"{self.key_prefix}1", f"{self.key_prefix}3"]
+        assert float(results.docs[0].vector_score) == pytest.approx(0.0, abs=1e-6)
+
+        results = redis_client.knn_search(
+            self.index_name, [0.0, 1.0, 0.0, 0.0], k=3, filter=Tag("tags", "near")
+        )
+        assert {doc.id for doc in results.docs} == {f"{self.key_prefix}1", f"{self.key_prefix}3"}
+
+    def test_add_vectors_then_knn_search(self, redis_client: RedisStackClient) -> None:
+        """Test bulk vector ingestion from a matrix followed by KNN search."""
+        schema = RedisSearchHelper.create_blog_vector_schema(dim=3, algorithm="FLAT")
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+        matrix = np.eye(3, dtype=np.float32)
+        keys = [f"{self.key_prefix}{i}" for i in range(1, 4)]
+        metadata = [RedisSearchHelper.create_sample_blog_post() for _ in keys]
+
+        report = redis_client.add_vectors(keys, matrix, metadata=metadata, chunk_size=2)
+        assert report.total == 3
+        assert report.failures == []
+
+        results = redis_client.knn_search(self.index_name, matrix[1], k=1)
+        assert [doc.id for doc in results.docs] == [keys[1]]
+
+    def test_hybrid_search(self, redis_client: RedisStackClient) -> None:
+        """Test text, tag filter and vector clauses in a single query."""
+        schema = RedisSearchHelper.create_blog_vector_schema(dim=2)
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+        posts = [
+            ("Redis vectors", "redis", [1.0, 0.0]),
+            ("Redis streams", "redis", [0.0, 1.0]),
+            ("Python vectors", "python", [1.0, 0.1]),
+        ]
+        for i, (title, tags, vector) in enumerate(posts, start=1):
+            redis_client.add_document(
+                f"{self.key_prefix}{i}",
+                {
+                    "title": title,
+                    "content": "",
+                    "tags": tags,
+                    "doc_score": i,
+                    "embedding": vector_to_bytes(vector),
+                },
+            )
+
+        results = redis_client.hybrid_search(
+            self.index_name,
+            [1.0, 0.0],
+            k=2,
+            text="redis",
+            filter=Tag("tags", "redis"),
+            ef_runtime=20,
+        )
+        assert [doc.id for doc in results.docs] == [f"{self.key_prefix}1", f"{self.key_prefix}2"]
+
+        results = redis_client.hybrid_search(
+            self.index_name, [1.0, 0.0], text="vectors", mode="range", radius=0.1
+        )
+        assert {doc.id for doc in results.docs} == {f"{self.key_prefix}1", f"{self.key_prefix}3"}
+
+    def test_create_search_index_waits_for_existing_keys(
+        self, redis_client: RedisStackClient
+    ) -> None:
+        """Test that an index over existing keys is searchable once creation returns."""
+        redis_client.add_documents(
+            (f"{self.key_prefix}{i}", RedisSearchHelper.create_sample_blog_post())
+            for i in range(1, 10)
+        )
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+
+        info = redis_client.wait_for_index(self.index_name, timeout=1)
+        assert int(info["num_docs"]) == 9
+        assert redis_client.search(self.index_name, "Redis", count_only=True).total == 9
+
+    def test_reindex_behind_alias(self, redis_client: RedisStackClient) -> None:
+        """Test a blue/green schema change while searching through an alias."""
+        alias = "test-blog-alias"
+        try:
+            redis_client.add_documents(
+                (f"{self.key_prefix}{i}", RedisSearchHelper.create_sample_blog_post())
+                for i in range(1, 4)
+            )
+            first = redis_client.reindex(alias, (TextField("title"),), prefix=self.key_prefix)
+            assert first == f"{alias}-v1"
+            assert redis_client.search(alias, "Redis").total == 3
+
+            second = redis_client.reindex(alias, RedisSearchHelper.create_blog_schema())
+            assert second == f"{alias}-v2"
+            assert redis_client.search(alias, "@tags:{redis}").total == 3
+        finally:
+            redis_client.drop_search_index(f"{alias}-v1")
+            redis_client.drop_search_index(f"{alias}-v2")
+
+    def test_aggregate_group_by(self, redis_client: RedisStackClient) -> None:
+        """Test server-side grouping decoded into NumPy columns."""
+        schema = (TagField("tags"), NumericField("views", sortable=True))
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+        redis_client.add_documents(
+            (f"{self.key_prefix}{i}", {"tags": "even" if i % 2 == 0 else "odd", "views": i})
+            for i in range(10)
+        )
+
+        table = redis_client.aggregate(
+            self.index_name,
+            Aggregation().group_by("tags", Reducer.count(), Reducer.sum("views")).sort_by("tags"),
+        )
+
+        assert table["tags"].tolist() == ["even", "odd"]
+        assert table["count"].tolist() == [5.0, 5.0]
+        assert table["sum_views"].tolist() == [20.0, 25.0]
+        assert table.to_structured()["sum_views"].sum() == 45.0
+
+    def test_partial_index_filter_and_prefixes(self, redis_client: RedisStackClient) -> None:
+        """Test that only filtered documents under several prefixes are indexed."""
+        schema = (TextField("title"), TagField("status"))
+        pages_prefix = f"{self.key_prefix}page:"
+        redis_client.create_search_index(
+            self.index_name,
+            [f"{self.key_prefix}post:", pages_prefix],
+            schema,
+            filter="@status=='published'",
+            wait=True,
+        )
+        redis_client.add_documents(
+            [
+                (f"{self.key_prefix}post:1", {"title": "live", "status": "published"}),
+                (f"{self.key_prefix}post:2", {"title": "draft", "status": "draft"}),
+                (f"{pages_prefix}1", {"title": "about", "status": "published"}),
+            ]
+        )
+
+        results = redis_client.search(self.index_name, "*", return_fields=["title"])
+        assert results.total == 2
+        assert {doc.title for doc in results.docs} == {"live", "about"}
+        assert redis_client.index_stats(self.index_name).num_docs == 2
+        redis_client.delete(f"{self.key_prefix}post:2")
+
+    def test_purge_index(self, redis_client: RedisStackClient) -> None:
+        """Test deleting the documents matching a query through the index."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+        redis_client.add_documents(
+            (
+                f"{self.key_prefix}{i}",
+                {"title": "post", "tags": "old" if i < 30 else "new", "doc_score": i},
+            )
+            for i in range(40)
+        )
+
+        deleted = redis_client.purge_index(
+            self.index_name, "@tags:{old}", batch_size=7, chunk_size=3
+        )
+
+        assert deleted == 30
+        assert redis_client.search(self.index_name, "*", count_only=True).total == 10
+        assert redis_client.get_many([f"{self.key_prefix}0"]) == [None]
+
+    def test_drop_index_with_documents(self, redis_client: RedisStackClient) -> None:
+        """Test that dropping with delete_documents removes the indexed hashes."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+        redis_client.add_document(
+            f"{self.key_prefix}1", RedisSearchHelper.create_sample_blog_post()
+        )
+
+        redis_client.drop_search_index(self.index_name, delete_documents=True)
+
+        assert not redis_client.client.exists(f"{self.key_prefix}1")
+
+    def test_iter_pages_keyset(self, redis_client: RedisStackClient) -> None:
+        """Test that keyset pages cover every document once, ties included."""
+        schema = SchemaBuilder().text("title").numeric("doc_score", sortable=True)
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+        redis_client.add_documents(
+            (f"{self.key_prefix}{i:02d}", {"title": "post", "doc_score": i // 4}) for i in range(25)
+        )
+
+        pages = list(redis_client.iter_pages(self.index_name, "post", page_size=10, fields=[]))
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        ids = [row["id"] for page in pages for row in page]
+        assert ids == [f"{self.key_prefix}{i:02d}" for i in range(25)]
+
+    def test_iter_pages_defaults(self, redis_client: RedisStackClient) -> None:
+        """Test that the default match-all query pages the blog schema by doc_score."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+        for i in range(5):
+            doc = RedisSearchHelper.create_sample_blog_post()
+            doc["doc_score"] = (4 - i) / 10
+            redis_client.add_document(f"{self.key_prefix}{i}", doc)
+
+        pages = list(redis_client.iter_pages(self.index_name, page_size=2))
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        rows = [row for page in pages for row in page]
+        assert [row["id"] for row in rows] == [f"{self.key_prefix}{i}" for i in range(4, -1, -1)]
+        assert rows[0]["title"] == "Redis Stack Tutorial"
+
+    def test_search_records(self, redis_client: RedisStackClient) -> None:
+        """Test lazy records read as bytes over the raw client."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+        for i in range(3):
+            doc = RedisSearchHelper.create_sample_blog_post()
+            doc["doc_score"] = i / 10
+            redis_client.add_document(f"{self.key_prefix}{i}", doc)
+
+        result = redis_client.search_records(
+            self.index_name, Tag("tags", "redis"), sort_by="doc_score", ascending=False
+        )
+
+        assert result.total == 3
+        assert result.ids == [f"{self.key_prefix}{i}" for i in (2, 1, 0)]
+        assert result[0].title == "Redis Stack Tutorial"
+        assert result[0].raw("title") == b"Redis Stack Tutorial"
+        assert result.numeric("doc_score").tolist() == [0.2, 0.1, 0.0]
+        assert result.scores.dtype == np.float64
+
+        ids_only = redis_client.search_records(self.index_name, "Redis", no_content=True)
+        assert sorted(ids_only.ids) == [f"{self.key_prefix}{i}" for i in range(3)]
+
+    def test_federated_search(self, redis_client: RedisStackClient) -> None:
+        """Test that hits from several indexes are merged into one sorted page."""
+        schema = (TextField("title"), NumericField("views", sortable=True))
+        tenants = [f"{self.index_name}-t{i}" for i in range(3)]
+        try:
+            for i, tenant in enumerate(tenants):
+                redis_client.create_search_index(tenant, f"{tenant}:", schema, wait=True)
+                for j in range(2):
+                    redis_client.add_document(
+                        f"{tenant}:{j}", {"title": "post", "views": i * 10 + j}
+                    )
+
+            merged = redis_client.federated_search(
+                tenants, "post", offset=1, num=3, sort_by="views", ascending=False
+            )
+
+            assert merged.total == 6
+            assert [int(doc.views) for doc in merged.docs] == [20, 11, 10]
+            assert merged.sources == [tenants[2], tenants[1], tenants[1]]
+        finally:
+            for tenant in tenants:
+                redis_client.drop_search_index(tenant)
+                redis_client.delete_many(f"{tenant}:{j}" for j in range(2))
+
+    def test_profile_search(self, redis_client: RedisStackClient) -> None:
+        """Test that FT.PROFILE output is parsed into stages."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema, wait=True)
+        redis_client.add_document(
+            f"{self.key_prefix}1", RedisSearchHelper.create_sample_blog_post()
+        )
+
+        result, profile = redis_client.profile_search(self.index_name, "Redis @tags:{redis}")
+
+        assert result.total == 1
+        assert profile.iterators is not None
+        assert profile.processors
+        assert profile.slowest(1)
+
+    def test_infer_schema(self, redis_client: RedisStackClient) -> None:
+        """Test that a schema proposed from sampled hashes can index them."""
+        redis_client.add_documents(
+            (
+                f"{self.key_prefix}{i}",
+                {**RedisSearchHelper.create_sample_blog_post(), "title": f"Post {i} about Redis"},
+            )
+            for i in range(20)
+        )
+
+        proposal = redis_client.infer_schema(self.key_prefix, sample_size=10)
+
+        assert proposal.types == {
+            "title": "TEXT",
+            "content": "TEXT",
+            "tags": "TAG",
+            "doc_score": "NUMERIC",
+        }
+        assert proposal.estimate.total_bytes > 0
+        redis_client.create_search_index(
+            self.index_name, self.key_prefix, proposal.builder, wait=True
+        )
+        assert redis_client.search(self.index_name, "@tags:{python}", count_only=True).total == 20
+
+    def test_index_stats(self, redis_client: RedisStackClient) -> None:
+        """Test that FT.INFO is parsed into typed index statistics."""
+        schema = RedisSearchHelper.create_blog_schema()
+        redis_client.create_search_index(self.index_name, self.key_prefix, schema)
+        for i in range(3):
+            redis_client.add_document(
+                f"{self.key_prefix}{i}", RedisSearchHelper.create_sample_blog_post()
+            )
+
+        stats = redis_client.index_stats(self.index_name)
+        assert stats.index_name == self.index_name
+        assert stats.num_docs == 3
+        assert stats.total_memory_bytes > 0
+        assert stats.cursors.index_capacity > 0
+
+    def test_compare_index_memory(self, redis_client: RedisStackClient) -> None:
+        """Test that dropping term offsets shrinks the measured index."""
+        documents = [
+            {"title": f"Post {i}", "content": "redis stack search memory " * 20, "tags": "redis"}
+            for i in range(200)
+        ]
+        estimates = redis_client.compare_index_memory(
+            {
+                "default": RedisSearchHelper.blog_schema_builder(),
+                "no_offsets": RedisSearchHelper.blog_schema_builder().with_options(no_offsets=True),
+            },
+            documents,
+        )
+
+        assert estimates["default"].num_docs == 200
+        assert estimates["no_offsets"].total_bytes < estimates["default"].total_bytes
+        assert not redis_client.client.keys("scratch:*")
+
+    def test_json_index_search(self, redis_client: RedisStackClient) -> None:
+        """Test indexing RedisJSON documents and reading parsed results."""
+        schema = RedisSearchHelper.create_blog_json_schema()
+        redis_client.create_search_index(
+            self.index_name, self.key_prefix, schema, index_type=IndexType.JSON
+        )
+        post = {
+            "title": "Redis JSON",
+            "content": "Documents",
+            "tags": ["redis", "json"],
+            "doc_score": 0.7,
+        }
+        redis_client.json_set(f"{self.key_prefix}1", "$", post)
+
+        results = redis_client.search(self.index_name, "@tags:{json}")
+        assert results.total == 1
+        assert results.docs[0].json == post
+
+        results = redis_client.search(self.index_name, "Redis", return_fields=["title"])
+        assert results.docs[0].title == "Redis JSON"
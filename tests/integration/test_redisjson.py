@@ -133,3 +133,19 @@ class TestRedisJSON:
 
         # Cleanup
         redis_client.delete(key)
+
+    def test_json_set_many_and_get_many(self, redis_client: RedisStackClient) -> None:
+        """Test bulk JSON writes and reads across several chunks."""
+        users = {f"test:user:bulk:{i}": {"id": i, "name": f"user{i}"} for i in range(7)}
+
+        report = redis_client.json_set_many(users, chunk_size=3)
+        assert report.total == 7
+        assert report.failures == []
+
+        keys = [*users, "test:user:bulk:missing"]
+        assert redis_client.json_get_many(keys, chunk_size=2) == [*users.values(), None]
+        assert redis_client.json_get_many(users, path="$.name") == [
+            [user["name"]] for user in users.values()
+        ]
+
+        redis_client.delete_many(users)
@@ -0,0 +1,136 @@
+"""Unit tests for the FT.AGGREGATE builder and columnar decoding."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from scripts.redis_aggregate import AggregateTable, Aggregation, Reducer
+from scripts.redis_client import RedisConfig, RedisStackClient
+from scripts.redis_query import Tag
+
+
+@pytest.mark.unit
+class TestAggregation:
+    """Test the arguments built for FT.AGGREGATE pipelines."""
+
+    def test_pipeline_steps_in_order(self) -> None:
+        """Test LOAD, GROUPBY with reducers, APPLY, FILTER, SORTBY and LIMIT."""
+        aggregation = (
+            Aggregation("@title:redis")
+            .load("views")
+            .group_by(
+                "tags",
+                Reducer.count(),
+                Reducer.sum("views"),
+                Reducer.quantile("views", 0.95),
+                Reducer.tolist("@__key", alias="keys"),
+            )
+            .apply("@sum_views / @count", "avg_views")
+            .filter("@count > 1")
+            .sort_by(("count", False), "tags", max_results=10)
+            .limit(0, 5)
+        )
+
+        assert aggregation.build_args() == [
+            "@title:redis",
+            "LOAD", 1, "@views",
+            "GROUPBY", 1, "@tags",
+            "REDUCE", "COUNT", 0, "AS", "count",
+            "REDUCE", "SUM", 1, "@views", "AS", "sum_views",
+            "REDUCE", "QUANTILE", 2, "@views", 0.95, "AS", "quantile_views_95",
+            "REDUCE", "TOLIST", 1, "@__key", "AS", "keys",
+            "APPLY", "@sum_views / @count", "AS", "avg_views",
+            "FILTER", "@count > 1",
+            "SORTBY", 4, "@count", "DESC", "@tags", "ASC", "MAX", 10,
+            "LIMIT", 0, 5,
+            "DIALECT", 2,
+        ]  # fmt: skip
+
+    def test_expression_query_uses_params(self) -> None:
+        """Test that query expressions are sent with PARAMS."""
+        args = Aggregation(Tag("tags", "redis")).group_by([], Reducer.count()).build_args()
+        assert args[:3] == ["@tags:{$p0}", "GROUPBY", 0]
+        assert args[-6:] == ["PARAMS", 2, "p0", "redis", "DIALECT", 2]
+
+    def test_quantile_bounds(self) -> None:
+        """Test that quantiles outside [0, 1] are rejected."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            Reducer.quantile("views", 95)
+
+
+@pytest.mark.unit
+class TestAggregateTable:
+    """Test column-wise decoding of aggregate replies."""
+
+    def test_columns_are_typed(self) -> None:
+        """Test numeric, string and list columns."""
+        reply = [
+            2,
+            ["tags", "redis", "count", "3", "keys", ["a", "b"]],
+            ["tags", "python", "count", "1", "keys", ["c"]],
+        ]
+        table = AggregateTable.from_reply(reply)
+
+        assert len(table) == 2
+        assert table["count"].dtype == np.float64
+        assert table["count"].tolist() == [3.0, 1.0]
+        assert table["tags"].tolist() == ["redis", "python"]
+        assert table["keys"].dtype == object
+        assert table["keys"][0] == ["a", "b"]
+
+    def test_ragged_rows_and_dtypes(self) -> None:
+        """Test rows missing a field and explicit column dtypes."""
+        reply = [2, ["tags", "a", "views", "5"], ["tags", "b"]]
+        table = AggregateTable.from_reply(reply, dtypes={"tags": object})
+
+        assert np.isnan(table["views"][1])
+        assert table["tags"].dtype == object
+
+    def test_resp3_map_reply(self) -> None:
+        """Test that a RESP3 results map decodes like the RESP2 row list."""
+        reply = {
+            "attributes": [],
+            "format": "STRING",
+            "results": [
+                {"extra_attributes": {"tags": "redis", "count": "3"}, "values": []},
+                {"extra_attributes": {"tags": "python", "count": "1"}, "values": []},
+            ],
+            "total_results": 2,
+            "warning": [],
+        }
+        table = AggregateTable.from_reply(reply)
+
+        assert table.total == 2
+        assert table["count"].tolist() == [3.0, 1.0]
+        assert table["tags"].tolist() == ["redis", "python"]
+
+    def test_structured_array(self) -> None:
+        """Test conversion to a NumPy structured array."""
+        table = AggregateTable.from_reply([1, ["tags", "redis", "count", "3"]])
+        records = table.to_structured()
+
+        assert records.dtype.names == ("tags", "count")
+        assert records[0]["count"] == 3.0
+
+    def test_empty_reply(self) -> None:
+        """Test that a reply without rows decodes to an empty table."""
+        table = AggregateTable.from_reply([0])
+        assert len(table) == 0
+        assert table.to_structured().shape == (0,)
+
+    def test_client_aggregate(self) -> None:
+        """Test that the client sends the pipeline and decodes the reply."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.execute_command.return_value = [1, ["count", "7"]]
+
+        table = client.aggregate("idx", Aggregation().group_by([], Reducer.count()))
+
+        assert table["count"].tolist() == [7.0]
+        assert client._client.execute_command.call_args.args[:4] == (
+            "FT.AGGREGATE",
+            "idx",
+            "*",
+            "GROUPBY",
+        )
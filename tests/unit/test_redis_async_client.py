@@ -0,0 +1,141 @@
+"""Unit tests for AsyncRedisStackClient pooling and fan-out search."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.commands.search.result import Result
+
+from scripts.redis_async_client import (
+    AsyncRedisStackClient,
+    close_async_connection_pools,
+    get_async_connection_pool,
+)
+from scripts.redis_client import RedisConfig
+
+
+@pytest.mark.unit
+class TestAsyncConnectionPool:
+    """Test the per-event-loop async connection pool registry."""
+
+    @pytest.mark.asyncio
+    async def test_equal_configs_share_pool(self) -> None:
+        """Test that equal configurations share a pool on the same loop."""
+        pool1 = get_async_connection_pool(RedisConfig(host="h", port=1))
+        pool2 = get_async_connection_pool(RedisConfig(host="h", port=1))
+        assert pool1 is pool2
+        await close_async_connection_pools()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pool(self) -> None:
+        """Test that separate async clients are backed by one pool."""
+        client1 = AsyncRedisStackClient(RedisConfig(host="h", port=1, max_connections=3))
+        client2 = AsyncRedisStackClient(RedisConfig(host="h", port=1, max_connections=3))
+        assert client1.client.connection_pool is client2.client.connection_pool
+        pool = client1.client.connection_pool
+        assert pool.max_connections == 3
+        assert pool.connection_class(**pool.connection_kwargs).protocol == 2
+        await client1.close()
+        await client2.close()
+        await close_async_connection_pools()
+
+    @pytest.mark.asyncio
+    async def test_close_resets_client(self) -> None:
+        """Test that closing the client drops the underlying Redis object."""
+        async with AsyncRedisStackClient(RedisConfig(host="h", port=1)) as client:
+            assert client.client is not None
+        assert client._client is None
+        await close_async_connection_pools()
+
+
+@pytest.mark.unit
+class TestAsyncFederatedSearch:
+    """Test concurrent fan-out search on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_federated_search_gathers_indexes(self) -> None:
+        """Test that per-index results are gathered and merged by score."""
+        client = AsyncRedisStackClient(RedisConfig(host="h", port=1))
+        replies = {
+            "a": Result([1, "a:1", "0.2", []], hascontent=True, with_scores=True),
+            "b": Result([1, "b:1", "0.8", []], hascontent=True, with_scores=True),
+        }
+        client.search = AsyncMock(
+            side_effect=lambda index_name, *args, **kwargs: replies[index_name]
+        )
+
+        merged = await client.federated_search(["a", "b"], "*", num=2)
+
+        assert [doc.id for doc in merged.docs] == ["b:1", "a:1"]
+        assert merged.sources == ["b", "a"]
+
+
+@pytest.mark.unit
+class TestAsyncWaitForIndex:
+    """Test FT.INFO readiness polling on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_backs_off_until_indexed(self) -> None:
+        """Test that polling sleeps with a doubling delay until the index is ready."""
+        client = AsyncRedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.ft().info = AsyncMock(
+            side_effect=[{"indexing": "1"}] * 3 + [{"indexing": "0", "percent_indexed": "1"}]
+        )
+
+        with patch("scripts.redis_async_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            info = await client.wait_for_index("idx", initial_delay=0.1, max_delay=0.25)
+
+        assert info["percent_indexed"] == "1"
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.2, 0.25]
+
+    @pytest.mark.asyncio
+    async def test_create_search_index_can_wait(self) -> None:
+        """Test that create_search_index awaits readiness when asked."""
+        client = AsyncRedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.ft().create_index = AsyncMock()
+        client._client.ft().info = AsyncMock(return_value={"indexing": 0})
+
+        await client.create_search_index("idx", "doc:", (), wait=True)
+
+        client._client.ft().info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_times_out(self) -> None:
+        """Test that the timeout message matches the sync client's."""
+        client = AsyncRedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.ft().info = AsyncMock(
+            return_value={"indexing": "1", "percent_indexed": "0.5"}
+        )
+
+        with (
+            patch("scripts.redis_async_client.asyncio.sleep", new=AsyncMock()),
+            patch("scripts.redis_async_client.time.monotonic", side_effect=[0.0, 0.5, 2.0]),
+            pytest.raises(TimeoutError, match="50% indexed"),
+        ):
+            await client.wait_for_index("idx", timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_create_search_index_definition(self) -> None:
+        """Test that the async client sends the same FT.CREATE definition as the sync one."""
+        client = AsyncRedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.ft().create_index = AsyncMock()
+
+        await client.create_search_index(
+            "idx", ["post:", "page:"], (), filter="@views>0", skip_initial_scan=True
+        )
+
+        call_kwargs = client._client.ft().create_index.call_args.kwargs
+        assert call_kwargs["definition"].args == [
+            "ON",
+            "HASH",
+            "PREFIX",
+            2,
+            "post:",
+            "page:",
+            "FILTER",
+            "@views>0",
+        ]
+        assert call_kwargs["skip_initial_scan"] is True
@@ -0,0 +1,251 @@
+"""Unit tests for RedisStackClient bulk operations."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import redis
+
+from scripts.redis_client import ChunkReport, RedisConfig, RedisStackClient, _chunked
+
+
+def make_client(results: list[list[Any]]) -> tuple[RedisStackClient, list[MagicMock]]:
+    """Create a client whose pipelines return the given per-chunk results."""
+    client = RedisStackClient(RedisConfig(host="h", port=1))
+    pipes = []
+    for chunk_results in results:
+        pipe = MagicMock()
+        pipe.execute.return_value = chunk_results
+        pipes.append(pipe)
+    client._client = MagicMock()
+    client._client.pipeline.side_effect = pipes
+    return client, pipes
+
+
+@pytest.mark.unit
+class TestChunked:
+    """Test the chunking helper used by bulk operations."""
+
+    def test_chunks_generator_lazily(self) -> None:
+        """Test that a generator is consumed one chunk at a time."""
+        consumed = []
+
+        def items() -> Iterator[int]:
+            for i in range(5):
+                consumed.append(i)
+                yield i
+
+        chunks = _chunked(items(), 2)
+        assert next(chunks) == [0, 1]
+        assert consumed == [0, 1]
+        assert list(chunks) == [[2, 3], [4]]
+
+    def test_rejects_non_positive_size(self) -> None:
+        """Test that a zero chunk size is rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(_chunked([1], 0))
+
+
+@pytest.mark.unit
+class TestAddDocuments:
+    """Test chunked bulk document ingestion."""
+
+    def test_add_documents_uses_one_pipeline_per_chunk(self) -> None:
+        """Test that documents are streamed through non-transactional pipelines."""
+        client, pipes = make_client([[1, 1], [1]])
+        docs = ((f"doc:{i}", {"title": f"t{i}"}) for i in range(3))
+
+        report = client.add_documents(docs, chunk_size=2)
+
+        assert report.total == 3
+        assert report.chunks == 2
+        assert report.succeeded == 3
+        client._client.pipeline.assert_called_with(transaction=False)
+        pipes[0].hset.assert_any_call("doc:0", mapping={"title": "t0"})
+        pipes[1].hset.assert_called_once_with("doc:2", mapping={"title": "t2"})
+        pipes[0].execute.assert_called_once_with(raise_on_error=False)
+
+    def test_add_documents_reports_failures_per_chunk(self) -> None:
+        """Test that per-item errors are collected instead of aborting the load."""
+        error = redis.exceptions.ResponseError("WRONGTYPE")
+        client, _ = make_client([[1, error]])
+        chunk_reports: list[ChunkReport] = []
+
+        report = client.add_documents(
+            [("doc:1", {"a": 1}), ("doc:2", {"a": 2})], on_chunk=chunk_reports.append
+        )
+
+        assert report.succeeded == 1
+        assert report.failures == [("doc:2", error)]
+        assert len(chunk_reports) == 1
+        assert chunk_reports[0].size == 2
+        assert chunk_reports[0].failures == [("doc:2", error)]
+        assert chunk_reports[0].items_per_second > 0
+
+
+@pytest.mark.unit
+class TestBatchKeyValue:
+    """Test set_many, get_many and delete_many chunking."""
+
+    def test_set_many_without_ttl_uses_mset_per_chunk(self) -> None:
+        """Test that each chunk becomes a single MSET."""
+        client, pipes = make_client([[True], [True]])
+
+        report = client.set_many({"a": "1", "b": "2", "c": "3"}, chunk_size=2)
+
+        assert report.total == 3
+        assert report.chunks == 2
+        pipes[0].mset.assert_called_once_with({"a": "1", "b": "2"})
+        pipes[1].mset.assert_called_once_with({"c": "3"})
+        pipes[0].set.assert_not_called()
+
+    def test_set_many_with_per_key_ttl(self) -> None:
+        """Test that TTLs switch to pipelined SET with per-key expiry."""
+        client, pipes = make_client([[True, True]])
+
+        client.set_many([("a", "1"), ("b", "2")], ttl={"a": 60})
+
+        pipes[0].set.assert_any_call("a", "1", ex=60)
+        pipes[0].set.assert_any_call("b", "2", ex=None)
+        pipes[0].mset.assert_not_called()
+
+    def test_set_many_mset_failure_marks_whole_chunk(self) -> None:
+        """Test that a failed MSET reports every key in its chunk."""
+        error = redis.exceptions.ResponseError("OOM")
+        client, _ = make_client([[error]])
+
+        report = client.set_many({"a": "1", "b": "2"})
+
+        assert report.failures == [("a", error), ("b", error)]
+        assert report.succeeded == 0
+
+    def test_get_many_preserves_order_across_chunks(self) -> None:
+        """Test that values come back in key order with None for missing keys."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.mget.side_effect = [["1", None], ["3"]]
+
+        assert client.get_many(iter(["a", "b", "c"]), chunk_size=2) == ["1", None, "3"]
+        client._client.mget.assert_any_call(["a", "b"])
+        client._client.mget.assert_any_call(["c"])
+
+    def test_delete_many_unlinks_in_chunks(self) -> None:
+        """Test that keys are unlinked in bounded batches."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.unlink.side_effect = [2, 1]
+
+        assert client.delete_many(["a", "b", "c"], chunk_size=2) == 3
+        client._client.unlink.assert_any_call("a", "b")
+        client._client.unlink.assert_any_call("c")
+
+
+@pytest.mark.unit
+class TestBulkJSON:
+    """Test json_set_many and json_get_many."""
+
+    def test_json_set_many_uses_mset_when_supported(self) -> None:
+        """Test that each chunk becomes one JSON.MSET on RedisJSON 2.6+."""
+        client, pipes = make_client([[True], [True]])
+        client._client.module_list.return_value = [{"name": "ReJSON", "ver": 20609}]
+
+        report = client.json_set_many({"a": {"x": 1}, "b": {"x": 2}, "c": {"x": 3}}, chunk_size=2)
+
+        assert report.total == 3
+        pipes[0].json().mset.assert_called_once_with([("a", "$", {"x": 1}), ("b", "$", {"x": 2})])
+        pipes[1].json().mset.assert_called_once_with([("c", "$", {"x": 3})])
+
+    def test_json_set_many_falls_back_to_pipelined_set(self) -> None:
+        """Test the JSON.SET pipeline on servers without JSON.MSET."""
+        client, pipes = make_client([[True, True]])
+        client._client.module_list.return_value = [{"name": "ReJSON", "ver": 20407}]
+
+        client.json_set_many([("a", 1), ("b", 2)], path="$.n")
+
+        pipes[0].json().set.assert_any_call("a", "$.n", 1)
+        pipes[0].json().set.assert_any_call("b", "$.n", 2)
+        pipes[0].json().mset.assert_not_called()
+
+    def test_supports_json_mset_is_cached(self) -> None:
+        """Test that module detection runs only once per client."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.module_list.return_value = [{"name": "ReJSON", "ver": 20600}]
+
+        assert client.supports_json_mset() is True
+        assert client.supports_json_mset() is True
+        client._client.module_list.assert_called_once()
+
+    def test_json_get_many_chunks_mget(self) -> None:
+        """Test that JSON.MGET is issued per chunk and results keep key order."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        client._client.json().mget.side_effect = [[{"x": 1}, None], [{"x": 3}]]
+
+        assert client.json_get_many(["a", "b", "c"], chunk_size=2) == [{"x": 1}, None, {"x": 3}]
+        client._client.json().mget.assert_any_call(["a", "b"], ".")
+
+
+@pytest.mark.unit
+class TestAddVectors:
+    """Test batched vector ingestion from NumPy matrices."""
+
+    def test_hash_rows_are_zero_copy_memoryviews(self) -> None:
+        """Test that each row is sent as a slice of the matrix buffer."""
+        client, pipes = make_client([[1, 1], [1]])
+        matrix = np.arange(6, dtype=np.float32).reshape(3, 2)
+
+        report = client.add_vectors(
+            ["v:1", "v:2", "v:3"],
+            matrix,
+            metadata=[{"tag": "a"}, {"tag": "b"}, {"tag": "c"}],
+            chunk_size=2,
+        )
+
+        assert report.total == 3
+        mapping = pipes[1].hset.call_args.kwargs["mapping"]
+        assert mapping["tag"] == "c"
+        vector = mapping["embedding"]
+        assert isinstance(vector, memoryview)
+        assert vector.obj is not None
+        assert bytes(vector) == matrix[2].tobytes()
+
+    def test_float16_and_mismatched_keys(self) -> None:
+        """Test dtype inference and key count validation."""
+        client, pipes = make_client([[1]])
+        matrix = np.ones((1, 4), dtype=np.float16)
+
+        client.add_vectors(["v:1"], matrix)
+        assert len(pipes[0].hset.call_args.kwargs["mapping"]["embedding"]) == 8
+
+        with pytest.raises(ValueError, match="2 keys for 1 vectors"):
+            client.add_vectors(["v:1", "v:2"], matrix)
+        with pytest.raises(ValueError, match="2-D"):
+            client.add_vectors(["v:1"], np.ones(4, dtype=np.float32))
+
+    def test_float64_is_converted_once(self) -> None:
+        """Test that non-float32 input is packed as float32."""
+        client, pipes = make_client([[1]])
+        client.add_vectors(["v:1"], np.array([[0.5, 1.5]]))
+        vector = pipes[0].hset.call_args.kwargs["mapping"]["embedding"]
+        assert bytes(vector) == np.array([0.5, 1.5], dtype="<f4").tobytes()
+
+    def test_memory_mapped_npy_file(self, tmp_path: Path) -> None:
+        """Test loading vectors from a memory-mapped .npy file."""
+        path = tmp_path / "vectors.npy"
+        np.save(path, np.ones((2, 3), dtype=np.float32))
+        client, pipes = make_client([[1, 1]])
+
+        report = client.add_vectors(["v:1", "v:2"], path)
+
+        assert report.total == 2
+        assert pipes[0].hset.call_count == 2
+
+    def test_json_storage(self) -> None:
+        """Test that JSON storage writes float arrays with JSON.SET."""
+        client, pipes = make_client([[True]])
+        client.add_vectors(["v:1"], np.array([[1.0, 2.0]], dtype=np.float32), storage="json")
+        pipes[0].json().set.assert_called_once_with("v:1", "$", {"embedding": [1.0, 2.0]})
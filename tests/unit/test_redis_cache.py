@@ -0,0 +1,116 @@
+"""Unit tests for the search result cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from redis.commands.search.index_definition import IndexType
+
+from scripts.redis_cache import SearchResultCache
+from scripts.redis_client import RedisConfig, RedisStackClient
+
+
+@pytest.mark.unit
+class TestSearchResultCache:
+    """Test LRU, TTL and versioned invalidation behaviour."""
+
+    def test_hit_and_miss_counters(self) -> None:
+        """Test that lookups are counted."""
+        cache = SearchResultCache()
+        key = cache.make_key("idx", "q")
+        assert cache.get(key) is None
+        cache.put(key, "result")
+        assert cache.get(key) == "result"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.hit_rate == 0.5
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache = SearchResultCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self) -> None:
+        """Test that entries expire after the TTL."""
+        cache = SearchResultCache(ttl=1.0)
+        with patch("scripts.redis_cache.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch("scripts.redis_cache.time.monotonic", return_value=100.5):
+            assert cache.get("a") == 1
+        with patch("scripts.redis_cache.time.monotonic", return_value=101.5):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_index_changes_keys(self) -> None:
+        """Test that invalidating one index leaves other indexes cached."""
+        cache = SearchResultCache()
+        key_a = cache.make_key("a", "q")
+        key_b = cache.make_key("b", "q")
+        cache.invalidate("a")
+        assert cache.make_key("a", "q") != key_a
+        assert cache.make_key("b", "q") == key_b
+        cache.invalidate()
+        assert cache.make_key("b", "q") != key_b
+
+
+@pytest.mark.unit
+class TestClientSearchCache:
+    """Test the cache layer around RedisStackClient.search."""
+
+    @pytest.fixture
+    def client(self) -> RedisStackClient:
+        """Client with a mocked connection and an index on prefix ``doc:``."""
+        client = RedisStackClient(RedisConfig(host="h", port=1), search_cache=SearchResultCache())
+        client._client = MagicMock()
+        client._client.ft().info.return_value = {
+            "index_definition": ["key_type", "HASH", "prefixes", ["doc:"], "default_score", "1"]
+        }
+        client._client.ft().search.side_effect = lambda *args, **kwargs: MagicMock(docs=[])
+        return client
+
+    def test_repeated_search_is_served_from_cache(self, client: RedisStackClient) -> None:
+        """Test that equal queries hit the cache, ignoring whitespace differences."""
+        first = client.search("idx", "redis  python")
+        assert client.search("idx", " redis python ") is first
+        assert client.search("idx", "redis python", num=5) is not first
+        assert client.search_cache.hits == 1
+
+    def test_learns_prefixes_from_map_definition(self, client: RedisStackClient) -> None:
+        """Test an FT.INFO reply whose index_definition is a map, as parsed from RESP3."""
+        client._client.ft().info.return_value = {
+            "index_definition": {"key_type": "JSON", "prefixes": ["doc:"], "default_score": 1.0}
+        }
+        first = client.search("idx", "redis")
+        client.add_document("doc:1", {"title": "x"})
+        assert client.search("idx", "redis") is not first
+        assert client._index_key_types["idx"] == IndexType.JSON
+
+    def test_document_write_invalidates_matching_index(self, client: RedisStackClient) -> None:
+        """Test that writes under the index prefix invalidate its results."""
+        first = client.search("idx", "redis")
+        client.add_document("other:1", {"title": "x"})
+        assert client.search("idx", "redis") is first
+        client.add_document("doc:1", {"title": "x"})
+        assert client.search("idx", "redis") is not first
+
+    def test_bulk_write_and_drop_invalidate(self, client: RedisStackClient) -> None:
+        """Test invalidation from bulk ingestion and index drops."""
+        client._client.pipeline().execute.return_value = [1]
+        first = client.search("idx", "redis")
+        client.add_documents([("doc:2", {"title": "y"})])
+        second = client.search("idx", "redis")
+        assert second is not first
+        client.drop_search_index("idx")
+        assert client.search("idx", "redis") is not second
+
+    def test_missing_index_is_not_cached(self, client: RedisStackClient) -> None:
+        """Test that searches on unknown indexes bypass the cache."""
+        client._client.ft().info.side_effect = redis.exceptions.ResponseError("Unknown index")
+        client.search("missing", "redis")
+        assert len(client.search_cache) == 0
@@ -6,7 +6,12 @@ from unittest.mock import patch
 
 import pytest
 
-from scripts.redis_client import RedisConfig
+from scripts.redis_client import (
+    RedisConfig,
+    RedisStackClient,
+    close_connection_pools,
+    get_connection_pool,
+)
 
 
 @pytest.mark.unit
@@ -90,3 +95,75 @@ class TestRedisConfig:
             config = RedisConfig()
             assert isinstance(config.port, int)
             assert config.port == 6380
+
+    def test_pool_settings_defaults(self) -> None:
+        """Test default connection pool settings."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = RedisConfig()
+            assert config.max_connections == 50
+            assert config.pool_timeout == 20.0
+            assert config.socket_timeout is None
+            assert config.socket_connect_timeout is None
+            assert config.socket_keepalive is True
+
+    def test_pool_settings_from_env_vars(self) -> None:
+        """Test connection pool settings from environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "REDIS_MAX_CONNECTIONS": "8",
+                "REDIS_POOL_TIMEOUT": "1.5",
+                "REDIS_SOCKET_TIMEOUT": "2",
+                "REDIS_SOCKET_CONNECT_TIMEOUT": "0.5",
+                "REDIS_SOCKET_KEEPALIVE": "false",
+            },
+        ):
+            config = RedisConfig()
+            assert config.max_connections == 8
+            assert config.pool_timeout == 1.5
+            assert config.socket_timeout == 2.0
+            assert config.socket_connect_timeout == 0.5
+            assert config.socket_keepalive is False
+
+
+@pytest.mark.unit
+class TestConnectionPoolRegistry:
+    """Test the process-wide connection pool registry."""
+
+    @pytest.fixture(autouse=True)
+    def reset_pools(self) -> None:
+        """Start and finish each test with an empty registry."""
+        close_connection_pools()
+        yield
+        close_connection_pools()
+
+    def test_equal_configs_share_pool(self) -> None:
+        """Test that equal configurations resolve to the same pool."""
+        pool1 = get_connection_pool(RedisConfig(host="h", port=1, password="p"))
+        pool2 = get_connection_pool(RedisConfig(host="h", port=1, password="p"))
+        assert pool1 is pool2
+
+    def test_different_configs_use_separate_pools(self) -> None:
+        """Test that differing configurations get their own pools."""
+        pool1 = get_connection_pool(RedisConfig(host="h", port=1, max_connections=4))
+        pool2 = get_connection_pool(RedisConfig(host="h", port=1, max_connections=8))
+        assert pool1 is not pool2
+
+    def test_pool_uses_config_settings(self) -> None:
+        """Test that pool limits and socket options come from the configuration."""
+        config = RedisConfig(
+            host="h", port=1, max_connections=4, pool_timeout=0.25, socket_timeout=3
+        )
+        pool = get_connection_pool(config)
+        assert pool.max_connections == 4
+        assert pool.timeout == 0.25
+        assert pool.connection_kwargs["socket_timeout"] == 3.0
+        assert pool.connection_kwargs["decode_responses"] is True
+        assert pool.connection_class(**pool.connection_kwargs).protocol == 2
+
+    def test_clients_share_pool(self) -> None:
+        """Test that separate clients are backed by one pool."""
+        config = RedisConfig(host="h", port=1)
+        client1 = RedisStackClient(config)
+        client2 = RedisStackClient(RedisConfig(host="h", port=1))
+        assert client1.client.connection_pool is client2.client.connection_pool
@@ -18,6 +18,50 @@ class TestRedisSearchHelper:
         assert schema[2].name == "tags"
         assert schema[3].name == "doc_score"
 
+    def test_create_hnsw_vector_field(self) -> None:
+        """Test HNSW vector field arguments."""
+        field = RedisSearchHelper.create_vector_field(
+            "embedding", 384, dtype="FLOAT16", distance_metric="L2", m=16, ef_construction=200
+        )
+        args = field.redis_args()
+        assert args[:3] == ["embedding", "VECTOR", "HNSW"]
+        attributes = dict(zip(args[4::2], args[5::2], strict=True))
+        assert attributes == {
+            "TYPE": "FLOAT16",
+            "DIM": 384,
+            "DISTANCE_METRIC": "L2",
+            "M": 16,
+            "EF_CONSTRUCTION": 200,
+        }
+
+    def test_create_flat_vector_field_rejects_hnsw_params(self) -> None:
+        """Test validation of vector field options."""
+        field = RedisSearchHelper.create_vector_field("v", 8, algorithm="flat")
+        assert field.redis_args()[2] == "FLAT"
+        with pytest.raises(ValueError, match="HNSW"):
+            RedisSearchHelper.create_vector_field("v", 8, algorithm="FLAT", m=8)
+        with pytest.raises(ValueError, match="Vector type"):
+            RedisSearchHelper.create_vector_field("v", 8, dtype="INT8")
+        with pytest.raises(ValueError, match="Distance metric"):
+            RedisSearchHelper.create_vector_field("v", 8, distance_metric="HAMMING")
+
+    def test_create_blog_vector_schema(self) -> None:
+        """Test the blog schema extended with an embedding field."""
+        schema = RedisSearchHelper.create_blog_vector_schema(dim=4)
+        assert len(schema) == 5
+        assert schema[4].name == "embedding"
+
+    def test_create_blog_json_schema(self) -> None:
+        """Test JSONPath fields aliased to the blog field names."""
+        schema = RedisSearchHelper.create_blog_json_schema()
+        assert [field.name for field in schema] == [
+            "$.title",
+            "$.content",
+            "$.tags[*]",
+            "$.doc_score",
+        ]
+        assert [field.as_name for field in schema] == ["title", "content", "tags", "doc_score"]
+
     def test_create_sample_blog_post(self) -> None:
         """Test sample blog post creation."""
         post = RedisSearchHelper.create_sample_blog_post()
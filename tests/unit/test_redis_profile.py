@@ -0,0 +1,128 @@
+"""Unit tests for FT.PROFILE parsing and profile_search."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from redis.commands.search.profile_information import ProfileInformation
+from redis.commands.search.result import Result
+
+from scripts.redis_client import RedisConfig, RedisStackClient
+from scripts.redis_profile import SearchProfile, format_profile
+
+# RediSearch 2.x: a list of [key, value...] pairs, children trailing "Child iterators"
+PROFILE_V2 = [
+    ["Total profile time", "1.5"],
+    ["Parsing time", "0.1"],
+    ["Pipeline creation time", "0.05"],
+    [
+        "Iterators profile",
+        [
+            "Type",
+            "INTERSECT",
+            "Time",
+            "1.2",
+            "Counter",
+            2,
+            "Child iterators",
+            ["Type", "TEXT", "Term", "redis", "Time", "0.9", "Counter", 4, "Size", 4],
+            ["Type", "TAG", "Term", "db", "Time", "0.2", "Counter", 3, "Size", 3],
+        ],
+    ],
+    [
+        "Result processors profile",
+        ["Type", "Index", "Time", "1.25", "Counter", 2],
+        ["Type", "Scorer", "Time", "0.1", "Counter", 2],
+    ],
+]
+
+# Redis 8: per-shard flat key/value lists with nested children
+PROFILE_V8 = {
+    "Shards": [
+        [
+            "Total profile time",
+            "0.8",
+            "Parsing time",
+            "0.02",
+            "Pipeline creation time",
+            "0.01",
+            "Warning",
+            "None",
+            "Iterators profile",
+            [
+                "Type",
+                "UNION",
+                "Query type",
+                "UNION",
+                "Time",
+                "0.5",
+                "Counter",
+                1,
+                "Child iterators",
+                [["Type", "TEXT", "Term", "a", "Time", "0.3", "Counter", 1]],
+            ],
+            "Result processors profile",
+            [["Type", "Index", "Time", "0.6", "Counter", 1]],
+        ]
+    ],
+    "Coordinator": [],
+}
+
+
+@pytest.mark.unit
+class TestSearchProfile:
+    """Test normalization of FT.PROFILE replies."""
+
+    def test_parses_v2_profile(self) -> None:
+        """Test the pair-list format with trailing child iterators."""
+        profile = SearchProfile.from_info(PROFILE_V2)
+
+        assert profile.total_ms == 1.5
+        assert profile.iterators.type == "INTERSECT"
+        assert [child.label for child in profile.iterators.children] == ["TEXT redis", "TAG db"]
+        assert profile.iterators.children[0].size == 4
+        assert [p.type for p in profile.processors] == ["Index", "Scorer"]
+        assert profile.warning is None
+
+    def test_parses_v8_shard_profile(self) -> None:
+        """Test the per-shard flat format with nested child iterators."""
+        profile = SearchProfile.from_info(PROFILE_V8)
+
+        assert profile.total_ms == 0.8
+        assert profile.iterators.label == "UNION UNION"
+        assert profile.iterators.children[0].label == "TEXT a"
+        assert profile.processors[0].time_ms == 0.6
+
+    def test_slowest_stages(self) -> None:
+        """Test that stages are ranked by time and rendered by the CLI formatter."""
+        profile = SearchProfile.from_info(PROFILE_V2)
+
+        assert [name for name, _ in profile.slowest(3)] == [
+            "processor Index",
+            "iterator INTERSECT",
+            "iterator   TEXT redis",
+        ]
+        text = format_profile(profile, top=2)
+        assert text.splitlines()[0].startswith("Total 1.500 ms")
+        assert "processor Index" in text
+        assert "TAG db" not in text
+
+
+@pytest.mark.unit
+class TestProfileSearch:
+    """Test running searches under FT.PROFILE."""
+
+    def test_profile_search_bypasses_cache(self) -> None:
+        """Test that profile_search calls FT.PROFILE with the prepared query."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+        ft = client._client.ft.return_value
+        ft.profile.return_value = (Result([0], hascontent=True), ProfileInformation(PROFILE_V2))
+
+        result, profile = client.profile_search("idx", "@title:redis", num=5, limited=True)
+
+        assert result.total == 0
+        assert profile.total_ms == 1.5
+        query = ft.profile.call_args.args[0]
+        assert query.query_string() == "@title:redis"
+        assert ft.profile.call_args.kwargs["limited"] is True
+        ft.search.assert_not_called()
@@ -0,0 +1,111 @@
+"""Unit tests for the typed RediSearch query builder."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.redis_client import RedisConfig, RedisStackClient, prepare_search_query
+from scripts.redis_query import (
+    And,
+    GeoRadius,
+    MatchAll,
+    Not,
+    NumericRange,
+    Or,
+    QueryExpr,
+    Tag,
+    Text,
+)
+
+
+@pytest.mark.unit
+class TestQueryExpressions:
+    """Test rendering of query expressions to parameterized strings."""
+
+    def test_text_words_become_params(self) -> None:
+        """Test that each word of a text clause is passed as a parameter."""
+        shape, params = Text("redis stack", field="title").compile()
+        assert shape == "@title:($p0 $p1)"
+        assert params == {"p0": "redis", "p1": "stack"}
+
+    def test_user_input_is_not_spliced(self) -> None:
+        """Test that query syntax in values stays in PARAMS, not the query string."""
+        shape, params = Tag("tags", "a|b}").compile()
+        assert shape == "@tags:{$p0}"
+        assert params == {"p0": "a|b}"}
+
+    def test_numeric_range_open_bounds(self) -> None:
+        """Test that missing numeric bounds render as infinities."""
+        shape, params = NumericRange("doc_score", low=0.5).compile()
+        assert shape == "@doc_score:[$p0 +inf]"
+        assert params == {"p0": 0.5}
+
+    def test_geo_radius(self) -> None:
+        """Test geo radius rendering and unit validation."""
+        shape, params = GeoRadius("loc", 2.35, 48.85, 10, unit="mi").compile()
+        assert shape == "@loc:[$p0 $p1 $p2 mi]"
+        assert params == {"p0": 2.35, "p1": 48.85, "p2": 10}
+        with pytest.raises(ValueError, match="Geo unit"):
+            GeoRadius("loc", 0, 0, 1, unit="parsec")
+
+    def test_boolean_combinators(self) -> None:
+        """Test and/or/not composition with operators."""
+        expr = (Text("redis") | Tag("tags", "python", "go")) & ~NumericRange("doc_score", 0, 0.1)
+        shape, params = expr.compile()
+        assert shape == "(($p0 | @tags:{$p1 | $p2}) -@doc_score:[$p3 $p4])"
+        assert list(params.values()) == ["redis", "python", "go", 0, 0.1]
+        assert And(MatchAll()).compile() == ("(*)", {})
+        assert Or(Text("a"), Not(Text("b"))).compile()[0] == "($p0 | -$p1)"
+
+    def test_equal_shapes_render_identically(self) -> None:
+        """Test that different values with the same structure share a shape."""
+        assert Tag("tags", "x").compile()[0] == Tag("tags", "y").compile()[0]
+
+    def test_empty_clauses_rejected(self) -> None:
+        """Test validation of empty expressions."""
+        with pytest.raises(ValueError):
+            Text("   ")
+        with pytest.raises(ValueError):
+            Tag("tags")
+
+    def test_subclass_must_implement_render(self) -> None:
+        """Test that an expression without render fails when it is created."""
+
+        class Incomplete(QueryExpr):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()  # type: ignore[abstract]
+
+
+@pytest.mark.unit
+class TestCompiledQueryCache:
+    """Test reuse of compiled queries for expressions."""
+
+    def test_same_shape_reuses_compiled_query(self) -> None:
+        """Test that equal shapes and options return the cached Query object."""
+        query1, params1 = prepare_search_query(Tag("tags", "x"), return_fields=["title"])
+        query2, params2 = prepare_search_query(Tag("tags", "y"), return_fields=("title",))
+        assert query1 is query2
+        assert params1 == {"p0": "x"}
+        assert params2 == {"p0": "y"}
+        args = query1.get_args()
+        assert args[args.index("DIALECT") + 1] == 2
+
+    def test_raw_strings_are_not_cached(self) -> None:
+        """Test that raw query strings build a fresh Query without PARAMS."""
+        query1, params = prepare_search_query("redis")
+        query2, _ = prepare_search_query("redis")
+        assert query1 is not query2
+        assert params is None
+
+    def test_search_sends_params(self) -> None:
+        """Test that search passes expression values as query params."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._client = MagicMock()
+
+        client.search("idx", Text("redis", field="title"))
+
+        call = client._client.ft().search.call_args
+        assert call.args[0].query_string() == "@title:$p0"
+        assert call.kwargs["query_params"] == {"p0": "redis"}
@@ -0,0 +1,28 @@
+"""Unit tests for the shared reply parsers."""
+
+import pytest
+
+from scripts.redis_replies import MB, parse_megabytes, parse_number, parse_pairs
+
+
+@pytest.mark.unit
+class TestReplyParsers:
+    """Test number, size and key/value parsing."""
+
+    def test_parse_number(self) -> None:
+        """Test that numbers parse and missing or nan values count as 0."""
+        assert parse_number("1.5") == 1.5
+        assert parse_number(None) == 0.0
+        assert parse_number("nan") == 0.0
+
+    def test_parse_megabytes(self) -> None:
+        """Test that sizes convert to bytes and unknown sizes are None."""
+        assert parse_megabytes("0.5") == MB // 2
+        assert parse_megabytes("nan") is None
+        assert parse_megabytes(None) is None
+
+    def test_parse_pairs(self) -> None:
+        """Test that RESP2 pair lists and RESP3 maps give the same dict."""
+        assert parse_pairs(["a", 1, "b", 2]) == {"a": 1, "b": 2}
+        assert parse_pairs({"a": 1}) == {"a": 1}
+        assert parse_pairs(None) == {}
@@ -0,0 +1,110 @@
+"""Unit tests for lazy, array-backed search results."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from scripts.redis_client import RedisConfig, RedisStackClient
+from scripts.redis_query import Tag
+from scripts.redis_results import LazySearchResult, SearchRecord
+
+REPLY = [
+    5,
+    b"doc:1",
+    b"2.5",
+    [b"title", b"Redis", b"doc_score", b"0.8"],
+    b"doc:2",
+    b"1",
+    [b"title", b"Caf\xc3\xa9"],
+]
+
+
+@pytest.mark.unit
+class TestLazySearchResult:
+    """Test decoding on access and numeric columns."""
+
+    def test_records_decode_on_access(self) -> None:
+        """Test that ids and fields decode lazily and raw bytes stay available."""
+        result = LazySearchResult(REPLY)
+
+        assert result.total == 5
+        assert len(result) == 2
+        first, second = result
+        assert first.id == "doc:1"
+        assert first.title == "Redis"
+        assert second.title == "Café"
+        assert second.raw("title") == b"Caf\xc3\xa9"
+        assert second.get("doc_score", "n/a") == "n/a"
+        with pytest.raises(AttributeError):
+            _ = second.doc_score
+        assert result[-1].id == "doc:2"
+        assert result.ids == ["doc:1", "doc:2"]
+
+    def test_numeric_columns(self) -> None:
+        """Test that scores and numeric fields parse once into float arrays."""
+        result = LazySearchResult(REPLY)
+
+        assert result.scores.tolist() == [2.5, 1.0]
+        column = result.numeric("doc_score")
+        assert column[0] == 0.8
+        assert np.isnan(column[1])
+        assert result.numeric("doc_score") is column
+        assert result[0].score == 2.5
+
+    def test_no_content_and_empty_replies(self) -> None:
+        """Test replies without fields and without hits."""
+        result = LazySearchResult([2, b"doc:1", b"1", b"doc:2", b"0.5"], has_content=False)
+        assert result.ids == ["doc:1", "doc:2"]
+        assert result[1].raw("title") is None
+
+        empty = LazySearchResult([0])
+        assert len(empty) == 0
+        assert empty.scores.shape == (0,)
+        assert list(empty) == []
+
+    def test_resp3_map_reply(self) -> None:
+        """Test that a RESP3 map reply, with bytes keys, reads like the RESP2 list."""
+        reply = {
+            b"total_results": 5,
+            b"results": [
+                {
+                    b"id": b"doc:1",
+                    b"score": 2.5,
+                    b"extra_attributes": {b"title": b"Redis", b"doc_score": b"0.8"},
+                    b"values": [],
+                },
+                {b"id": b"doc:2", b"score": 1.0, b"extra_attributes": {b"title": b"Go"}},
+            ],
+        }
+        result = LazySearchResult(reply)
+
+        assert result.total == 5
+        assert result.ids == ["doc:1", "doc:2"]
+        assert result.scores.tolist() == [2.5, 1.0]
+        assert result[1].title == "Go"
+        assert result.numeric("doc_score")[0] == 0.8
+
+    def test_records_are_slotted(self) -> None:
+        """Test that records are compact views without a per-instance dict."""
+        record = LazySearchResult(REPLY)[0]
+        assert isinstance(record, SearchRecord)
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(IndexError):
+            LazySearchResult(REPLY)[2]
+
+    def test_search_records_uses_raw_client(self) -> None:
+        """Test that the query and PARAMS are sent over the bytes client."""
+        client = RedisStackClient(RedisConfig(host="h", port=1))
+        client._raw_client = MagicMock()
+        client._raw_client.execute_command.return_value = REPLY
+
+        result = client.search_records("idx", Tag("tags", "redis"), num=2)
+
+        assert result.ids == ["doc:1", "doc:2"]
+        args = client._raw_client.execute_command.call_args.args
+        assert args[:3] == ("FT.SEARCH", "idx", "@tags:{$p0}")
+        assert args[-4:] == ("PARAMS", 2, "p0", "redis")
+
+        client._raw_client.execute_command.return_value = [1, b"doc:1", b"1"]
+        assert client.search_records("idx", "*", return_fields=[]).ids == ["doc:1"]
@@ -0,0 +1,186 @@
+"""Unit tests for the RediSearch schema builder and memory estimates."""
+
+import pytest
+
+from scripts.redis_client import RedisSearchHelper
+from scripts.redis_schema import IndexMemoryEstimate, IndexOptions, SchemaBuilder, infer_schema
+
+
+@pytest.mark.unit
+class TestSchemaBuilder:
+    """Test the field and index options emitted by the builder."""
+
+    def test_text_field_options(self) -> None:
+        """Test that text tuning options map to FT.CREATE arguments."""
+        (field,) = (
+            SchemaBuilder()
+            .text("title", weight=2.0, sortable=True, unf=True, no_stem=True, withsuffixtrie=True)
+            .build()
+        )
+        assert field.redis_args() == [
+            "title",
+            "TEXT",
+            "WEIGHT",
+            2.0,
+            "NOSTEM",
+            "WITHSUFFIXTRIE",
+            "SORTABLE",
+            "UNF",
+        ]
+
+    def test_tag_and_numeric_fields(self) -> None:
+        """Test tag and numeric fields with aliases and NOINDEX."""
+        tag, numeric = (
+            SchemaBuilder()
+            .tag("$.tags[*]", as_name="tags", case_sensitive=True)
+            .numeric("views", sortable=True, no_index=True)
+            .build()
+        )
+        assert tag.redis_args() == [
+            "$.tags[*]",
+            "AS",
+            "tags",
+            "TAG",
+            "SEPARATOR",
+            ",",
+            "CASESENSITIVE",
+        ]
+        assert numeric.redis_args() == ["views", "NUMERIC", "NOINDEX", "SORTABLE"]
+
+    def test_unf_requires_sortable(self) -> None:
+        """Test that UNF on a non-sortable field is rejected."""
+        with pytest.raises(ValueError, match="UNF requires a sortable field"):
+            SchemaBuilder().text("title", unf=True)
+
+    def test_index_options(self) -> None:
+        """Test that index options become create_index keyword arguments."""
+        builder = SchemaBuilder().with_options(
+            no_offsets=True, no_freqs=True, stopwords=["a"], skip_initial_scan=True
+        )
+        assert builder.options == IndexOptions(
+            no_offsets=True, no_freqs=True, stopwords=("a",), skip_initial_scan=True
+        )
+        kwargs = builder.options.create_index_kwargs()
+        assert kwargs["no_term_offsets"] is True
+        assert kwargs["no_term_frequencies"] is True
+        assert kwargs["stopwords"] == ["a"]
+        assert kwargs["skip_initial_scan"] is True
+        assert kwargs["max_text_fields"] is False
+
+    def test_blog_schema(self) -> None:
+        """Test the blog schema fields; doc_score is sortable for keyset paging."""
+        args = [field.redis_args() for field in RedisSearchHelper.create_blog_schema()]
+        assert args == [
+            ["title", "TEXT", "WEIGHT", 5.0],
+            ["content", "TEXT", "WEIGHT", 1.0],
+            ["tags", "TAG", "SEPARATOR", ","],
+            ["doc_score", "NUMERIC", "SORTABLE"],
+        ]
+
+
+@pytest.mark.unit
+class TestIndexMemoryEstimate:
+    """Test reading memory components from FT.INFO."""
+
+    def test_from_info(self) -> None:
+        """Test MB components are converted to bytes and projected per document."""
+        info = {"inverted_sz_mb": "1", "doc_table_size_mb": "0.5", "vector_index_sz_mb": "nan"}
+        estimate = IndexMemoryEstimate.from_info(info, num_docs=1000)
+
+        assert estimate.components["inverted_sz_mb"] == 1024 * 1024
+        assert "vector_index_sz_mb" not in estimate.components
+        assert estimate.total_bytes == 1.5 * 1024 * 1024
+        assert estimate.projected_bytes(2000) == 3 * 1024 * 1024
+
+
+def blog_posts(n: int = 20) -> list[dict[str, str]]:
+    """Sample hash documents shaped like the blog schema."""
+    return [
+        {
+            "title": f"Post number {i}",
+            "content": f"Learn how to use Redis Stack with Python, part {i} of the series",
+            "tags": "redis,python" if i % 2 else "redis,tutorial",
+            "status": "published" if i % 3 else "draft",
+            "author_email": f"user{i}@example.com",
+            "doc_score": str(i / n),
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.unit
+class TestInferSchema:
+    """Test schema inference from sampled documents."""
+
+    def test_infers_cheapest_types(self) -> None:
+        """Test numeric, tag-list, category, identifier and prose fields."""
+        proposal = infer_schema(blog_posts())
+
+        assert proposal.sample_size == 20
+        assert proposal.types == {
+            "title": "TEXT",
+            "content": "TEXT",
+            "tags": "TAG",
+            "status": "TAG",
+            "author_email": "TAG",
+            "doc_score": "NUMERIC",
+        }
+        assert proposal.profiles["status"].distinct == 2
+        tags = next(field for field in proposal.schema if field.name == "tags")
+        assert tags.redis_args() == ["tags", "TAG", "SEPARATOR", ","]
+
+    def test_non_finite_strings_are_not_numeric(self) -> None:
+        """Test that words float() accepts, like "nan" and "inf", are not numbers."""
+        proposal = infer_schema([{"name": "Nan", "rank": "1"}, {"name": "inf", "rank": "2.5"}])
+        assert proposal.profiles["name"].field_type() != "NUMERIC"
+        assert proposal.types["rank"] == "NUMERIC"
+
+    def test_query_patterns_narrow_schema(self) -> None:
+        """Test that unqueried prose is dropped and sort/phrase options apply."""
+        proposal = infer_schema(
+            blog_posts(),
+            full_text=["content"],
+            sortable=["doc_score"],
+            phrase_queries=False,
+        )
+
+        assert "title" not in proposal.types
+        assert proposal.types["content"] == "TEXT"
+        score = next(field for field in proposal.schema if field.name == "doc_score")
+        assert score.redis_args() == ["doc_score", "NUMERIC", "SORTABLE"]
+        assert proposal.builder.options.no_offsets is True
+
+    def test_queried_fields_only(self) -> None:
+        """Test that listed non-full-text prose becomes an exact-match TAG."""
+        proposal = infer_schema(blog_posts(), fields=["title", "status"], full_text=[])
+        assert proposal.types == {"title": "TAG", "status": "TAG"}
+
+    def test_json_documents(self) -> None:
+        """Test JSONPaths, aliases for nested fields, and arrays as tags."""
+        documents = [
+            {
+                "name": f"User {i}",
+                "profile": {"age": 20 + i, "interests": ["Redis", "Python"]},
+                "history": [{"event": "login"}],
+                "active": i % 2 == 0,
+            }
+            for i in range(5)
+        ]
+        proposal = infer_schema(documents, json_documents=True)
+
+        assert proposal.types == {
+            "name": "TEXT",
+            "profile_age": "NUMERIC",
+            "profile_interests": "TAG",
+            "active": "TAG",
+        }
+        args = [field.redis_args()[:4] for field in proposal.schema]
+        assert ["$.profile.age", "AS", "profile_age", "NUMERIC"] in args
+        assert ["$.profile.interests[*]", "AS", "profile_interests", "TAG"] in args
+
+    def test_separator_avoids_value_characters(self) -> None:
+        """Test that category values containing commas get another separator."""
+        documents = [{"city": "Paris, FR"}, {"city": "Rome, IT"}] * 2
+        proposal = infer_schema(documents)
+        assert proposal.types == {"city": "TAG"}
+        assert proposal.profiles["city"].separator() == ";"
@@ -0,0 +1,830 @@
+"""Unit tests for RedisStackClient search options."""
+
+from unittest.mock import MagicMock, call, patch
+
+import numpy as np
+import pytest
+import redis
+from redis.commands.search.index_definition import IndexType
+from redis.commands.search.query import Query
+from redis.commands.search.result import Result
+
+from scripts.redis_client import (
+    RedisConfig,
+    RedisStackClient,
+    build_search_query,
+    merge_search_results,
+    prepare_search_query,
+    vector_to_bytes,
+)
+from scripts.redis_query import MatchAll, Tag
+from scripts.redis_schema import SchemaBuilder
+
+
+def make_client() -> RedisStackClient:
+    """Create a client with a mocked Redis connection."""
+    client = RedisStackClient(RedisConfig(host="h", port=1))
+    client._client = MagicMock()
+    return client
+
+
+@pytest.mark.unit
+class TestIterSearch:
+    """Test cursor-based streaming search."""
+
+    def test_iter_search_reads_cursor_until_exhausted(self) -> None:
+        """Test that rows are yielded across cursor reads and the id is exposed."""
+        client = make_client()
+        client._client.execute_command.side_effect = [
+            [[2, ["__key", "doc:1", "title", "a"]], 7],
+            [[0, ["__key", "doc:2", "title", "b"]], 0],
+        ]
+
+        rows = list(client.iter_search("idx", "@title:a|b", fields=["title"], count=1))
+
+        assert rows == [{"id": "doc:1", "title": "a"}, {"id": "doc:2", "title": "b"}]
+        first, second = client._client.execute_command.call_args_list
+        assert first == call(
+            "FT.AGGREGATE",
+            "idx",
+            "@title:a|b",
+            "LOAD",
+            "2",
+            "@__key",
+            "@title",
+            "WITHCURSOR",
+            "COUNT",
+            1,
+            "MAXIDLE",
+            300_000,
+            "DIALECT",
+            2,
+        )
+        assert second == call("FT.CURSOR", "READ", "idx", 7, "COUNT", 1)
+
+    def test_iter_search_reads_resp3_batches(self) -> None:
+        """Test that RESP3 map batches yield the same rows as RESP2 lists."""
+        client = make_client()
+        client._client.execute_command.side_effect = [
+            [
+                {
+                    "total_results": 2,
+                    "results": [{"extra_attributes": {"__key": "doc:1", "title": "a"}}],
+                },
+                7,
+            ],
+            [{"total_results": 2, "results": [{"extra_attributes": {"title": "b"}}]}, 0],
+        ]
+
+        rows = list(client.iter_search("idx", fields=["title"], count=1))
+
+        assert rows == [{"id": "doc:1", "title": "a"}, {"title": "b"}]
+
+    def test_iter_search_loads_all_fields_by_default(self) -> None:
+        """Test that LOAD * is used when no fields are given."""
+        client = make_client()
+        client._client.execute_command.return_value = [[1, ["title", "a"]], 0]
+
+        assert list(client.iter_search("idx")) == [{"title": "a"}]
+        args = client._client.execute_command.call_args.args
+        assert args[3:5] == ("LOAD", "*")
+
+    def test_iter_search_deletes_cursor_when_closed_early(self) -> None:
+        """Test that abandoning the generator frees the server-side cursor."""
+        client = make_client()
+        client._client.execute_command.return_value = [[5, ["title", "a"], ["title", "b"]], 9]
+
+        rows = client.iter_search("idx", count=2)
+        assert next(rows) == {"title": "a"}
+        rows.close()
+
+        client._client.execute_command.assert_called_with("FT.CURSOR", "DEL", "idx", 9)
+
+
+@pytest.mark.unit
+class TestBuildSearchQuery:
+    """Test search query construction options."""
+
+    def test_default_query_is_scored_first_page(self) -> None:
+        """Test that the default keeps the original scored query."""
+        args = build_search_query("Redis").get_args()
+        assert "WITHSCORES" in args
+        assert args[-3:] == ["LIMIT", 0, 10]
+
+    def test_return_fields_projection(self) -> None:
+        """Test that RETURN lists only the requested fields."""
+        args = build_search_query("Redis", return_fields=["title", "doc_score"]).get_args()
+        index = args.index("RETURN")
+        assert args[index : index + 4] == ["RETURN", 2, "title", "doc_score"]
+
+    def test_no_content_skips_return(self) -> None:
+        """Test that NOCONTENT wins over a projection."""
+        args = build_search_query("Redis", return_fields=["title"], no_content=True).get_args()
+        assert "NOCONTENT" in args
+        assert "RETURN" not in args
+
+    def test_empty_projection_returns_no_content(self) -> None:
+        """Test that an empty projection sends NOCONTENT rather than no RETURN at all."""
+        args = build_search_query("Redis", return_fields=[]).get_args()
+        assert "NOCONTENT" in args
+        assert "RETURN" not in args
+
+        query, _ = prepare_search_query(Tag("tags", "x"), return_fields=())
+        assert "NOCONTENT" in query.get_args()
+
+    def test_paging_and_sort(self) -> None:
+        """Test LIMIT offset/size and SORTBY direction."""
+        args = build_search_query(
+            "Redis", offset=20, num=5, sort_by="doc_score", ascending=False
+        ).get_args()
+        assert args[-3:] == ["LIMIT", 20, 5]
+        index = args.index("SORTBY")
+        assert args[index : index + 3] == ["SORTBY", "doc_score", "DESC"]
+
+    def test_count_only(self) -> None:
+        """Test that count-only mode fetches no documents."""
+        args = build_search_query("Redis", count_only=True).get_args()
+        assert "NOCONTENT" in args
+        assert "WITHSCORES" not in args
+        assert args[-3:] == ["LIMIT", 0, 0]
+
+    def test_search_passes_built_query(self) -> None:
+        """Test that search forwards its options to the built query."""
+        client = make_client()
+        client.search("idx", "Redis", count_only=True)
+
+        client._client.ft.assert_called_once_with("idx")
+        query = client._client.ft().search.call_args.args[0]
+        assert query.get_args()[-3:] == ["LIMIT", 0, 0]
+
+
+@pytest.mark.unit
+class TestKnnSearch:
+    """Test vector packing and KNN query construction."""
+
+    def test_vector_to_bytes_float32(self) -> None:
+        """Test that arrays and lists pack to little-endian float32 blobs."""
+        expected = np.array([1.0, 2.5], dtype="<f4").tobytes()
+        assert vector_to_bytes(np.array([1.0, 2.5])) == expected
+        assert vector_to_bytes([1.0, 2.5]) == expected
+        assert vector_to_bytes(expected) == expected
+
+    def test_vector_to_bytes_float16(self) -> None:
+        """Test half-precision packing and shape validation."""
+        assert len(vector_to_bytes([1.0, 2.0, 3.0], dtype="FLOAT16")) == 6
+        with pytest.raises(ValueError, match="1-D"):
+            vector_to_bytes(np.zeros((2, 2)))
+
+    def test_knn_search_query(self) -> None:
+        """Test the KNN query string, sort order and params."""
+        client = make_client()
+        client.knn_search("idx", [0.1, 0.2], k=3, filter=Tag("tags", "redis"))
+
+        query = client._client.ft().search.call_args.args[0]
+        params = client._client.ft().search.call_args.kwargs["query_params"]
+        assert query.query_string() == (
+            "(@tags:{$p0})=>[KNN $knn_k @embedding $knn_vector AS vector_score]"
+        )
+        args = query.get_args()
+        assert args[args.index("SORTBY") + 1] == "vector_score"
+        assert args[args.index("DIALECT") + 1] == 2
+        assert args[-3:] == ["LIMIT", 0, 3]
+        assert params["p0"] == "redis"
+        assert params["knn_k"] == 3
+        assert params["knn_vector"] == vector_to_bytes([0.1, 0.2])
+
+    def test_knn_search_returns_score_with_projection(self) -> None:
+        """Test that the distance is always part of a projection."""
+        client = make_client()
+        client.knn_search("idx", [0.1], return_fields=["title"])
+
+        args = client._client.ft().search.call_args.args[0].get_args()
+        index = args.index("RETURN")
+        assert args[index : index + 4] == ["RETURN", 2, "title", "vector_score"]
+
+
+@pytest.mark.unit
+class TestHybridSearch:
+    """Test combined text, filter and vector queries."""
+
+    def search_call(self, client: RedisStackClient) -> tuple[Query, dict]:
+        """Return the query args and params of the last search."""
+        call_args = client._client.ft().search.call_args
+        return call_args.args[0], call_args.kwargs["query_params"]
+
+    def test_knn_with_text_filter_and_ef_runtime(self) -> None:
+        """Test a pre-filtered KNN clause with EF_RUNTIME."""
+        client = make_client()
+        client.hybrid_search(
+            "idx",
+            [0.5],
+            k=5,
+            text="redis guide",
+            filter=Tag("tags", "db"),
+            ef_runtime=50,
+            sort_by="doc_score",
+            ascending=False,
+        )
+
+        query, params = self.search_call(client)
+        assert query.query_string() == (
+            "(($p0 $p1) @tags:{$p2})=>"
+            "[KNN $knn_k @embedding $knn_vector EF_RUNTIME $knn_ef_runtime AS vector_score]"
+        )
+        assert params["p0"] == "redis"
+        assert params["p2"] == "db"
+        assert params["knn_ef_runtime"] == 50
+        args = query.get_args()
+        assert args[args.index("SORTBY") : args.index("SORTBY") + 3] == [
+            "SORTBY",
+            "doc_score",
+            "DESC",
+        ]
+
+    def test_range_mode(self) -> None:
+        """Test a vector range clause intersected with a raw filter."""
+        client = make_client()
+        client.hybrid_search(
+            "idx", [0.5], k=20, filter="@doc_score:[0.5 1]", mode="range", radius=0.3
+        )
+
+        query, params = self.search_call(client)
+        assert query.query_string() == (
+            "(@doc_score:[0.5 1]) @embedding:[VECTOR_RANGE $knn_radius $knn_vector]"
+            "=>{$YIELD_DISTANCE_AS: vector_score}"
+        )
+        assert params["knn_radius"] == 0.3
+        assert "knn_k" not in params
+        assert query.get_args()[-3:] == ["LIMIT", 0, 20]
+
+    def test_invalid_options(self) -> None:
+        """Test validation of mode-specific options."""
+        client = make_client()
+        with pytest.raises(ValueError, match="Mode"):
+            client.hybrid_search("idx", [0.5], mode="exact")
+        with pytest.raises(ValueError, match="radius"):
+            client.hybrid_search("idx", [0.5], mode="range")
+        with pytest.raises(ValueError, match="EF_RUNTIME"):
+            client.hybrid_search("idx", [0.5], mode="range", radius=1, ef_runtime=10)
+
+
+@pytest.mark.unit
+class TestWaitForIndex:
+    """Test FT.INFO readiness polling."""
+
+    def test_returns_when_indexing_finished(self) -> None:
+        """Test that polling stops once the index reports 100%."""
+        client = make_client()
+        client._client.ft().info.side_effect = [
+            {"indexing": "1", "percent_indexed": "0.25"},
+            {"indexing": "1", "percent_indexed": "0.75"},
+            {"indexing": "0", "percent_indexed": "1", "hash_indexing_failures": "0"},
+        ]
+
+        with patch("scripts.redis_client.time.sleep") as sleep:
+            info = client.wait_for_index("idx", initial_delay=0.01)
+
+        assert info["percent_indexed"] == "1"
+        assert [c.args[0] for c in sleep.call_args_list] == [0.01, 0.02]
+
+    def test_backoff_is_capped(self) -> None:
+        """Test that the polling delay never exceeds max_delay."""
+        client = make_client()
+        client._client.ft().info.side_effect = [{"indexing": "1"}] * 4 + [{"indexing": "0"}]
+
+        with patch("scripts.redis_client.time.sleep") as sleep:
+            client.wait_for_index("idx", initial_delay=0.1, max_delay=0.25)
+
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.2, 0.25, 0.25]
+
+    def test_times_out(self) -> None:
+        """Test that a stuck index raises TimeoutError with its progress."""
+        client = make_client()
+        client._client.ft().info.return_value = {
+            "indexing": "1",
+            "percent_indexed": "0.5",
+            "hash_indexing_failures": "3",
+        }
+
+        with (
+            patch("scripts.redis_client.time.sleep"),
+            patch("scripts.redis_client.time.monotonic", side_effect=[0.0, 0.5, 2.0]),
+            pytest.raises(TimeoutError, match="50% indexed, 3 indexing failures"),
+        ):
+            client.wait_for_index("idx", timeout=1.0)
+
+    def test_create_search_index_can_wait(self) -> None:
+        """Test that create_search_index blocks until ready when asked."""
+        client = make_client()
+        client._client.ft().info.return_value = {"indexing": 0, "percent_indexed": 1}
+
+        client.create_search_index("idx", "doc:", (), wait=True)
+
+        client._client.ft().info.assert_called_once()
+
+
+@pytest.mark.unit
+class TestReindex:
+    """Test blue/green reindexing behind an alias."""
+
+    def make_indexes(self, client: RedisStackClient, alias_info: dict | None) -> dict:
+        """Route ft(name) to one mock per index name; the alias reports ``alias_info``."""
+        indexes: dict[str, MagicMock] = {}
+
+        def ft(name: str) -> MagicMock:
+            if name not in indexes:
+                indexes[name] = MagicMock()
+                indexes[name].info.return_value = {"indexing": 0, "percent_indexed": 1}
+            return indexes[name]
+
+        client._client.ft.side_effect = ft
+        if alias_info is None:
+            ft("blog").info.side_effect = redis.exceptions.ResponseError("Unknown index name")
+        else:
+            ft("blog").info.return_value = alias_info
+        return indexes
+
+    def test_reindex_bumps_version_and_repoints_alias(self) -> None:
+        """Test that a new version is built, aliased, and the old one dropped."""
+        client = make_client()
+        indexes = self.make_indexes(
+            client,
+            {
+                "index_name": "blog-v3",
+                "index_definition": ["key_type", "HASH", "prefixes", ["post:"]],
+            },
+        )
+
+        with patch("scripts.redis_client.threading.Thread") as thread:
+            new_index = client.reindex("blog", ())
+
+        assert new_index == "blog-v4"
+        definition = indexes["blog-v4"].create_index.call_args.kwargs["definition"]
+        assert definition.args[definition.args.index("PREFIX") + 2] == "post:"
+        indexes["blog-v4"].aliasupdate.assert_called_once_with("blog")
+        thread.assert_called_once_with(
+            target=client.drop_search_index, args=("blog-v3",), daemon=True
+        )
+
+    def test_reindex_keeps_partial_index_definition(self) -> None:
+        """Test that prefixes, FILTER and language settings carry over to the new index."""
+        client = make_client()
+        indexes = self.make_indexes(
+            client,
+            {
+                "index_name": "blog-v1",
+                "index_definition": [
+                    "key_type",
+                    "JSON",
+                    "prefixes",
+                    ["post:", "page:"],
+                    "filter",
+                    "@status=='published'",
+                    "default_language",
+                    "german",
+                    "default_score",
+                    "1",
+                ],
+            },
+        )
+
+        with patch("scripts.redis_client.threading.Thread"):
+            client.reindex("blog", ())
+
+        definition = indexes["blog-v2"].create_index.call_args.kwargs["definition"]
+        assert definition.args == [
+            "ON",
+            "JSON",
+            "PREFIX",
+            2,
+            "post:",
+            "page:",
+            "FILTER",
+            "@status=='published'",
+            "LANGUAGE",
+            "german",
+            "SCORE",
+            1.0,
+        ]
+
+    def test_reindex_rejects_skip_initial_scan(self) -> None:
+        """Test that a reindex cannot skip indexing the existing documents."""
+        client = make_client()
+        with pytest.raises(ValueError, match="skip_initial_scan"):
+            client.reindex("blog", SchemaBuilder().with_options(skip_initial_scan=True))
+
+    def test_first_reindex_requires_prefix(self) -> None:
+        """Test creating the first version for a new alias."""
+        client = make_client()
+        indexes = self.make_indexes(client, None)
+
+        with pytest.raises(ValueError, match="prefix is required"):
+            client.reindex("blog", ())
+        assert client.reindex("blog", (), prefix="post:") == "blog-v1"
+        indexes["blog-v1"].aliasupdate.assert_called_once_with("blog")
+
+    def test_reindex_timeout_keeps_old_index(self) -> None:
+        """Test that a timed-out build is discarded without touching the alias."""
+        client = make_client()
+        indexes = self.make_indexes(client, None)
+
+        with (
+            patch.object(client, "wait_for_index", side_effect=TimeoutError),
+            pytest.raises(TimeoutError),
+        ):
+            client.reindex("blog", (), prefix="post:")
+
+        indexes["blog-v1"].aliasupdate.assert_not_called()
+        assert indexes["blog-v1"].dropindex.call_count == 2
+
+    def test_reindex_rejects_index_name(self) -> None:
+        """Test that an index name passed as the alias is refused before building."""
+        client = make_client()
+        indexes = self.make_indexes(
+            client,
+            {"index_name": "blog", "index_definition": ["key_type", "HASH", "prefixes", ["p:"]]},
+        )
+
+        with pytest.raises(ValueError, match="not an alias"):
+            client.reindex("blog", ())
+        assert "blog-v1" not in indexes
+
+    def test_failed_alias_update_drops_new_index(self) -> None:
+        """Test that the new index is not orphaned when FT.ALIASUPDATE fails."""
+        client = make_client()
+        indexes = self.make_indexes(client, None)
+        client._client.ft("blog-v1").aliasupdate.side_effect = redis.exceptions.ResponseError(
+            "nope"
+        )
+
+        with pytest.raises(redis.exceptions.ResponseError):
+            client.reindex("blog", (), prefix="post:")
+
+        assert indexes["blog-v1"].dropindex.call_count == 2
+
+
+@pytest.mark.unit
+class TestPartialIndex:
+    """Test partial index definitions."""
+
+    def test_create_partial_index(self) -> None:
+        """Test multiple prefixes, FILTER, LANGUAGE/SCORE fields and SKIPINITIALSCAN."""
+        client = make_client()
+        client.create_search_index(
+            "idx",
+            ["post:", "page:"],
+            (),
+            filter="@status=='published'",
+            language_field="lang",
+            score_field="rank",
+            skip_initial_scan=True,
+        )
+
+        call_kwargs = client._client.ft().create_index.call_args.kwargs
+        assert call_kwargs["definition"].args == [
+            "ON",
+            "HASH",
+            "PREFIX",
+            2,
+            "post:",
+            "page:",
+            "FILTER",
+            "@status=='published'",
+            "LANGUAGE_FIELD",
+            "lang",
+            "SCORE_FIELD",
+            "rank",
+        ]
+        assert call_kwargs["skip_initial_scan"] is True
+        assert client._index_prefixes["idx"] == ("post:", "page:")
+
+
+@pytest.mark.unit
+class TestJSONIndexing:
+    """Test JSON index creation and parsed JSON results."""
+
+    def test_create_json_index(self) -> None:
+        """Test that the index definition targets JSON documents."""
+        client = make_client()
+        client.create_search_index("idx", "doc:", (), index_type=IndexType.JSON)
+
+        definition = client._client.ft().create_index.call_args.kwargs["definition"]
+        assert definition.args[:2] == ["ON", "JSON"]
+
+    def test_search_parses_json_documents(self) -> None:
+        """Test that whole JSON documents are parsed onto ``doc.json``."""
+        client = make_client()
+        client._client.ft().info.return_value = {
+            "index_definition": ["key_type", "JSON", "prefixes", ["doc:"]]
+        }
+        client._client.ft().search.return_value = Result(
+            [2, "doc:1", ["$", '{"title": "Redis", "tags": ["a"]}'], "doc:2", ["title", "Go"]],
+            hascontent=True,
+        )
+
+        result = client.search("idx", "*")
+
+        assert result.docs[0].json == {"title": "Redis", "tags": ["a"]}
+        assert not hasattr(result.docs[1], "json")
+
+    def test_hash_field_named_json_is_kept(self) -> None:
+        """Test that a hash field named ``json`` stays a string, even if it parses."""
+        client = make_client()
+        client.create_search_index("idx", "doc:", ())
+        client._client.ft().search.return_value = Result(
+            [1, "doc:1", ["json", '{"a": 1}']], hascontent=True
+        )
+
+        assert client.search("idx", "*").docs[0].json == '{"a": 1}'
+        client._client.ft().info.assert_not_called()
+
+
+@pytest.mark.unit
+class TestIndexMemory:
+    """Test index options and scratch-index memory estimates."""
+
+    def test_create_search_index_applies_builder_options(self) -> None:
+        """Test that a SchemaBuilder's index options reach FT.CREATE."""
+        client = make_client()
+        builder = SchemaBuilder().text("title").with_options(no_offsets=True)
+
+        client.create_search_index("idx", "doc:", builder)
+
+        kwargs = client._client.ft().create_index.call_args.kwargs
+        assert kwargs["no_term_offsets"] is True
+        assert client._client.ft().create_index.call_args.args[0] == list(builder.build())
+
+    def test_estimate_index_memory_cleans_up(self) -> None:
+        """Test that the scratch index and documents are removed after measuring."""
+        client = make_client()
+        ft = client._client.ft.return_value
+        ft.info.return_value = {"indexing": 0, "percent_indexed": 1, "inverted_sz_mb": "0.5"}
+
+        estimate = client.estimate_index_memory(
+            SchemaBuilder().text("title"), [{"title": "a"}, {"title": "b"}]
+        )
+
+        assert estimate.num_docs == 2
+        assert estimate.total_bytes == 512 * 1024
+        ft.dropindex.assert_called_once_with()
+        (unlink,) = client._client.unlink.call_args_list
+        assert len(unlink.args) == 2
+        assert all(key.startswith("scratch:") for key in unlink.args)
+
+    def test_estimate_index_memory_cleans_up_on_error(self) -> None:
+        """Test that a failed write still drops the scratch index."""
+        client = make_client()
+        client._client.pipeline.return_value.execute.side_effect = redis.ResponseError("oom")
+
+        with pytest.raises(redis.ResponseError):
+            client.estimate_index_memory(SchemaBuilder().text("title"), [{"title": "a"}])
+
+        client._client.ft.return_value.dropindex.assert_called_once_with()
+        client._client.unlink.assert_called_once()
+
+
+def scored_result(total: int, *hits: tuple[str, float, dict[str, str]]) -> Result:
+    """Build a WITHSCORES search result from ``(id, score, fields)`` hits."""
+    reply: list = [total]
+    for doc_id, score, fields in hits:
+        reply += [doc_id, str(score), [item for pair in fields.items() for item in pair]]
+    return Result(reply, hascontent=True, with_scores=True)
+
+
+@pytest.mark.unit
+class TestInferSchemaSampling:
+    """Test schema inference over documents sampled from a prefix."""
+
+    def test_infer_schema_samples_prefix(self) -> None:
+        """Test that sampled hashes are read as bytes in one pipeline and profiled."""
+        client = make_client()
+        client._raw_client = MagicMock()
+        client._client.scan_iter.return_value = iter(["doc:1", "doc:2", "doc:3"])
+        vector = np.array([0.5, -1.0], dtype=np.float32).tobytes()
+        client._raw_client.pipeline.return_value.execute.return_value = [
+            {b"title": b"Redis intro to search", b"views": b"10", b"embedding": vector},
+            {},
+            # An all-zero vector decodes as UTF-8 but is made of control characters
+            {b"title": b"Vector similarity search", b"views": b"3", b"embedding": bytes(8)},
+        ]
+
+        proposal = client.infer_schema("doc:", sample_size=2, measure=False)
+
+        assert client._client.scan_iter.call_args.kwargs == {
+            "match": "doc:*",
+            "count": 1000,
+            "_type": "hash",
+        }
+        assert client._raw_client.pipeline.return_value.hgetall.call_count == 2
+        assert proposal.sample_size == 2
+        assert proposal.types == {"title": "TEXT", "views": "NUMERIC"}
+        assert proposal.binary_fields == ["embedding"]
+        assert proposal.profiles["embedding"].max_length == 8
+        assert proposal.estimate is None
+
+
+@pytest.mark.unit
+class TestFederatedSearch:
+    """Test fan-out search across indexes and the merge of their hits."""
+
+    def test_merges_by_score_with_global_page(self) -> None:
+        """Test that hits are merged by score and paged globally."""
+        results = {
+            "a": scored_result(3, ("a:1", 0.9, {}), ("a:2", 0.5, {}), ("a:3", 0.1, {})),
+            "b": scored_result(2, ("b:1", 0.7, {}), ("b:2", 0.6, {})),
+        }
+
+        merged = merge_search_results(results, offset=1, num=3)
+
+        assert [doc.id for doc in merged.docs] == ["b:1", "b:2", "a:2"]
+        assert merged.sources == ["b", "b", "a"]
+        assert merged.total == 5
+        assert merged.totals == {"a": 3, "b": 2}
+
+    def test_merges_by_numeric_sort_field(self) -> None:
+        """Test that numeric sort values compare as numbers, missing values last."""
+        results = {
+            "a": scored_result(2, ("a:1", 1, {"views": "9"}), ("a:2", 1, {"views": "100"})),
+            "b": scored_result(2, ("b:1", 1, {"views": "50"}), ("b:2", 1, {})),
+        }
+
+        ascending = merge_search_results(results, num=4, sort_by="views")
+        assert [doc.id for doc in ascending.docs] == ["a:1", "b:1", "a:2", "b:2"]
+
+        descending_results = {
+            "a": scored_result(2, ("a:2", 1, {"views": "100"}), ("a:1", 1, {"views": "9"})),
+            "b": scored_result(2, ("b:1", 1, {"views": "50"}), ("b:2", 1, {})),
+        }
+        descending = merge_search_results(
+            descending_results, num=4, sort_by="views", ascending=False
+        )
+        assert [doc.id for doc in descending.docs] == ["a:2", "b:1", "a:1", "b:2"]
+
+    def test_merges_text_sort_field_case_insensitively(self) -> None:
+        """Test that string sort values compare case-folded, like the server's order."""
+        results = {
+            "a": scored_result(2, ("a:1", 1, {"title": "apple"}), ("a:2", 1, {"title": "Cherry"})),
+            "b": scored_result(2, ("b:1", 1, {"title": "Banana"}), ("b:2", 1, {"title": "date"})),
+        }
+
+        merged = merge_search_results(results, num=4, sort_by="title")
+
+        assert [doc.id for doc in merged.docs] == ["a:1", "b:1", "a:2", "b:2"]
+
+    def test_federated_search_queries_every_index(self) -> None:
+        """Test that each index is asked for offset + num hits, sort field included."""
+        client = make_client()
+        client._client.ft.return_value.search.return_value = scored_result(
+            1, ("doc:1", 1.0, {"title": "x", "views": "1"})
+        )
+
+        merged = client.federated_search(
+            ["t1", "t2", "t3"], "*", return_fields=["title"], offset=2, num=3, sort_by="views"
+        )
+
+        assert {c.args[0] for c in client._client.ft.call_args_list} == {"t1", "t2", "t3"}
+        query = client._client.ft.return_value.search.call_args.args[0]
+        args = query.get_args()
+        assert args[args.index("LIMIT") + 1 : args.index("LIMIT") + 3] == [0, 5]
+        assert "views" in args[args.index("RETURN") :]
+        assert merged.total == 3
+        assert len(merged.docs) == 1
+
+
+@pytest.mark.unit
+class TestIterPages:
+    """Test keyset pagination over a sortable field."""
+
+    def test_pages_continue_after_last_row(self) -> None:
+        """Test that later pages narrow by range and break ties on the key."""
+        client = make_client()
+        client._client.execute_command.side_effect = [
+            [3, ["__key", "doc:1", "doc_score", "0.5"], ["__key", "doc:2", "doc_score", "0.7"]],
+            [1, ["__key", "doc:3", "doc_score", "0.7"]],
+        ]
+
+        pages = list(client.iter_pages("idx", "redis", page_size=2, fields=[]))
+
+        assert [[row["id"] for row in page] for page in pages] == [["doc:1", "doc:2"], ["doc:3"]]
+        first, second = client._client.execute_command.call_args_list
+        assert first.args[2] == "(redis) @doc_score:[-inf +inf]"
+        assert "FILTER" not in first.args
+        assert first.args[first.args.index("SORTBY") :] == (
+            "SORTBY",
+            "4",
+            "@doc_score",
+            "ASC",
+            "@__key",
+            "ASC",
+            "MAX",
+            2,
+            "DIALECT",
+            2,
+        )
+        assert second.args[2] == "(redis) @doc_score:[0.7 +inf]"
+        assert second.args[second.args.index("FILTER") + 1] == (
+            '@doc_score > 0.7 || (@doc_score == 0.7 && @__key > "doc:2")'
+        )
+
+    def test_descending_expression_pages(self) -> None:
+        """Test descending order with a query expression resumed from a row."""
+        client = make_client()
+        client._client.execute_command.return_value = [0]
+
+        pages = list(
+            client.iter_pages(
+                "idx", Tag("tags", "redis"), ascending=False, fields=["title"], after=(5, "d")
+            )
+        )
+
+        assert pages == []
+        args = client._client.execute_command.call_args.args
+        assert args[2] == "(@tags:{$p0} @doc_score:[-inf $p1])"
+        assert args[args.index("SORTBY") + 3] == "DESC"
+        assert args[args.index("PARAMS") : args.index("PARAMS") + 6] == (
+            "PARAMS",
+            4,
+            "p0",
+            "redis",
+            "p1",
+            5,
+        )
+        assert args[args.index("MAX") + 2 : args.index("MAX") + 5] == ("LOAD", "1", "@title")
+        assert "@doc_score < 5.0 ||" in args[args.index("FILTER") + 1]
+
+    def test_reads_resp3_replies(self) -> None:
+        """Test that RESP3 map replies page like RESP2 lists."""
+        client = make_client()
+        client._client.execute_command.return_value = {
+            "total_results": 1,
+            "results": [{"extra_attributes": {"__key": "doc:1", "doc_score": "0.5"}}],
+        }
+
+        pages = list(client.iter_pages("idx", page_size=2, fields=[]))
+
+        assert pages == [[{"id": "doc:1", "doc_score": "0.5"}]]
+
+    def test_match_all_sends_range_alone(self) -> None:
+        """Test that a wildcard query is not wrapped in an intersection."""
+        client = make_client()
+        client._client.execute_command.return_value = [0]
+
+        list(client.iter_pages("idx"))
+        list(client.iter_pages("idx", MatchAll(), after=(1, "a")))
+
+        default, expression = client._client.execute_command.call_args_list
+        assert default.args[2] == "@doc_score:[-inf +inf]"
+        assert expression.args[2] == "@doc_score:[$p0 +inf]"
+
+
+@pytest.mark.unit
+class TestPurgeIndex:
+    """Test index-driven bulk deletes and index teardown."""
+
+    def test_purge_unlinks_cursor_batches(self) -> None:
+        """Test that keys read from the cursor are unlinked in pipelined chunks."""
+        client = make_client()
+        client._client.execute_command.side_effect = [
+            [[3, ["__key", "doc:1"], ["__key", "doc:2"], ["__key", "doc:3"]], 9],
+            [[0, ["__key", "doc:4"]], 0],
+        ]
+        pipe = client._client.pipeline.return_value
+        pipe.execute.side_effect = [[2, 1], [1]]
+
+        deleted = client.purge_index("idx", "@tags:{old}", batch_size=3, chunk_size=2)
+
+        assert deleted == 4
+        assert pipe.unlink.call_args_list == [
+            call("doc:1", "doc:2"),
+            call("doc:3"),
+            call("doc:4"),
+        ]
+        first = client._client.execute_command.call_args_list[0]
+        assert first.args[:6] == ("FT.AGGREGATE", "idx", "@tags:{old}", "LOAD", "1", "@__key")
+
+    def test_purge_rate_limit(self) -> None:
+        """Test that the purge sleeps to stay under the requested key rate."""
+        client = make_client()
+        client._client.execute_command.return_value = [
+            [2, ["__key", "doc:1"], ["__key", "doc:2"]],
+            0,
+        ]
+        client._client.pipeline.return_value.execute.return_value = [2]
+
+        with (
+            patch("scripts.redis_client.time.monotonic", side_effect=[100.0, 100.5]),
+            patch("scripts.redis_client.time.sleep") as sleep,
+        ):
+            client.purge_index("idx", max_keys_per_second=1)
+
+        sleep.assert_called_once_with(1.5)
+
+    def test_drop_with_documents_invalidates_cache(self) -> None:
+        """Test that FT.DROPINDEX DD is sent and every cached result is invalidated."""
+        client = make_client()
+        client.search_cache = MagicMock()
+
+        client.drop_search_index("idx", delete_documents=True)
+
+        client._client.ft.return_value.dropindex.assert_called_once_with(delete_documents=True)
+        client.search_cache.invalidate.assert_any_call()
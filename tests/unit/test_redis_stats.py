@@ -0,0 +1,100 @@
+"""Unit tests for index statistics and the stats sampler."""
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import redis
+
+from scripts.redis_client import RedisConfig, RedisStackClient
+from scripts.redis_stats import IndexStats, IndexStatsSampler
+
+FT_INFO = {
+    "index_name": "idx",
+    "num_docs": "3",
+    "max_doc_id": "4",
+    "num_terms": "10",
+    "num_records": "25",
+    "inverted_sz_mb": "1",
+    "vector_index_sz_mb": "0.5",
+    "offset_vectors_sz_mb": "nan",
+    "doc_table_size_mb": "0.25",
+    "hash_indexing_failures": "1",
+    "indexing": "0",
+    "percent_indexed": "1",
+    "gc_stats": ["bytes_collected", "2048", "total_ms_run", "12", "total_cycles", "3"],
+    "cursor_stats": ["global_idle", 0, "global_total", 2, "index_capacity", 128, "index_total", 1],
+}
+
+
+def make_client() -> RedisStackClient:
+    """Create a client with a mocked Redis connection."""
+    client = RedisStackClient(RedisConfig(host="h", port=1))
+    client._client = MagicMock()
+    client._client.ft.return_value.info.return_value = FT_INFO
+    client._client.info.return_value = {"used_memory": 1000, "mem_fragmentation_ratio": "1.5"}
+    return client
+
+
+@pytest.mark.unit
+class TestIndexStats:
+    """Test parsing of FT.INFO replies."""
+
+    def test_index_stats_parses_info(self) -> None:
+        """Test sizes, counters and nested GC and cursor stats."""
+        stats = make_client().index_stats("idx")
+
+        assert stats.num_docs == 3
+        assert stats.inverted_bytes == 1024 * 1024
+        assert stats.offset_vectors_bytes == 0
+        assert stats.total_memory_bytes == int(1.75 * 1024 * 1024)
+        assert stats.indexing_failures == 1
+        assert not stats.indexing
+        assert stats.gc.bytes_collected == 2048
+        assert stats.gc.total_cycles == 3
+        assert stats.cursors.index_total == 1
+        assert stats.cursors.global_total == 2
+
+    def test_missing_fields_default_to_zero(self) -> None:
+        """Test that fields absent on older servers do not break parsing."""
+        stats = IndexStats.from_info({"index_name": "idx", "num_docs": "1"})
+        assert stats.vector_index_bytes == 0
+        assert stats.gc.bytes_collected == 0
+        assert stats.percent_indexed == 1.0
+
+
+@pytest.mark.unit
+class TestIndexStatsSampler:
+    """Test recording statistics over time."""
+
+    def test_samples_become_arrays(self) -> None:
+        """Test that samples are flattened into one array per metric."""
+        sampler = IndexStatsSampler(make_client(), ["idx"])
+        sampler.sample()
+        sampler.sample()
+
+        arrays = sampler.to_arrays()
+        assert arrays["idx.num_docs"].tolist() == [3.0, 3.0]
+        assert arrays["used_memory"].tolist() == [1000.0, 1000.0]
+        assert arrays["mem_fragmentation_ratio"][0] == 1.5
+        assert np.all(np.diff(arrays["timestamp"]) >= 0)
+
+    def test_maxlen_bounds_history(self) -> None:
+        """Test that only the most recent samples are kept."""
+        sampler = IndexStatsSampler(make_client(), ["idx"], maxlen=2)
+        for _ in range(3):
+            sampler.sample()
+        assert len(sampler.samples) == 2
+
+    def test_background_thread_survives_errors(self) -> None:
+        """Test that a failing sample is recorded and sampling stops cleanly."""
+        client = make_client()
+        client._client.ft.return_value.info.side_effect = redis.ResponseError("Unknown index")
+
+        with IndexStatsSampler(client, ["idx"], interval=0.01) as sampler:
+            while sampler.last_error is None:
+                time.sleep(0.001)
+
+        assert isinstance(sampler.last_error, redis.ResponseError)
+        assert not sampler.samples